@@ -0,0 +1,90 @@
+"""
+Cached banner rendering vs the old per-call Figlet parse and per-character noise loop.
+
+    python benchmarks/bench_ascii.py --rounds 200
+
+Times one damaged banner for each title screen the game shows, without
+printing it. The first cached call pays for the font parse; later ones reuse
+the grid.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyfiglet import Figlet
+
+from utils.ascii_text import render_banner
+
+BANNERS = ["M A P", "I N V E N T O R Y", "RE : ZONE"]
+
+
+def render_old(text, font='doom', noise_level=0.03, erosion_level=0.01, crack_count=3):
+    """The previous utils.ascii, returning its rows instead of printing them."""
+    fig = Figlet(font=font)
+    raw = fig.renderText(text).splitlines()
+
+    noisy = []
+    noise_chars = ['#', '%', '@', '&', '?', '/', '\\', '|']
+    for line in raw:
+        new_line = []
+        for ch in line:
+            r = random.random()
+            if r < erosion_level:
+                new_line.append(' ')
+            elif r < erosion_level + noise_level:
+                new_line.append(random.choice(noise_chars))
+            else:
+                new_line.append(ch)
+        noisy.append(new_line)
+
+    height = len(noisy)
+    width = max(len(row) for row in noisy)
+    for row in noisy:
+        row.extend(' ' * (width - len(row)))
+
+    for _ in range(crack_count):
+        y = random.randrange(height)
+        x = random.randrange(width)
+        length = random.randint(3, max(3, width // 10))
+        direction = random.choice(['h', 'v', 'd1', 'd2'])
+        for i in range(length):
+            yy, xx = y, x
+            if direction == 'h':
+                xx = x + i
+            elif direction == 'v':
+                yy = y + i
+            elif direction == 'd1':
+                yy = y + i; xx = x + i
+            else:
+                yy = y + i; xx = x - i
+            if 0 <= yy < height and 0 <= xx < width:
+                noisy[yy][xx] = random.choice(['/', '\\', '|', '-'])
+    return ["".join(row) for row in noisy]
+
+
+def per_call(render, text, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        render(text)
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200, help="banners rendered per method")
+    args = parser.parse_args()
+
+    print(f"{'Banner':20} {'Old µs':>9} {'First µs':>9} {'Cached µs':>10} {'Speedup':>8}")
+    for text in BANNERS:
+        old = per_call(render_old, text, args.rounds)
+        first = per_call(render_banner, text, 1)
+        cached = per_call(render_banner, text, args.rounds)
+        print(f"{text:20} {old * 1e6:>9,.0f} {first * 1e6:>9,.0f} {cached * 1e6:>10,.1f} {old / cached:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
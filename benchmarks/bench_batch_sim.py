@@ -0,0 +1,51 @@
+"""
+Batch simulator vs BattleEngine: cross-check and throughput.
+
+    python benchmarks/bench_batch_sim.py --fights 20000
+
+Every lane of the batch must match the object engine fight with the same seed.
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.balance import build_player, get_location_manager, BOSS_INDEX
+from modules.batch_sim import simulate, run_reference, mismatched_lanes
+from modules.rng import BattleRNG
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fights", type=int, default=20000, help="fights per matchup for the batch run")
+    parser.add_argument("--check", type=int, default=500, help="fights per matchup run through BattleEngine")
+    parser.add_argument("--level", type=int, default=3)
+    parser.add_argument("--unlock", action="append", default=["Lunge", "Adrenaline", "Overclock"])
+    parser.add_argument("--locations", default="data/locations.json")
+    args = parser.parse_args()
+
+    manager = get_location_manager(args.locations)
+    print(f"{'Enemy':22} {'Batch fights/s':>15} {'Engine fights/s':>16} {'Speedup':>8} {'Mismatches':>11}")
+    for loc_id, location in manager.locations.items():
+        for index, enemy in [*enumerate(location.enemies), (BOSS_INDEX, location.boss)]:
+            player = build_player(args.level, args.unlock, BattleRNG(loc_id))
+
+            started = time.perf_counter()
+            simulate(player, enemy, range(args.fights))
+            batch_rate = args.fights / (time.perf_counter() - started)
+
+            seeds = range(args.check)
+            started = time.perf_counter()
+            reference = run_reference(lambda: copy.deepcopy(player), lambda: copy.deepcopy(enemy), seeds)
+            engine_rate = args.check / (time.perf_counter() - started)
+            mismatches = mismatched_lanes(simulate(player, enemy, seeds), reference)
+
+            print(f"{enemy.name:22} {batch_rate:>15,.0f} {engine_rate:>16,.0f} "
+                  f"{batch_rate / engine_rate:>7.1f}x {len(mismatches):>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Cost of saving and rolling back a mid-fight battle.
+
+    python benchmarks/bench_battle_state.py --fights 200 --turn 4
+
+Plays seeded fights with GreedyPolicy up to `turn`, then times a deepcopy of
+the live objects against BattleEngine.snapshot() and restore(). Each fight is
+also played to the end twice from the same snapshot to check that a restore
+reproduces the original outcome exactly.
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.balance import build_player, get_location_manager
+from modules.battle_engine import BattleEngine, GreedyPolicy
+from modules.rng import BattleRNG
+
+
+def play_turns(engine: BattleEngine, policy, turns: int) -> None:
+    while not engine.is_over and engine.turn_count < turns:
+        engine.begin_player_turn()
+        idx = policy.choose_card(engine)
+        if idx is None:
+            engine.surrender()
+            return
+        engine.play_card(idx)
+        engine.end_player_turn()
+        if engine.winner:
+            return
+        engine.enemy_turn()
+
+
+def finish(engine: BattleEngine, policy) -> tuple:
+    play_turns(engine, policy, engine.max_turns + 1)
+    result = engine.result()
+    return result.winner, result.turns, result.player_health, result.enemy_health, engine.rng.draws
+
+
+def timed(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fights", type=int, default=200)
+    parser.add_argument("--turn", type=int, default=4, help="turn at which the fight is saved")
+    parser.add_argument("--repeat", type=int, default=200, help="timing repetitions per fight")
+    args = parser.parse_args()
+
+    locations = get_location_manager("data/locations.json")
+    enemies = [enemy for loc in locations.locations.values() for enemy in loc.enemies]
+    policy = GreedyPolicy()
+
+    deepcopy_us = snapshot_us = restore_us = 0.0
+    mismatches = 0
+    for seed in range(args.fights):
+        rng = BattleRNG(seed)
+        engine = BattleEngine(build_player(1, (), BattleRNG(seed)), copy.deepcopy(enemies[seed % len(enemies)]), rng=rng)
+        play_turns(engine, policy, args.turn)
+
+        deepcopy_us += timed(lambda: copy.deepcopy((engine.player, engine.enemy, engine.damage_by_card)), args.repeat)
+        snapshot_us += timed(engine.snapshot, args.repeat)
+        state = engine.snapshot()
+        restore_us += timed(lambda: engine.restore(state), args.repeat)
+
+        first = finish(engine, policy)
+        engine.restore(state)
+        if finish(engine, policy) != first:
+            mismatches += 1
+
+    n = args.fights
+    print(f"deepcopy  {deepcopy_us / n:9.2f} us")
+    print(f"snapshot  {snapshot_us / n:9.2f} us")
+    print(f"restore   {restore_us / n:9.2f} us")
+    print(f"rollback mismatches: {mismatches}/{n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+FrameRenderer vs the old os.system('clear') for redrawing a battle screen.
+
+    python benchmarks/bench_clear.py --frames 200
+
+Each frame is a 20-row battle screen where only the HP rows change. The old
+clear spawns a shell and wipes the screen before every frame; the renderer
+writes the changed rows. Both write to /dev/null, so this measures the cost
+of producing a frame, not of the terminal drawing it.
+"""
+import argparse
+import io
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.clear_terminal import FrameRenderer
+
+
+def battle_screen(turn: int) -> str:
+    lines = ["=" * 50, f"⚔️  Turn {turn}", "=" * 50,
+             f"🧍 Player  HP {100 - turn % 50}/100  Energy {100 - turn % 90}/100",
+             f"👹 Raider  HP {50 - turn % 40}/50", "-" * 50]
+    lines += [f"{i}. Card {i} (Cost: {i * 3})" for i in range(1, 4)]
+    lines += [""] * 10
+    return "\n".join(lines) + "\nChoose a card number: "
+
+
+def run_shell(frames: int, out) -> float:
+    started = time.perf_counter()
+    for turn in range(frames):
+        subprocess.run("clear", shell=True, stdout=out, stderr=subprocess.DEVNULL, env={"TERM": "xterm"})
+        out.write(battle_screen(turn).encode())
+        out.flush()
+    return time.perf_counter() - started
+
+
+def run_renderer(frames: int, out) -> float:
+    renderer = FrameRenderer(io.TextIOWrapper(out, encoding="utf-8"), ansi=True)
+    started = time.perf_counter()
+    for turn in range(frames):
+        renderer.draw(battle_screen(turn))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200, help="frames drawn by each method")
+    args = parser.parse_args()
+
+    with open(os.devnull, "wb") as out:
+        shell = run_shell(args.frames, out)
+    with open(os.devnull, "wb") as out:
+        renderer = run_renderer(args.frames, out)
+
+    print(f"{'Method':22} {'Frames/s':>10} {'ms/frame':>9}")
+    print(f"{'os.system(clear)':22} {args.frames / shell:>10,.0f} {shell / args.frames * 1000:>9.3f}")
+    print(f"{'FrameRenderer':22} {args.frames / renderer:>10,.0f} {renderer / args.frames * 1000:>9.3f}")
+    print(f"\nSpeedup: {shell / renderer:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+DrawPile.deal vs the plain list scan Player.draw_cards used before, for 10, 100 and 1000 card decks.
+
+    python benchmarks/bench_draw_pile.py --rounds 10000 --repeat 5
+
+Each round draws a hand of 3 and discards it, reshuffling from the discard
+pile whenever the deck runs out. Every size is run with all names distinct,
+with 8 names and with 2 (the duplicate-heavy case, where the third draw of
+a hand finds nothing and the list scanned the whole deck). Both versions
+must draw the same cards. The best of --repeat runs is reported, since a
+single run is noisy.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cards import AttackCard
+from modules.draw_pile import DrawPile
+from modules.rng import BattleRNG
+
+
+def make_cards(size: int, names: int):
+    return [AttackCard(f"Card {i % names}", 1, 1, "Benchmark card.") for i in range(size)]
+
+
+def draw_list(deck, discard, hand, count, rng):
+    """The previous Player.draw_cards: linear scan and pop(i)."""
+    needed = count
+    existing = {c.name for c in hand}
+    while needed > 0 and (deck or discard):
+        if not deck:
+            deck = discard.copy()
+            discard.clear()
+            rng.shuffle(deck)
+        for i, card in enumerate(deck):
+            if card.name not in existing:
+                hand.append(deck.pop(i))
+                existing.add(card.name)
+                needed -= 1
+                break
+        else:
+            break
+    return deck
+
+
+def draw_pile(deck, discard, hand, count, rng):
+    deck.deal(hand, count, discard, rng)
+    return deck
+
+
+def run(draw, deck, rounds, seed):
+    rng = BattleRNG(seed)
+    discard, drawn = [], []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        hand = []
+        deck = draw(deck, discard, hand, 3, rng)
+        drawn.extend(card.name for card in hand)
+        discard.extend(hand)
+    return time.perf_counter() - started, drawn
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10000, help="hands drawn per deck size")
+    parser.add_argument("--names", type=int, action="append",
+                        help="distinct card names, repeatable (0: every card unique; default: 0, 8 and 2)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per method; the fastest counts")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Cards':>6} {'Names':>6} {'List draws/s':>14} {'DrawPile draws/s':>17} {'Speedup':>8} "
+          f"{'Same draws':>11}")
+    for size, names in [(size, names or size) for size in (10, 100, 1000) for names in args.names or (0, 8, 2)]:
+        cards = make_cards(size, names)
+        BattleRNG(args.seed).shuffle(cards)
+
+        list_runs, pile_runs = [], []
+        for _ in range(args.repeat):    # interleaved, so both see the same machine load
+            list_runs.append(run(draw_list, list(cards), args.rounds, args.seed))
+            pile_runs.append(run(draw_pile, DrawPile(cards), args.rounds, args.seed))
+        list_time, list_drawn = min(list_runs, key=lambda r: r[0])
+        pile_time, pile_drawn = min(pile_runs, key=lambda r: r[0])
+
+        draws = len(pile_drawn)
+        print(f"{size:>6} {names:>6} {draws / list_time:>14,.0f} {draws / pile_time:>17,.0f} "
+              f"{list_time / pile_time:>7.1f}x {str(list_drawn == pile_drawn):>11}")
+
+
+if __name__ == "__main__":
+    main()
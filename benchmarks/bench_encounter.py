@@ -0,0 +1,62 @@
+"""
+Turn scheduling cost in multi-enemy encounters.
+
+    python benchmarks/bench_encounter.py --sizes 10 100 1000
+
+For each horde size, times TurnScheduler.next() over mixed speeds, then one
+headless GreedyPolicy horde fight, and reports microseconds per turn. Both
+should grow with log(size), not size.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.balance import build_player
+from modules.battle_engine import GreedyPolicy
+from modules.encounter import EncounterEngine, TurnScheduler
+from modules.enemy import Raider
+from modules.rng import BattleRNG
+
+
+def horde(size: int):
+    return [Raider(f"Raider {i}", 5, 1, 0, 1, speed=5 + i % 10) for i in range(size)]
+
+
+class CountingScheduler(TurnScheduler):
+    turns = 0
+
+    def next(self):
+        self.turns += 1
+        return super().next()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--turns", type=int, default=50000, help="scheduler turns timed per size")
+    args = parser.parse_args()
+
+    print(f"{'Enemies':>8} {'next() us':>10} {'fight us/turn':>14} {'fight turns':>12}")
+    for size in args.sizes:
+        scheduler = TurnScheduler(horde(size))
+        started = time.perf_counter()
+        for _ in range(args.turns):
+            scheduler.next()
+        next_us = (time.perf_counter() - started) / args.turns * 1e6
+
+        player = build_player(3, (), BattleRNG(size))
+        player.max_energy = player.energy = 10 ** 6   # let the fight run its course
+        engine = EncounterEngine(player, horde(size), max_turns=10 ** 6, rng=BattleRNG(size))
+        engine.scheduler = CountingScheduler([player, *engine.enemies])
+        started = time.perf_counter()
+        engine.run(GreedyPolicy())
+        elapsed = time.perf_counter() - started
+        turns = engine.scheduler.turns
+        print(f"{size:>8} {next_us:>10.2f} {elapsed / turns * 1e6:>14.2f} {turns:>12}")
+
+
+if __name__ == "__main__":
+    main()
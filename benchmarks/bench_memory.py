@@ -0,0 +1,72 @@
+"""
+Bytes per object for the game's model classes.
+
+    python benchmarks/bench_memory.py --count 20000
+
+Builds `count` instances of each class with shared constructor arguments and
+reports the memory traced per instance, so only per-object storage (the
+object itself, its __dict__ or slots, and any per-instance containers) is
+counted.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.cards import AttackCard, DefenseCard, UtilityCard
+from modules.daily_task import DailyTask
+from modules.enemy import Enemy, Raider
+from modules.items import CardItem, ConsumableItem
+from modules.lore_manager import LoreEntry
+from modules.simple_task import SimpleTask
+
+STRIKE = AttackCard("Strike", 12, 6, "Deal 6 damage. [strike]", tags=["strike"])
+
+
+def _heal(source, target):
+    return None
+
+
+FACTORIES = [
+    ("AttackCard", lambda: AttackCard("Strike", 12, 6, "Deal 6 damage. [strike]", tags=["strike"])),
+    ("DefenseCard", lambda: DefenseCard("Guard", 10, 5, "Gain +5 defense.")),
+    ("UtilityCard", lambda: UtilityCard("Focus", 15, "apply ATTACK_UP 2 turns amount 2 to source", "Gain +2 attack.")),
+    ("Enemy", lambda: Enemy("Scavenger", 40, 6, 2, 20)),
+    ("Raider", lambda: Raider("Raider", 50, 8, 3, 30)),
+    ("CardItem", lambda: CardItem(STRIKE)),
+    ("ConsumableItem", lambda: ConsumableItem("Medkit", "Restore 20 HP.", _heal)),
+    ("LoreEntry", lambda: LoreEntry("bunker", "The door hums.", "places")),
+    ("SimpleTask", lambda: SimpleTask("t1", "Run", "5 km", time_limit_hours=24)),
+    ("DailyTask", lambda: DailyTask("d1", "Read", "20 pages")),
+]
+
+
+def bytes_per_object(factory, count: int) -> float:
+    factory()  # warm caches (compiled effects, interned strings)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_overhead = sys.getsizeof(objects)
+    del objects
+    return (after - before - list_overhead) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="instances per class")
+    args = parser.parse_args()
+
+    print(f"{'Class':16} {'Bytes/object':>13} {'__dict__':>9}")
+    for name, factory in FACTORIES:
+        has_dict = hasattr(factory(), "__dict__")
+        print(f"{name:16} {bytes_per_object(factory, args.count):>13.0f} {str(has_dict):>9}")
+
+
+if __name__ == "__main__":
+    main()
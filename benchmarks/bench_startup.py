@@ -0,0 +1,78 @@
+"""
+Startup time: interpreter, game imports and time to the first screen.
+
+    python benchmarks/bench_startup.py --runs 10 --budget 0.5
+
+Every run is a fresh interpreter. "First screen" is the time from launching
+`python main.py` until its loading screen reaches stdout. The game runs in a
+scratch directory (with a link to data/), so no saves are written to the repo.
+Exits with status 1 when the median time to the first screen is over --budget
+seconds, so it can guard cold start in CI.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def timed_run(args, cwd, env) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=cwd, env=env, check=True,
+                   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def first_screen(cwd, env) -> float:
+    """Seconds until a fresh `main.py` writes its first output."""
+    started = time.perf_counter()
+    game = subprocess.Popen([sys.executable, os.path.join(ROOT, "main.py"), "--text-speed", "instant"],
+                            cwd=cwd, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE)
+    try:
+        if not game.stdout.read(1):
+            raise RuntimeError("main.py exited without drawing a screen")
+        return time.perf_counter() - started
+    finally:
+        game.kill()
+        game.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per measurement")
+    parser.add_argument("--budget", type=float, default=0.5, help="allowed median seconds to the first screen")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="rezone-startup-")
+    os.symlink(os.path.join(ROOT, "data"), os.path.join(scratch, "data"))
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    try:
+        # Warm the bytecode cache so every run measures the same thing
+        timed_run(["-c", "import modules.game_engine"], scratch, env)
+        bare = [timed_run(["-c", "pass"], scratch, env) for _ in range(args.runs)]
+        imports = [timed_run(["-c", "import modules.game_engine"], scratch, env) for _ in range(args.runs)]
+        screens = [first_screen(scratch, env) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(scratch)
+
+    base = statistics.median(bare)
+    print(f"{'Phase':28} {'Median ms':>10} {'Min ms':>8}")
+    print(f"{'Interpreter':28} {base * 1000:>10.1f} {min(bare) * 1000:>8.1f}")
+    print(f"{'Game imports':28} {(statistics.median(imports) - base) * 1000:>10.1f} "
+          f"{(min(imports) - min(bare)) * 1000:>8.1f}")
+    print(f"{'First screen (total)':28} {statistics.median(screens) * 1000:>10.1f} {min(screens) * 1000:>8.1f}")
+
+    median = statistics.median(screens)
+    verdict = "within" if median <= args.budget else "OVER"
+    print(f"\nFirst screen {verdict} budget: {median * 1000:.0f} ms of {args.budget * 1000:.0f} ms")
+    if median > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
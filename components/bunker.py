@@ -1,50 +1,27 @@
 from utils import clear, ascii
+from utils.keyboard import KeyReader
 from data.ascii_art import bunker_inside
 import time
 
-import sys
-import time
-import os
-
-if os.name == 'nt':
-    import msvcrt
-
-    def getch():
-        return msvcrt.getch().decode('utf-8')
-
-    def kbhit():
-        return msvcrt.kbhit()
-
-else:
-    import tty
-    import termios
-    import select
-
-    def getch():
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch
-
-    def kbhit():
-        dr, _, _ = select.select([sys.stdin], [], [], 0)
-        return bool(dr)
+# Seconds without a keypress before ARIA fills the silence with lore
+IDLE_CHATTER = 60
 
 
 def bunker(engine):
-    while engine.state == 'bunker':
-        clear()
-        print(bunker_inside)
-        print("[INFO]: Press a key to interact...")
-        print("[INFO]: This program is better run in full screen (Alt + Enter on Windows)")
-
-        while True:
-            if kbhit():
-                key = getch().lower()
+    with KeyReader() as keys:
+        while engine.state == 'bunker':
+            clear()
+            print(bunker_inside)
+            print("[INFO]: Press a key to interact...")
+            print("[INFO]: This program is better run in full screen (Alt + Enter on Windows)")
+
+            while True:
+                key = keys.read_key(IDLE_CHATTER if engine.bot.has_lore_left() else None)
+                if key is None:
+                    engine.bot.share_random_lore()
+                    time.sleep(1)
+                    break
+                key = key.lower()
                 if key == 'b':
                     engine.state = "bed"
                     return
@@ -1,5 +1,13 @@
 from utils import clear
 from modules.cards import CardType
+from modules.deck_stats import analyze_deck, prefetch
+
+DRAW_TURNS = (1, 3, 5)   # turns shown in the draw-chance columns
+
+def prefetch_deck_analytics(player):
+    """Start the preview's analytics in the background; call before waiting for a menu choice."""
+    if player.deck:
+        prefetch(list(player.deck), player.max_energy, player.base_attack)
 
 def deck_preview(engine):
     player = engine.player
@@ -27,10 +35,28 @@ def deck_preview(engine):
         else:
             card_summary[card.name]["count"] += 1
 
+    stats = analyze_deck(list(player.deck), player.max_energy, player.base_attack)
+    per_card = {row.name: row for row in stats.cards}
+
     for name, data in card_summary.items():
+        row = per_card[name]
         print(f"{name} x{data['count']}")
         print(f"   Type: {data['type']}, Cost: {data['cost']}")
-        print(f"   {data['description']}\n")
+        print(f"   {data['description']}")
+        if row.damage_per_energy:
+            print(f"   ⚔️  {row.damage_per_energy:.2f} damage per energy")
+        if row.defense_per_energy:
+            print(f"   🛡️  {row.defense_per_energy:.2f} defense per energy")
+        chances = " | ".join(f"{turn}T {stats.draw_chance[name][turn - 1]:.0%}" for turn in DRAW_TURNS)
+        print(f"   🃏 Drawn within: {chances}\n")
+
+    print("=== Deck Analytics ===")
+    print(f"⚔️  Damage per energy:  {stats.damage_per_energy:.2f}")
+    print(f"🛡️  Defense per energy: {stats.defense_per_energy:.2f}")
+    stall = " | ".join(f"{turn}T {stats.stall_chance[turn - 1]:.0%}" for turn in (5, stats.turns))
+    print(f"🔋 Energy stall within: {stall} (max energy {player.max_energy})")
+    note = "exact" if stats.exact else "estimated from sampled games"
+    print(f"   Greedy play from a fresh shuffle, {note}.\n")
 
     input("Press ENTER to return...")
     engine.state = "bunker"
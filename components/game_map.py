@@ -1,10 +1,33 @@
 import time
 from utils import typing, clear, ascii
+from modules.balance import estimate_win_chance
 from modules.battle_manager import BattleManager
+from modules.encounter import Encounter
 from modules.enemy import Boss
 
+# Seconds the card advisor may think each turn; None turns the hints off
+ADVISOR_BUDGET = 0.05
+
+# Auto-resolve is offered for regular enemies the greedy policy beats this often
+AUTO_RESOLVE_THRESHOLD = 0.9
+AUTO_RESOLVE_FIGHTS = 200
+
+
+def display_encounter_info(encounter):
+    print("\n=== Enemy Group ===")
+    print(f"Name:   {encounter.name}")
+    for i, enemy in enumerate(encounter.enemies, 1):
+        print(f"  {i}. {enemy.name:16} HP {enemy.health}/{enemy.max_health} | "
+              f"ATK {enemy.attack} | DEF {enemy.defense} | SPD {enemy.speed}")
+
+    print("\n⚔️ Faster enemies act more often. Pick a target for each attack.")
+    print("-" * 40)
+
 
 def display_enemy_info(enemy):
+    if isinstance(enemy, Encounter):
+        display_encounter_info(enemy)
+        return
     is_boss = isinstance(enemy, Boss)
     header = "=== 🚨 BOSS ENEMY ===" if is_boss else "=== Enemy Information ==="
     name_lbl = f"[BOSS] {enemy.name}" if is_boss else enemy.name
@@ -52,7 +75,7 @@ def game_map(engine):
                         print(f"=== Entered: {info.name} ===")
                         print(f"Level: {info.level}")
                         print(f"Description: {info.description}")
-                        print(f"Enemies Defeated: {len(info.enemies_defeated)}/{len(info.enemies)}")
+                        print(f"Enemies Defeated: {len(info.enemies_defeated)}/{len(info.opponents)}")
                         print(f"Boss Defeated: {'Yes' if info.boss_defeated else 'No'}")
                         print("-" * 40)
 
@@ -63,15 +86,29 @@ def game_map(engine):
                             return
 
                         display_enemy_info(next_enemy)
-                        choice = input("Do you want to [F]ight this enemy or [R]eturn to bunker? ").strip().lower()
+                        can_auto = False
+                        if not isinstance(next_enemy, Boss):
+                            chance = estimate_win_chance(engine.player, next_enemy, AUTO_RESOLVE_FIGHTS)
+                            can_auto = chance >= AUTO_RESOLVE_THRESHOLD
+                        if can_auto:
+                            prompt = f"Do you want to [F]ight, [A]uto-resolve ({chance:.0%} win chance) or [R]eturn to bunker? "
+                        else:
+                            prompt = "Do you want to [F]ight this enemy or [R]eturn to bunker? "
+                        choice = input(prompt).strip().lower()
                         if choice == 'r':
                             engine.state = 'bunker'
                             return
-                        elif choice == 'f':
+                        elif choice == 'f' or (choice == 'a' and can_auto):
                             # Use the current location's XP threshold
                             xp_thresh = selected.xp_threshold
-                            battle_manager = BattleManager(engine.player, next_enemy, xp_thresh)
-                            victory = battle_manager.start_battle()
+                            if choice == 'a':
+                                # No hints or intent previews in a fight nobody watches
+                                battle_manager = BattleManager(engine.player, next_enemy, xp_thresh,
+                                                               advisor_budget=0, forecast_intents=False)
+                                victory = battle_manager.auto_resolve()
+                            else:
+                                battle_manager = BattleManager(engine.player, next_enemy, xp_thresh, ADVISOR_BUDGET)
+                                victory = battle_manager.start_battle()
 
                             if victory:
                                 print(f"\n✅ You defeated {next_enemy.name}!")
@@ -93,7 +130,7 @@ def game_map(engine):
                                 engine.state = 'bunker'
                                 return
                         else:
-                            print("Invalid choice. Please type F or R.")
+                            print("Invalid choice. Please type F, A or R." if can_auto else "Invalid choice. Please type F or R.")
                             input("Press ENTER to continue...")
                 elif result == "level_mismatch":
                     typing(f"You cannot enter {selected.name} yet. Required level: {selected.level}", type="info")
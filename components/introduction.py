@@ -1,10 +1,9 @@
-from utils import clear, typing
-from modules.lore_manager import LoreManager
-import time
+from utils import clear, typing, pause, scene
+from modules.lore_manager import get_lore_manager
 
 def show_intro(lore_path="data/lore.json"):
     clear()
-    lore_manager = LoreManager(lore_path)
+    lore_manager = get_lore_manager(lore_path)
     intro_lines = lore_manager.get_entries_by_category("into_lore")
 
     print("=" * 60)
@@ -17,21 +16,23 @@ def show_intro(lore_path="data/lore.json"):
             break
         elif choice in ("n", "no"):
             print("\nSkipping prologue...\n")
-            time.sleep(1)
+            pause(1)
             clear()
             return
         else:
             print("Please enter Y or N.")
 
-    input("\n[Press ENTER to begin the prologue...]\n")
+    input("\n[Press ENTER to begin the prologue, then any key to skip it...]\n")
 
-    for entry in intro_lines:
-        if entry.content.strip() == "":
-            print()
-            time.sleep(1)
-        else:
-            typing(entry.content, type="narration", delay=0.030)
-            time.sleep(1.3)
+    # Any key skips the rest of the prologue
+    with scene():
+        for entry in intro_lines:
+            if entry.content.strip() == "":
+                print()
+                pause(1)
+            else:
+                typing(entry.content, type="narration", delay=0.030)
+                pause(1.3)
 
     print("\n" + "-" * 60)
     input("🧠 Remember: survival is earned. Press ENTER to continue...")
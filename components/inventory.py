@@ -1,7 +1,9 @@
 from utils import clear
-from .deck import deck_preview
+from .deck import deck_preview, prefetch_deck_analytics
 from .card_shop import card_shop
-from modules.items import CardItem
+from modules.items import CardItem, HEALTH_POTIONS
+
+OPTIMIZER_BUDGET = 10.0   # seconds the deck optimizer may search
 
 def inventory(engine):
     player = engine.player
@@ -23,6 +25,7 @@ def inventory(engine):
         print("4. Manage Deck")
         print("0. Return to Bunker")
 
+        prefetch_deck_analytics(player)
         choice = input("\nYour choice: ").strip()
 
         if choice == "0":
@@ -35,12 +38,7 @@ def inventory(engine):
                 input("Press ENTER to continue...")
                 continue
 
-            marketplace_items = [
-                ("Small Health Potion", 10, 10),
-                ("Medium Health Potion", 25, 20),
-                ("Large Health Potion", 45, 30),
-            ]
-            for i, (name, cost, restore) in enumerate(marketplace_items, 1):
+            for i, (name, cost, restore) in enumerate(HEALTH_POTIONS, 1):
                 print(f"{i}. {name} - ${cost}, Restores {restore} HP")
             print("0. Cancel")
 
@@ -49,8 +47,8 @@ def inventory(engine):
                 continue
             if sub.isdigit():
                 idx = int(sub) - 1
-                if 0 <= idx < len(marketplace_items):
-                    name, cost, restore = marketplace_items[idx]
+                if 0 <= idx < len(HEALTH_POTIONS):
+                    name, cost, restore = HEALTH_POTIONS[idx]
                     if player.money >= cost:
                         player.spend_money(cost)
                         player.health = min(player.max_health, player.health + restore)
@@ -95,6 +93,7 @@ def manage_deck(engine):
         print("\nOptions:")
         print("1. Add card from inventory to deck")
         print("2. Remove card from deck to inventory")
+        print("3. Optimize deck for a location")
         print("0. Done")
 
         choice = input("\nChoose an option: ").strip()
@@ -132,6 +131,82 @@ def manage_deck(engine):
                     print("Invalid selection.")
             input("Press ENTER to continue...")
 
+        elif choice == "3":
+            optimize_for_location(engine)
+
         else:
             print("Invalid input.")
             input("Press ENTER to continue...")
+
+
+def optimize_for_location(engine):
+    player = engine.player
+    locations = engine.location_manager.get_available_locations(player.level)
+    if not locations:
+        input("No locations available. Press ENTER to continue...")
+        return
+
+    print("\nOptimize for which location?")
+    for i, location in enumerate(locations, 1):
+        print(f"{i}. {location.name}")
+    idx = input("Location number: ").strip()
+    if not idx.isdigit() or not 0 < int(idx) <= len(locations):
+        input("Invalid selection. Press ENTER to continue...")
+        return
+    location = locations[int(idx) - 1]
+    loc_id = next(i for i, loc in engine.location_manager.locations.items() if loc is location)
+
+    print(f"\n🧪 Simulating decks against {location.name} for up to {OPTIMIZER_BUDGET:.0f}s...")
+
+    def progress(best, evaluated):
+        print(f"\r   {evaluated} decks tried, best win rate {best.win_rate:.0%}", end="", flush=True)
+
+    from modules.deck_optimizer import optimize_deck    # pulls in the simulators; only needed here
+    result = optimize_deck(player, loc_id, budget=OPTIMIZER_BUDGET, progress=progress)
+    print(f"\n\nCurrent deck:     {result.baseline.win_rate:.0%} simulated wins")
+    print(f"Recommended deck: {result.score.win_rate:.0%} simulated wins")
+
+    current = [card.name for card in player.deck]
+    recommended = [card.name for card in result.deck]
+    removed = _difference(current, recommended)
+    added = _difference(recommended, current)
+    if not removed and not added:
+        input("\n✅ Your deck is already the best one found. Press ENTER to continue...")
+        return
+    for name in added:
+        print(f"  + {name}")
+    for name in removed:
+        print(f"  - {name}")
+
+    if input("\nApply this deck? (y/n): ").strip().lower() == "y":
+        _apply_deck(player, result.deck)
+        print("✅ Deck updated.")
+    input("Press ENTER to continue...")
+
+
+def _difference(names, other):
+    """Names in `names` left over after matching each name in `other` once."""
+    left = list(names)
+    for name in other:
+        if name in left:
+            left.remove(name)
+    return left
+
+
+def _apply_deck(player, cards):
+    """Make `cards` the deck, moving the card objects between deck and inventory."""
+    inv_manager = player.inventory_manager
+    wanted = list(cards)
+    deck = []
+    for card in player.deck:
+        if card in wanted:
+            wanted.remove(card)
+            deck.append(card)
+        else:
+            inv_manager.add_item(CardItem(card))
+    for item in inv_manager.get_items_by_type(CardItem):
+        if item.card in wanted:
+            wanted.remove(item.card)
+            deck.append(item.card)
+            inv_manager.remove_item(item)
+    player.deck = deck
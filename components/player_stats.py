@@ -1,5 +1,5 @@
 from utils import clear, ascii_bar
-from .deck import deck_preview
+from .deck import deck_preview, prefetch_deck_analytics
 
 
 def display_player_stats(engine):
@@ -32,6 +32,7 @@ def display_player_stats(engine):
         print("1. View Deck")
         print("0. Return to Bunker")
 
+        prefetch_deck_analytics(player)
         choice = input("\nYour choice: ").strip()
         if choice == "1":
             deck_preview(engine)
@@ -1,8 +1,16 @@
+import argparse
 
 from modules.game_engine import Game
-from utils import clear
+from utils import clear, set_speed
+from utils.pacing import SPEEDS
 
 def main():
+    parser = argparse.ArgumentParser(description="RE : ZONE")
+    parser.add_argument("--text-speed", choices=list(SPEEDS), default="cinematic",
+                        help="how fast narration and ARIA type out")
+    args = parser.parse_args()
+    set_speed(args.text_speed)
+
     try:
         game = Game()
         game.start_game()
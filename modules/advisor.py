@@ -0,0 +1,142 @@
+"""
+Card-play advisor: time-boxed expectimax over future turns.
+
+The advisor searches the BattleModel tree (player choices, card draws and
+the enemy's odds from enemy.py) one more turn deep at a time until its time
+budget runs out, and suggests the card with the best win chance found by the
+deepest finished search. Positions past the search horizon are scored by a
+quick estimate. Every searched position goes into a transposition table that
+lives as long as the advisor, so later turns of the same fight start from
+the work done on earlier ones.
+
+    advisor = Advisor(player, enemy, budget=0.05)
+    idx = advisor.suggest(player, enemy, engine.turn_count)
+"""
+import math
+import time
+from typing import Dict, Optional, Tuple
+
+from .battle_engine import Policy, GreedyPolicy
+from .cards import AttackCard
+from .enemy import Enemy
+from .player import Player
+from .solver import BattleModel
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+class Advisor:
+    """Suggests a card for the player of one fight."""
+
+    def __init__(self, player: Player, enemy: Enemy, budget: float = 0.05, max_turns: int = 200):
+        self.budget = budget
+        self.model = BattleModel(player, enemy, max_turns)
+        # position -> (depth searched, win chance, best card id); depth is inf when exact
+        self.table: Dict[tuple, Tuple[float, float, Optional[int]]] = {}
+        self.depth = 0                      # depth of the last finished search
+        self.win_chance: Optional[float] = None
+
+        # For the horizon estimate: the most damage per energy any attack card deals
+        self._max_health = player.max_health
+        self._damage_per_energy = max(
+            [max(0, card.damage + player.base_attack - enemy.base_defense) / max(1, card.energy_cost)
+             for card in self.model.cards if isinstance(card, AttackCard)] or [0]
+        )
+        self._deadline = 0.0
+
+    def suggest(self, player: Player, enemy: Enemy, turn: int) -> Optional[int]:
+        """Index into player.hand of the suggested card, or None if nothing is affordable."""
+        position = self.model.position(player, enemy, turn)
+        if not self.model.playable(position):
+            return None
+
+        self._deadline = time.perf_counter() + self.budget
+        best = None
+        self.depth, self.win_chance = 0, None
+        depth = 1
+        try:
+            while depth <= self.model.max_turns - turn + 1:
+                value, card_id, exact = self._decision(position, depth)
+                best, self.depth, self.win_chance = card_id, depth, value
+                if exact:
+                    break
+                depth += 1
+        except _OutOfTime:
+            pass
+
+        if best is None:
+            return GreedyPolicy().choose_card(_Hand(player))
+        return next(i for i, card in enumerate(player.hand) if self.model.ids[card] == best)
+
+    def _decision(self, position: tuple, depth: int) -> Tuple[float, Optional[int], bool]:
+        """Best (win chance, card id, exact) for a player about to pick a card."""
+        entry = self.table.get(position)
+        if entry is not None and entry[0] >= depth:
+            return entry[1], entry[2], entry[0] == math.inf
+        if time.perf_counter() > self._deadline:
+            raise _OutOfTime()
+
+        hand = position[3]
+        best_value, best_card, exact = 0.0, None, True
+        tried = set()
+        for idx in self.model.playable(position):
+            if hand[idx] in tried:
+                continue
+            tried.add(hand[idx])
+            value = 0.0
+            for p, following, final in self.model.play(position, idx):
+                if following is None:
+                    value += p * final[0]
+                else:
+                    v, sub_exact = self._chance(following, depth - 1)
+                    value += p * v
+                    exact = exact and sub_exact
+            if best_card is None or value > best_value:
+                best_value, best_card = value, hand[idx]
+
+        self.table[position] = (math.inf if exact else depth, best_value, best_card)
+        return best_value, best_card, exact
+
+    def _chance(self, position: tuple, depth: int) -> Tuple[float, bool]:
+        """Expected win chance at the start of a turn, over the cards drawn."""
+        if depth == 0:
+            return self._estimate(position), False
+        value, exact = 0.0, True
+        for p, drawn in self.model.turn_start(position):
+            v, _, sub_exact = self._decision(drawn, depth)
+            value += p * v
+            exact = exact and sub_exact
+        return value, exact
+
+    def _estimate(self, position: tuple) -> float:
+        """Rough win chance: can the remaining energy finish the enemy, and how safe is the player."""
+        player, enemy = position[1], position[2]
+        enemy_health = max(1, enemy[0])
+        reach = min(1.0, player[1] * self._damage_per_energy / enemy_health)
+        safety = player[0] / self._max_health
+        return reach * (0.5 + 0.5 * safety)
+
+
+class _Hand:
+    """Minimal engine stand-in so GreedyPolicy can pick from a live hand."""
+    __slots__ = ('player',)
+
+    def __init__(self, player: Player):
+        self.player = player
+
+
+class AdvisorPolicy(Policy):
+    """Headless policy that plays the advisor's suggestion, with one advisor per battle."""
+
+    def __init__(self, budget: float = 0.05):
+        self.budget = budget
+        self._engine = None
+        self._advisor: Optional[Advisor] = None
+
+    def choose_card(self, engine) -> Optional[int]:
+        if engine is not self._engine:
+            self._engine = engine
+            self._advisor = Advisor(engine.player, engine.enemy, self.budget, engine.max_turns)
+        return self._advisor.suggest(engine.player, engine.enemy, engine.turn_count)
@@ -0,0 +1,241 @@
+"""
+Monte Carlo balance harness.
+
+Pits every enemy and boss in locations.json against a configurable player
+deck and runs seeded headless battles across all cores:
+
+    python -m modules.balance --fights 500 --level 2 --unlock Lunge
+"""
+import argparse
+import copy
+import os
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .battle_engine import BattleEngine, GreedyPolicy
+from .encounter import Encounter, EncounterEngine
+from .location import LocationManager
+from .player import Player
+from .rng import BattleRNG, mix64, GOLDEN_GAMMA, MASK64
+
+BOSS_INDEX = -1
+
+# Per-process cache so each worker parses locations.json only once
+_location_managers: Dict[str, LocationManager] = {}
+
+
+def get_location_manager(json_path: str) -> LocationManager:
+    if json_path not in _location_managers:
+        _location_managers[json_path] = LocationManager(json_path)
+    return _location_managers[json_path]
+
+
+def unlock_card_names() -> List[str]:
+    return [card.name for cards in Player.CARD_UNLOCKS.values() for card in cards]
+
+
+def build_player(level: int = 1, unlocks: Sequence[str] = (), rng=random) -> Player:
+    """Create a simulated player at `level` with the starter deck plus named CARD_UNLOCKS."""
+    player = Player("Simulant", rng=rng)
+    while player.level < level:
+        player.advance_level()
+
+    unlockable = {card.name: card for cards in Player.CARD_UNLOCKS.values() for card in cards}
+    for name in unlocks:
+        if name not in unlockable:
+            raise ValueError(f"Unknown unlock card '{name}'")
+        player.deck.append(unlockable[name])
+        player.unlocked_cards.add(name)
+    return player
+
+
+def fight_seed(seed: int, loc_id: int, enemy_index: int, fight: int) -> int:
+    """Independent 64-bit BattleRNG seed for each fight of each matchup."""
+    z = seed & MASK64
+    for part in (loc_id, enemy_index, fight):
+        z = mix64(((z ^ (part & MASK64)) + GOLDEN_GAMMA) & MASK64)
+    return z
+
+
+class MatchupStats:
+    """Running totals for one enemy; chunks from different workers merge into it."""
+
+    def __init__(self, loc_id: int, location: str, enemy: str, is_boss: bool):
+        self.loc_id = loc_id
+        self.location = location
+        self.enemy = enemy
+        self.is_boss = is_boss
+        self.fights = 0
+        self.wins = 0
+        self.turns = 0
+        self.health_left = 0
+
+    def merge(self, fights: int, wins: int, turns: int, health_left: int) -> None:
+        self.fights += fights
+        self.wins += wins
+        self.turns += turns
+        self.health_left += health_left
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        return self.turns / self.fights if self.fights else 0.0
+
+    @property
+    def mean_health_left(self) -> float:
+        return self.health_left / self.fights if self.fights else 0.0
+
+
+def run_chunk(
+    json_path: str,
+    loc_id: int,
+    enemy_index: int,
+    level: int,
+    unlocks: Tuple[str, ...],
+    seed: int,
+    start: int,
+    count: int,
+    max_turns: int
+) -> Tuple[int, int, int, int, int, int]:
+    """
+    Run `count` seeded fights of one matchup in the current process.
+    Only aggregate totals go back to the parent, which keeps IPC negligible.
+    """
+    location = get_location_manager(json_path).locations[loc_id]
+    template = location.boss if enemy_index == BOSS_INDEX else location.opponents[enemy_index]
+    policy = GreedyPolicy()
+
+    wins = turns = health_left = 0
+    for fight in range(start, start + count):
+        rng = BattleRNG(fight_seed(seed, loc_id, enemy_index, fight))
+        player = build_player(level, unlocks, rng)
+        result = matchup_engine(player, template, max_turns, rng).run(policy)
+        wins += result.player_won
+        turns += result.turns
+        health_left += result.player_health
+    return loc_id, enemy_index, count, wins, turns, health_left
+
+
+def matchup_engine(player: Player, opponent, max_turns: int = 200, rng=None) -> BattleEngine:
+    """Engine against a fresh copy of an enemy, or of every enemy of an Encounter."""
+    opponent = copy.deepcopy(opponent)
+    if isinstance(opponent, Encounter):
+        return EncounterEngine(player, opponent.enemies, max_turns, rng)
+    return BattleEngine(player, opponent, max_turns=max_turns, rng=rng)
+
+
+def estimate_win_chance(
+    player: Player,
+    enemy,
+    fights: int = 200,
+    seed: int = 0,
+    max_turns: int = 200
+) -> float:
+    """
+    Share of `fights` seeded GreedyPolicy fights, started from the fighters'
+    current state, that the player wins. The fighters are not modified: the
+    fights run on copies, rolled back to one snapshot between fights.
+    """
+    policy = GreedyPolicy()
+    engine = matchup_engine(copy.deepcopy(player), enemy, max_turns)
+    start = engine.snapshot()
+    wins = 0
+    for fight in range(fights):
+        engine.rng = BattleRNG(fight_seed(seed, 0, 0, fight))
+        engine.restore(start)
+        wins += engine.run(policy).player_won
+    return wins / fights
+
+
+def plan_chunks(total: int, workers: int) -> List[Tuple[int, int]]:
+    """Split `total` fights into (start, count) slices, a few per worker for load balancing."""
+    size = max(1, min(250, -(-total // (workers * 4))))
+    return [(start, min(size, total - start)) for start in range(0, total, size)]
+
+
+def run_balance(
+    json_path: str = "data/locations.json",
+    fights: int = 200,
+    level: int = 1,
+    unlocks: Sequence[str] = (),
+    seed: int = 0,
+    workers: Optional[int] = None,
+    max_turns: int = 200
+) -> List[MatchupStats]:
+    """Run every matchup and return one MatchupStats per enemy, in locations.json order."""
+    manager = get_location_manager(json_path)
+    unlocks = tuple(unlocks)
+    build_player(level, unlocks)  # fail fast on unknown unlock names
+
+    stats: Dict[Tuple[int, int], MatchupStats] = {}
+    for loc_id, location in manager.locations.items():
+        for idx, enemy in enumerate(location.opponents):
+            stats[(loc_id, idx)] = MatchupStats(loc_id, location.name, enemy.name, False)
+        stats[(loc_id, BOSS_INDEX)] = MatchupStats(loc_id, location.name, location.boss.name, True)
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    jobs = [
+        (json_path, loc_id, enemy_index, level, unlocks, seed, start, count, max_turns)
+        for (loc_id, enemy_index) in stats
+        for start, count in plan_chunks(fights, max(1, workers))
+    ]
+
+    if workers <= 1:
+        for job in jobs:
+            loc_id, enemy_index, *totals = run_chunk(*job)
+            stats[(loc_id, enemy_index)].merge(*totals)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed    # slow import, CLI only
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_chunk, *job) for job in jobs]
+            for future in as_completed(futures):
+                loc_id, enemy_index, *totals = future.result()
+                stats[(loc_id, enemy_index)].merge(*totals)
+
+    return list(stats.values())
+
+
+def format_table(stats: List[MatchupStats]) -> str:
+    lines = [f"{'Location':18} {'Enemy':22} {'Fights':>7} {'Win %':>7} {'Turns':>7} {'HP left':>8}"]
+    lines.append("-" * len(lines[0]))
+    current = None
+    for row in stats:
+        if current is not None and row.loc_id != current:
+            lines.append("")
+        current = row.loc_id
+        enemy = f"[BOSS] {row.enemy}" if row.is_boss else row.enemy
+        lines.append(
+            f"{row.location:18} {enemy:22} {row.fights:>7} {row.win_rate * 100:>6.1f}% "
+            f"{row.mean_turns:>7.2f} {row.mean_health_left:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo balance report for every location.")
+    parser.add_argument("--locations", default="data/locations.json", help="path to locations.json")
+    parser.add_argument("--fights", type=int, default=200, help="seeded fights per matchup")
+    parser.add_argument("--level", type=int, default=1, help="player level (stat growth only)")
+    parser.add_argument("--unlock", action="append", default=[], metavar="CARD",
+                        help=f"add an unlock card to the starter deck ({', '.join(unlock_card_names())})")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for every fight")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--max-turns", type=int, default=200, help="turn limit per fight")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    stats = run_balance(args.locations, args.fights, args.level, args.unlock,
+                        args.seed, args.workers, args.max_turns)
+    elapsed = time.perf_counter() - started
+
+    total = sum(row.fights for row in stats)
+    print(format_table(stats))
+    print(f"\n{total} fights in {elapsed:.2f}s ({total / elapsed:,.0f} fights/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,494 @@
+"""
+Vectorized batch battle simulator.
+
+Holds many fights of one player deck against one enemy as NumPy arrays (one
+lane per fight) and steps every fight a turn at a time with array operations.
+The rules mirror BattleEngine with GreedyPolicy exactly: for the same seed a
+lane reproduces BattleEngine(..., rng=BattleRNG(seed)) move for move, because
+both draw from the same counter-based stream (see modules/rng.py).
+
+Attack, defense (plain and scaled) and utility cards are modeled on both
+sides. UtilityCard effects written as effect programs (modules/effects.py) are
+applied to all lanes at once; cards with plain callables fall back to calling
+the effect through a per-lane view of the arrays. Any other card class,
+including subclasses of those, raises ValueError rather than being simulated
+with the wrong rules.
+
+On the shipped matchups (bench_batch_sim, 20000 fights) a batch runs roughly
+25-75x as many fights per second as BattleEngine on one core: short fights sit
+at the low end, since every turn pays a fixed cost per array operation.
+"""
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .battle_engine import BattleEngine, GreedyPolicy
+from .cards import AttackCard, DefenseCard, UtilityCard, ScaledAttackCard, ScaledDefenseCard
+from .character import StatusEffect, EFFECTS, EFFECT_INDEX
+from .effects import Effect, Condition, APPLY
+from .enemy import Enemy
+from .player import Player
+from .rng import BattleRNG, GOLDEN_GAMMA, MIX_MUL_1, MIX_MUL_2, DOUBLE_UNIT, MASK64
+
+ATTACK, SCALED_ATTACK, DEFENSE, SCALED_DEFENSE, UTILITY = range(5)
+WIN_NONE, WIN_PLAYER, WIN_ENEMY = 0, 1, 2
+
+# Exact classes only: a subclass may change the rules in ways the arrays do not follow
+CARD_KINDS = {
+    AttackCard: ATTACK, ScaledAttackCard: SCALED_ATTACK,
+    DefenseCard: DEFENSE, ScaledDefenseCard: SCALED_DEFENSE,
+    UtilityCard: UTILITY
+}
+ATTACK_UP = EFFECT_INDEX[StatusEffect.ATTACK_UP]
+DEFENSE_UP = EFFECT_INDEX[StatusEffect.DEFENSE_UP]
+PARALYZED = EFFECT_INDEX[StatusEffect.PARALYZED]
+DAMAGE_OVER_TIME = [EFFECT_INDEX[StatusEffect.POISONED], EFFECT_INDEX[StatusEffect.BURNED]]
+
+_U64 = np.uint64
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    # uint64 array arithmetic wraps modulo 2**64, matching rng.mix64
+    z = (z ^ (z >> _U64(30))) * _U64(MIX_MUL_1)
+    z = (z ^ (z >> _U64(27))) * _U64(MIX_MUL_2)
+    return z ^ (z >> _U64(31))
+
+
+class _Side:
+    """Per-lane stats and status effects for one combatant."""
+
+    def __init__(self, size: int, character, energy: int = 0, max_energy: int = 0):
+        self.hp = np.full(size, character.health, dtype=np.int64)
+        self.max_hp = np.full(size, character.max_health, dtype=np.int64)
+        self.base_atk = np.full(size, character.base_attack, dtype=np.int64)
+        self.base_dfn = np.full(size, character.base_defense, dtype=np.int64)
+        self.atk = np.full(size, character.attack, dtype=np.int64)
+        self.dfn = np.full(size, character.defense, dtype=np.int64)
+        self.energy = np.full(size, energy, dtype=np.int64)
+        self.max_energy = np.full(size, max_energy, dtype=np.int64)
+        self.alive = np.full(size, character.alive, dtype=bool)
+
+        self.active = np.zeros((size, len(EFFECTS)), dtype=bool)
+        self.dur = np.zeros((size, len(EFFECTS)), dtype=np.int64)
+        self.amt = np.zeros((size, len(EFFECTS)), dtype=np.int64)
+        for eff, duration, amount in character.active_effects():
+            k = EFFECT_INDEX[eff]
+            self.active[:, k] = True
+            self.dur[:, k] = duration
+            self.amt[:, k] = amount
+
+    def can_act(self, lanes: np.ndarray) -> np.ndarray:
+        return self.alive[lanes] & ~self.active[lanes, PARALYZED]
+
+
+class _LaneView:
+    """Character-like window onto one lane, so UtilityCard effects can run unchanged."""
+
+    _FIELDS = {
+        'health': 'hp', 'max_health': 'max_hp', 'attack': 'atk', 'defense': 'dfn',
+        'base_attack': 'base_atk', 'base_defense': 'base_dfn',
+        'energy': 'energy', 'max_energy': 'max_energy', 'alive': 'alive'
+    }
+
+    def __init__(self, side: _Side, lane: int, name: str):
+        object.__setattr__(self, '_side', side)
+        object.__setattr__(self, '_lane', lane)
+        object.__setattr__(self, 'name', name)
+
+    def __getattr__(self, attr):
+        field = _LaneView._FIELDS.get(attr)
+        if field is None:
+            raise AttributeError(attr)
+        return getattr(self._side, field)[self._lane].item()
+
+    def __setattr__(self, attr, value):
+        field = _LaneView._FIELDS.get(attr)
+        if field is None:
+            raise AttributeError(f"Batch lanes do not support setting '{attr}'")
+        getattr(self._side, field)[self._lane] = value
+
+    def add_status_effect(self, effect: StatusEffect, duration: int, amount=None) -> None:
+        k = EFFECT_INDEX[effect]
+        self._side.active[self._lane, k] = True
+        self._side.dur[self._lane, k] = duration
+        self._side.amt[self._lane, k] = amount if amount is not None else 1
+
+
+class BatchResult:
+    """Per-lane outcomes of a batch run; lane i used seeds[i]."""
+
+    def __init__(self, seeds, winner, turns, player_health, enemy_health, energy_spent,
+                 surrendered, damage_by_card: Dict[str, int]):
+        self.seeds = seeds
+        self.winner = winner
+        self.turns = turns
+        self.player_health = player_health
+        self.enemy_health = enemy_health
+        self.energy_spent = energy_spent
+        self.surrendered = surrendered
+        self.damage_by_card = damage_by_card
+
+    def __len__(self):
+        return len(self.winner)
+
+    @property
+    def win_rate(self) -> float:
+        return float(np.mean(self.winner == WIN_PLAYER)) if len(self) else 0.0
+
+    def lane(self, i: int) -> dict:
+        winner = {WIN_PLAYER: "player", WIN_ENEMY: "enemy"}.get(int(self.winner[i]))
+        return {
+            'winner': winner,
+            'turns': int(self.turns[i]),
+            'player_health': int(self.player_health[i]),
+            'enemy_health': int(self.enemy_health[i]),
+            'energy_spent': int(self.energy_spent[i]),
+            'surrendered': bool(self.surrendered[i])
+        }
+
+
+class BatchSimulator:
+    """
+    Simulate len(seeds) fights of `player` against `enemy` at once.
+
+    Inputs are read, never modified: every lane starts from the current
+    state of both objects (deck order, hand, HP, energy, status effects).
+    """
+
+    def __init__(self, player: Player, enemy: Enemy, seeds: Sequence[int], max_turns: int = 200):
+        size = len(seeds)
+        self.size = size
+        self.enemy = enemy
+        self.max_turns = max_turns
+        self.player_name = player.name
+        self.seeds = np.array([s & MASK64 for s in seeds], dtype=np.uint64)
+        self.counter = np.zeros(size, dtype=np.uint64)
+
+        # Card table: every distinct card object gets an id
+        self.cards: List = []
+        ids: Dict[int, int] = {}
+        for card in [*player.deck, *player.hand, *player.discard_pile]:
+            if id(card) not in ids:
+                ids[id(card)] = len(self.cards)
+                self.cards.append(card)
+        names: Dict[str, int] = {}
+        self.card_name = np.array([names.setdefault(c.name, len(names)) for c in self.cards], dtype=np.int32)
+        self.card_kind = np.array([self._kind(c) for c in self.cards], dtype=np.int64)
+        self.card_cost = np.array([c.energy_cost for c in self.cards], dtype=np.int64)
+        self.card_damage = np.array([getattr(c, 'damage', 0) for c in self.cards], dtype=np.int64)
+        self.card_defense = np.array([getattr(c, 'defense', 0) for c in self.cards], dtype=np.int64)
+        self.card_scale = np.array([getattr(c, 'scale', 0.0) for c in self.cards], dtype=np.float64)
+        self.card_score = np.array([GreedyPolicy.card_score(c) for c in self.cards], dtype=np.int64)
+        self.card_damage_total = np.zeros(len(self.cards), dtype=np.int64)
+        self.card_hits = np.zeros(len(self.cards), dtype=np.int64)
+
+        # Piles as fixed-width id arrays with a per-lane length
+        width = max(1, len(player.deck) + len(player.hand) + len(player.discard_pile))
+        hand_width = max(3, len(player.hand))
+        self.pile = np.zeros((size, width), dtype=np.int32)
+        self.discard = np.zeros((size, width), dtype=np.int32)
+        self.hand = np.zeros((size, hand_width), dtype=np.int32)
+        self.pile[:, :len(player.deck)] = [ids[id(c)] for c in player.deck]
+        self.discard[:, :len(player.discard_pile)] = [ids[id(c)] for c in player.discard_pile]
+        self.hand[:, :len(player.hand)] = [ids[id(c)] for c in player.hand]
+        self.pile_len = np.full(size, len(player.deck), dtype=np.int64)
+        self.disc_len = np.full(size, len(player.discard_pile), dtype=np.int64)
+        self.hand_len = np.full(size, len(player.hand), dtype=np.int64)
+
+        self.p = _Side(size, player, player.energy, player.max_energy)
+        self.e = _Side(size, enemy)
+
+        self.turns = np.ones(size, dtype=np.int64)
+        self.winner = np.full(size, WIN_NONE, dtype=np.int64)
+        self.surrendered = np.zeros(size, dtype=bool)
+        self.energy_spent = np.zeros(size, dtype=np.int64)
+
+        # Enemy actions, indexed in behavior table order
+        self.actions = [enemy.behavior.actions[action_id] for action_id in enemy.behavior.actions]
+        self.action_index = {id(card): k for k, card in enumerate(self.actions)}
+        self.action_kind = [self._kind(card) for card in self.actions]
+
+    @staticmethod
+    def _kind(card) -> int:
+        kind = CARD_KINDS.get(type(card))
+        if kind is None:
+            raise ValueError(f"The batch simulator does not model {type(card).__name__} cards ('{card.name}')")
+        return kind
+
+    # -- random stream -------------------------------------------------
+
+    def _random(self, lanes: np.ndarray) -> np.ndarray:
+        self.counter[lanes] += _U64(1)
+        z = self.seeds[lanes] + self.counter[lanes] * _U64(GOLDEN_GAMMA)
+        return (_mix64(z) >> _U64(11)).astype(np.float64) * DOUBLE_UNIT
+
+    def _randbelow(self, lanes: np.ndarray, n) -> np.ndarray:
+        return np.minimum((self._random(lanes) * n).astype(np.int64), np.asarray(n) - 1)
+
+    # -- deck handling -------------------------------------------------
+
+    def _shuffle(self, lanes: np.ndarray) -> None:
+        lengths = self.pile_len[lanes]
+        for i in range(int(lengths.max()) - 1, 0, -1):
+            rows = lanes[lengths > i]
+            j = self._randbelow(rows, i + 1)
+            held = self.pile[rows, i].copy()
+            self.pile[rows, i] = self.pile[rows, j]
+            self.pile[rows, j] = held
+
+    def _draw(self, lanes: np.ndarray, count: int) -> None:
+        """Player.draw_cards: first card in the pile whose name is not already in hand."""
+        width = self.pile.shape[1]
+        positions = np.arange(width)
+        pending = lanes
+        for _ in range(count):
+            if not pending.size:
+                return
+
+            empty = self.pile_len[pending] == 0
+            refill = pending[empty & (self.disc_len[pending] > 0)]
+            pending = pending[~empty | (self.disc_len[pending] > 0)]
+            if refill.size:
+                self.pile[refill] = self.discard[refill]
+                self.pile_len[refill] = self.disc_len[refill]
+                self.disc_len[refill] = 0
+                self._shuffle(refill)
+            if not pending.size:
+                return
+
+            hand_slots = np.arange(self.hand.shape[1])
+            hand_names = np.where(hand_slots < self.hand_len[pending, None],
+                                  self.card_name[self.hand[pending]], -1)
+            pile_names = self.card_name[self.pile[pending]]
+            duplicate = (pile_names[:, :, None] == hand_names[:, None, :]).any(axis=2)
+            eligible = (positions < self.pile_len[pending, None]) & ~duplicate
+            found = eligible.any(axis=1)
+            pending = pending[found]
+            picked = eligible[found].argmax(axis=1)
+
+            self.hand[pending, self.hand_len[pending]] = self.pile[pending, picked]
+            self.hand_len[pending] += 1
+            source = np.minimum(positions + (positions >= picked[:, None]), width - 1)
+            self.pile[pending] = np.take_along_axis(self.pile[pending], source, axis=1)
+            self.pile_len[pending] -= 1
+
+    # -- turn structure ------------------------------------------------
+
+    def _reset_temporary_stats(self, side: _Side, lanes: np.ndarray) -> None:
+        active = side.active[lanes]
+        side.atk[lanes] = side.base_atk[lanes] + np.where(active[:, ATTACK_UP], side.amt[lanes, ATTACK_UP], 0)
+        side.dfn[lanes] = side.base_dfn[lanes] + np.where(active[:, DEFENSE_UP], side.amt[lanes, DEFENSE_UP], 0)
+
+    def _update_status_effects(self, side: _Side, lanes: np.ndarray) -> None:
+        active = side.active[lanes]
+        # Poison and burn amounts are non-negative, so one clamp equals a clamp per effect
+        dot = np.where(active[:, DAMAGE_OVER_TIME], side.amt[lanes][:, DAMAGE_OVER_TIME], 0).sum(axis=1)
+        side.hp[lanes] = np.maximum(0, side.hp[lanes] - dot)
+        dur = side.dur[lanes] - active
+        side.dur[lanes] = dur
+        side.active[lanes] = active & (dur > 0)
+        side.alive[lanes] = side.hp[lanes] > 0
+
+    def _choose_cards(self, lanes: np.ndarray) -> np.ndarray:
+        """GreedyPolicy, vectorized. Returns a hand slot per lane, or -1 to surrender."""
+        hand = self.hand[lanes]
+        slots = np.arange(hand.shape[1])
+        affordable = (slots < self.hand_len[lanes, None]) & (self.card_cost[hand] <= self.p.energy[lanes, None])
+        score = np.where(affordable, self.card_score[hand], np.iinfo(np.int64).min)
+        return np.where(affordable.any(axis=1), score.argmax(axis=1), -1)
+
+    def _apply_attack(self, source: _Side, target: _Side, lanes: np.ndarray, base: np.ndarray) -> np.ndarray:
+        dealt = np.maximum(0, base + source.atk[lanes] - target.dfn[lanes])
+        target.hp[lanes] = np.maximum(0, target.hp[lanes] - dealt)
+        return dealt
+
+    def _condition(self, condition: Condition, sides: Dict[str, _Side], lanes: np.ndarray) -> np.ndarray:
+        values = []
+        for operand in (condition.left, condition.right):
+            if operand.side is None:
+                values.append(operand.value)
+                continue
+            value = getattr(sides[operand.side], _LaneView._FIELDS[operand.stat])[lanes]
+            values.append(value * operand.value if operand.value != 1 else value)
+        return condition.compare(values[0], values[1])
+
+    def _use_utility(self, card: UtilityCard, source: _Side, target: _Side, lanes: np.ndarray) -> None:
+        if not isinstance(card.effect, Effect):
+            names = {id(self.p): self.player_name, id(self.e): self.enemy.name}
+            for lane in lanes.tolist():
+                card.use(_LaneView(source, lane, names[id(source)]), _LaneView(target, lane, names[id(target)]))
+            return
+
+        sides = {"source": source, "target": target}
+        for op in card.effect.ops:
+            rows = lanes
+            if op.condition is not None:
+                rows = rows[self._condition(op.condition, sides, rows)]
+            side = target if op.on_target else source
+            if op.kind is APPLY:
+                k = EFFECT_INDEX[op.status]
+                side.active[rows, k] = True
+                side.dur[rows, k] = op.duration
+                side.amt[rows, k] = op.amount if op.amount is not None else 1
+            else:
+                stat = getattr(side, _LaneView._FIELDS[op.stat])
+                cap = getattr(side, _LaneView._FIELDS[op.cap])
+                stat[rows] = np.minimum(cap[rows], stat[rows] + op.amount)
+
+    def _player_turn(self, lanes: np.ndarray) -> np.ndarray:
+        """Returns the lanes that played a card; the rest surrendered."""
+        self._reset_temporary_stats(self.p, lanes)
+        self._draw(lanes[self.hand_len[lanes] == 0], 3)
+
+        slot = self._choose_cards(lanes)
+        self.surrendered[lanes[slot < 0]] = True
+        lanes, slot = lanes[slot >= 0], slot[slot >= 0]
+
+        card = self.hand[lanes, slot]
+        width = self.hand.shape[1]
+        positions = np.arange(width)
+        source = np.minimum(positions + (positions >= slot[:, None]), width - 1)
+        self.hand[lanes] = np.take_along_axis(self.hand[lanes], source, axis=1)
+        self.hand_len[lanes] -= 1
+
+        acts = self.p.can_act(lanes)
+        lanes_act, card = lanes[acts], card[acts]
+        cost = self.card_cost[card]
+        self.p.energy[lanes_act] -= cost
+        self.energy_spent[lanes_act] += cost
+
+        kind = self.card_kind[card]
+        hit = (kind == ATTACK) | (kind == SCALED_ATTACK)
+        rows, played = lanes_act[hit], card[hit]
+        base = np.where(kind[hit] == SCALED_ATTACK,
+                        (self.p.atk[rows] * self.card_scale[played]).astype(np.int64),
+                        self.card_damage[played])
+        dealt = self._apply_attack(self.p, self.e, rows, base)
+        np.add.at(self.card_damage_total, played, dealt)
+        np.add.at(self.card_hits, played, 1)
+        guard = (kind == DEFENSE) | (kind == SCALED_DEFENSE)
+        rows, played = lanes_act[guard], card[guard]
+        self.p.dfn[rows] += self.card_defense[played] + np.where(
+            kind[guard] == SCALED_DEFENSE, (self.p.dfn[rows] * self.card_scale[played]).astype(np.int64), 0)
+        utility = kind == UTILITY
+        for cid in np.unique(card[utility]).tolist():
+            self._use_utility(self.cards[cid], self.p, self.e, lanes_act[utility & (card == cid)])
+
+        self.discard[lanes_act, self.disc_len[lanes_act]] = card
+        self.disc_len[lanes_act] += 1
+        self._draw(lanes_act, 1)
+
+        self._update_status_effects(self.p, lanes)
+        return lanes
+
+    def _choose_actions(self, lanes: np.ndarray) -> np.ndarray:
+        """Behavior.choose, vectorized: one index into self.actions per lane."""
+        e, p = self.e, self.p
+        sides = {"self": e, "player": p}
+        action = np.full(lanes.size, -1)
+        pending = np.arange(lanes.size)
+        for rule in self.enemy.behavior.rules:
+            if not pending.size:
+                break
+            rows = pending
+            if rule.test is not None:
+                rows = rows[self._condition(rule.condition, sides, lanes[rows])]
+            if len(rule.choices) == 1:
+                picked = np.zeros(rows.size, dtype=np.int64)
+            else:
+                roll = self._random(lanes[rows]) * rule.total
+                picked = np.minimum(np.searchsorted(rule.cumulative, roll, side='right'), len(rule.choices) - 1)
+            for k, choice in enumerate(rule.choices):
+                if choice is None:
+                    continue
+                chosen = rows[picked == k]
+                ids = np.array([self.action_index[id(card)] for card in choice])
+                action[chosen] = ids[0] if len(ids) == 1 else ids[self._randbelow(lanes[chosen], len(ids))]
+            pending = pending[action[pending] < 0]
+        return action
+
+    def _enemy_turn(self, lanes: np.ndarray) -> None:
+        e, p = self.e, self.p
+        action = self._choose_actions(lanes)
+        acts = e.can_act(lanes)
+        for k in np.unique(action[acts]).tolist():
+            rows = lanes[acts & (action == k)]
+            card, kind = self.actions[k], self.action_kind[k]
+            if kind == SCALED_ATTACK:
+                self._apply_attack(e, p, rows, (e.atk[rows] * card.scale).astype(np.int64))
+            elif kind == ATTACK:
+                self._apply_attack(e, p, rows, np.full(rows.size, card.damage, dtype=np.int64))
+            elif kind == SCALED_DEFENSE:
+                e.dfn[rows] += (e.dfn[rows] * card.scale).astype(np.int64) + card.defense
+            elif kind == DEFENSE:
+                e.dfn[rows] += card.defense
+            else:
+                self._use_utility(card, e, p, rows)
+
+        self._update_status_effects(e, lanes)
+
+    def run(self) -> BatchResult:
+        live = np.arange(self.size)
+        while live.size:
+            live = live[self.turns[live] <= self.max_turns]
+            if not live.size:
+                break
+
+            live = self._player_turn(live)
+            won = self.e.hp[live] <= 0
+            self.winner[live[won]] = WIN_PLAYER
+            live = live[~won]
+
+            self._enemy_turn(live)
+            lost = self.p.hp[live] <= 0
+            self.winner[live[lost]] = WIN_ENEMY
+            live = live[~lost]
+            self.turns[live] += 1
+
+        damage = {}
+        for cid, total in enumerate(self.card_damage_total.tolist()):
+            if self.card_hits[cid]:
+                name = self.cards[cid].name
+                damage[name] = damage.get(name, 0) + total
+        return BatchResult(
+            seeds=self.seeds, winner=self.winner, turns=self.turns,
+            player_health=self.p.hp, enemy_health=self.e.hp, energy_spent=self.energy_spent,
+            surrendered=self.surrendered, damage_by_card=damage
+        )
+
+
+def simulate(player: Player, enemy: Enemy, seeds: Sequence[int], max_turns: int = 200) -> BatchResult:
+    return BatchSimulator(player, enemy, seeds, max_turns).run()
+
+
+def run_reference(make_player, make_enemy, seeds: Sequence[int], max_turns: int = 200) -> BatchResult:
+    """
+    Run the same fights one at a time through BattleEngine, for cross-checks.
+    make_player/make_enemy must return fresh objects in the state the batch started from.
+    """
+    rows = []
+    damage: Dict[str, int] = {}
+    for seed in seeds:
+        result = BattleEngine(make_player(), make_enemy(), max_turns=max_turns,
+                              rng=BattleRNG(seed)).run(GreedyPolicy())
+        code = {"player": WIN_PLAYER, "enemy": WIN_ENEMY}.get(result.winner, WIN_NONE)
+        rows.append((code, result.turns, result.player_health, result.enemy_health,
+                     result.energy_spent, result.surrendered))
+        for name, dealt in result.damage_by_card.items():
+            damage[name] = damage.get(name, 0) + dealt
+    columns = list(zip(*rows)) if rows else [()] * 6
+    return BatchResult(
+        seeds=np.array([s & MASK64 for s in seeds], dtype=np.uint64),
+        winner=np.array(columns[0], dtype=np.int64), turns=np.array(columns[1], dtype=np.int64),
+        player_health=np.array(columns[2], dtype=np.int64), enemy_health=np.array(columns[3], dtype=np.int64),
+        energy_spent=np.array(columns[4], dtype=np.int64), surrendered=np.array(columns[5], dtype=bool),
+        damage_by_card=damage
+    )
+
+
+def mismatched_lanes(a: BatchResult, b: BatchResult) -> List[int]:
+    """Lanes whose outcome differs between two runs over the same seeds."""
+    same = ((a.winner == b.winner) & (a.turns == b.turns) & (a.player_health == b.player_health)
+            & (a.enemy_health == b.enemy_health) & (a.energy_spent == b.energy_spent)
+            & (a.surrendered == b.surrendered))
+    return np.flatnonzero(~same).tolist()
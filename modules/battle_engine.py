@@ -0,0 +1,293 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+from .cards import Card, AttackCard, DefenseCard
+from .character import EFFECT_INDEX
+from .player import Player
+from .enemy import Enemy
+from .rng import BattleRNG
+from .replay import ReplayLog, capture_state
+from . import battle_state
+from .battle_state import BattleState
+from .battle_events import (
+    EventStream, CardPlayed, DamageDealt, DefenseGained, StatusApplied, StatusTicked, Victory, Defeat
+)
+
+
+class Policy(ABC):
+    """Decides which card the player plays on each turn of a headless battle."""
+
+    @abstractmethod
+    def choose_card(self, engine: 'BattleEngine') -> Optional[int]:
+        """Return an index into engine.player.hand, or None to surrender."""
+        pass
+
+    def choose_target(self, engine) -> int:
+        """Index into engine.enemies of the enemy to play against (encounters only); the weakest by default."""
+        enemies = engine.enemies
+        return min((i for i, enemy in enumerate(enemies) if enemy.health > 0), key=lambda i: enemies[i].health)
+
+
+class GreedyPolicy(Policy):
+    """Play the hardest-hitting affordable attack, otherwise the first affordable card."""
+
+    @staticmethod
+    def card_score(card: Card) -> int:
+        return card.damage if isinstance(card, AttackCard) else -1
+
+    def choose_card(self, engine: 'BattleEngine') -> Optional[int]:
+        player = engine.player
+        best, best_score = None, None
+        for i, card in enumerate(player.hand):
+            if card.energy_cost > player.energy:
+                continue
+            score = self.card_score(card)
+            if best is None or score > best_score:
+                best, best_score = i, score
+        return best
+
+
+class BattleResult:
+    """Structured outcome of a single battle."""
+
+    def __init__(
+        self,
+        winner: Optional[str],
+        turns: int,
+        player_health: int,
+        enemy_health: int,
+        energy_spent: int,
+        damage_by_card: Dict[str, int],
+        surrendered: bool
+    ):
+        self.winner = winner              # "player", "enemy" or None (surrender / turn limit)
+        self.turns = turns
+        self.player_health = player_health
+        self.enemy_health = enemy_health
+        self.energy_spent = energy_spent
+        self.damage_by_card = damage_by_card
+        self.surrendered = surrendered
+
+    @property
+    def player_won(self) -> bool:
+        return self.winner == "player"
+
+    def to_dict(self) -> dict:
+        return {
+            'winner': self.winner,
+            'turns': self.turns,
+            'player_health': self.player_health,
+            'enemy_health': self.enemy_health,
+            'energy_spent': self.energy_spent,
+            'damage_by_card': dict(self.damage_by_card),
+            'surrendered': self.surrendered
+        }
+
+    def __str__(self):
+        return (f"[Battle] winner={self.winner} | turns={self.turns} | "
+                f"HP {self.player_health} vs {self.enemy_health} | energy={self.energy_spent}")
+
+
+class BattleEngine:
+    """
+    Combat rules for one player against one enemy, with no terminal I/O.
+
+    The turn can be driven step by step (begin_player_turn, play_card,
+    end_player_turn, enemy_turn) by an interactive screen, or run to the
+    end in one call with a Policy. Every battle owns its random stream:
+    all shuffles and enemy decisions draw from `rng`, a BattleRNG seeded
+    with `seed` (random if not given), so the seed alone makes a fight
+    repeatable. With record=True, decisions go to a ReplayLog in `log`.
+    Resolved rules are published as events on `events` (see battle_events).
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        enemy: Enemy,
+        max_turns: int = 200,
+        rng=None,
+        seed: Optional[int] = None,
+        record: bool = False
+    ):
+        self.player = player
+        self.enemy = enemy
+        self.max_turns = max_turns
+        if rng is None:
+            rng = BattleRNG(seed if seed is not None else random.getrandbits(64))
+        self.rng = rng
+        self.seed = getattr(rng, "seed", None)
+        self.log: Optional[ReplayLog] = None
+        if record:
+            if not isinstance(rng, BattleRNG):
+                raise ValueError("Recording a battle requires a BattleRNG")
+            self.log = ReplayLog(self.seed, max_turns, capture_state(player, enemy), rng.draws)
+        self.turn_count = 1
+        self.energy_spent = 0
+        self.damage_by_card: Dict[str, int] = {}
+        self.winner: Optional[str] = None
+        self.surrendered = False
+        self.events = EventStream()
+
+    @property
+    def is_over(self) -> bool:
+        return self.winner is not None or self.surrendered
+
+    def snapshot(self) -> BattleState:
+        """Immutable copy of the fight so far (see battle_state)."""
+        return battle_state.capture(self)
+
+    def restore(self, state: BattleState) -> None:
+        """Roll the fight back (or forward) to a snapshot."""
+        battle_state.restore(self, state)
+
+    def begin_player_turn(self) -> None:
+        self.player.reset_temporary_stats()
+
+        # Clear combo memory
+        self.player.last_card_tag = None
+
+        if not self.player.hand:
+            self.player.draw_cards(3, self.rng)
+
+    def can_play(self, idx: int) -> bool:
+        hand = self.player.hand
+        return 0 <= idx < len(hand) and self.player.energy >= hand[idx].energy_cost
+
+    def play_card(self, idx: int) -> Tuple[Card, bool, object]:
+        """Play player.hand[idx] against the enemy. Returns (card, acted, result)."""
+        if not self.can_play(idx):
+            raise ValueError(f"Card index {idx} cannot be played")
+        card = self.player.hand.pop(idx)
+        acted, result = self.resolve_card(card, self.player, self.enemy)
+        if self.log is not None:
+            self.log.card(idx, self.rng.draws)
+        return card, acted, result
+
+    def end_player_turn(self) -> None:
+        self._update_status_effects(self.player)
+        if self.enemy.health <= 0:
+            self.winner = "player"
+            if self.events.subscribers:
+                self.events.emit(Victory(self.turn_count, self.player, self.enemy))
+
+    def surrender(self) -> None:
+        self.surrendered = True
+        if self.log is not None:
+            self.log.surrender(self.rng.draws)
+
+    def enemy_turn(self) -> Tuple[Card, bool, object]:
+        """Let the enemy pick and resolve its action. Returns (card, acted, result)."""
+        card = self.enemy.get_next_action(self.player, self.rng)
+        acted, result = self.resolve_card(card, self.enemy, self.player)
+        self._update_status_effects(self.enemy)
+        if self.log is not None:
+            self.log.enemy_action(self.enemy.action_id(card), self.rng.draws)
+
+        if self.player.health <= 0:
+            self.winner = "enemy"
+            if self.events.subscribers:
+                self.events.emit(Defeat(self.turn_count, self.player, self.enemy))
+        else:
+            self.turn_count += 1
+        return card, acted, result
+
+    def resolve_card(self, card: Card, source, target) -> Tuple[bool, object]:
+        """Apply a card's cost and effect. Returns (acted, result of card.use)."""
+        watched = bool(self.events.subscribers)
+        if not source.can_act():
+            if watched:
+                self.events.emit(CardPlayed(self.turn_count, source, card, False))
+            return False, None
+
+        is_player = source is self.player
+        if is_player:
+            source.energy -= card.energy_cost
+            self.energy_spent += card.energy_cost
+
+        if watched:
+            self.events.emit(CardPlayed(self.turn_count, source, card, True))
+            # Read before the card changes anything
+            raw = card.base_damage(source) + source.attack if isinstance(card, AttackCard) else None
+            defense_before, target_defense = source.defense, target.defense
+
+        result = card.use(source, target)
+
+        if watched:
+            self._emit_card_result(card, source, target, result, raw, defense_before, target_defense)
+
+        if is_player:
+            source.discard_pile.append(card)
+            source.draw_cards(1, self.rng)
+            if isinstance(card, AttackCard):
+                self.damage_by_card[card.name] = self.damage_by_card.get(card.name, 0) + result
+        return True, result
+
+    def _emit_card_result(self, card: Card, source, target, result, raw, defense_before, target_defense) -> None:
+        turn = self.turn_count
+        if isinstance(card, AttackCard):
+            self.events.emit(DamageDealt(turn, source, target, card, raw, target_defense, result))
+        elif isinstance(card, DefenseCard):
+            self.events.emit(DefenseGained(turn, source, card, defense_before, source.defense))
+        elif isinstance(result, list):  # statuses applied by an Effect program
+            for who, effect, duration in result:
+                amount = who.effect_amount[EFFECT_INDEX[effect]]
+                self.events.emit(StatusApplied(turn, who, effect, duration, amount))
+
+    def _update_status_effects(self, character) -> None:
+        if not self.events.subscribers:
+            character.update_status_effects()
+            return
+        ticks = []
+        character.update_status_effects(ticks)
+        for effect, damage, turns_left in ticks:
+            self.events.emit(StatusTicked(self.turn_count, character, effect, damage, turns_left))
+
+    def run(self, policy: Policy) -> BattleResult:
+        """Fight until someone wins, the policy surrenders or max_turns is reached."""
+        while not self.is_over and self.turn_count <= self.max_turns:
+            self.begin_player_turn()
+            idx = policy.choose_card(self)
+            if idx is None:
+                self.surrender()
+                break
+            self.play_card(idx)
+            self.end_player_turn()
+            if self.winner:
+                break
+            self.enemy_turn()
+
+        result = self.result()
+        self.cleanup()
+        return result
+
+    def result(self) -> BattleResult:
+        return BattleResult(
+            winner=self.winner,
+            turns=self.turn_count,
+            player_health=self.player.health,
+            enemy_health=self.enemy.health,
+            energy_spent=self.energy_spent,
+            damage_by_card=self.damage_by_card,
+            surrendered=self.surrendered
+        )
+
+    def apply_victory(self, xp_threshold: int) -> bool:
+        """Award the enemy's XP. Returns True if the player leveled up."""
+        return self.player.gain_xp(self.enemy.exp_reward, xp_threshold)
+
+    def apply_defeat(self) -> None:
+        """Restore a sliver of health and confiscate money."""
+        self.player.health = 5
+        self.player.money = 0
+
+    def cleanup(self) -> None:
+        """Reset player deck state after battle ends."""
+        self.player.clear_status_effects()
+        self.enemy.clear_status_effects()
+
+        # Restore all cards back into deck
+        self.player.deck.extend(self.player.hand)
+        self.player.deck.extend(self.player.discard_pile)
+        self.player.hand.clear()
+        self.player.discard_pile.clear()
@@ -0,0 +1,146 @@
+"""
+Typed battle events and the stream they are published on.
+
+BattleEngine emits an event for every rule it resolves: the card played, the
+damage dealt or defense gained, each status effect applied or ticked, and the
+final Victory or Defeat. Renderers, loggers and statistics collectors
+subscribe to `engine.events`:
+
+    engine.events.subscribe(lambda event: print(event))
+
+The engine only builds events while someone is subscribed, so an unwatched
+battle pays one truth test per step.
+"""
+from typing import Callable, List, Optional
+
+from .cards import Card
+from .character import Character, StatusEffect
+
+
+class BattleEvent:
+    """Something that happened on turn `turn`."""
+    __slots__ = ('turn',)
+
+    def __init__(self, turn: int):
+        self.turn = turn
+
+    def __repr__(self):
+        fields = [name for cls in type(self).__mro__ for name in getattr(cls, '__slots__', ())]
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in reversed(fields))
+        return f"{type(self).__name__}({args})"
+
+
+class CardPlayed(BattleEvent):
+    """`source` played `card`; acted is False when it was paralyzed and the card fizzled."""
+    __slots__ = ('source', 'card', 'acted')
+
+    def __init__(self, turn: int, source: Character, card: Card, acted: bool):
+        super().__init__(turn)
+        self.source = source
+        self.card = card
+        self.acted = acted
+
+
+class DamageDealt(BattleEvent):
+    """An attack of `raw` damage, reduced by `blocked` defense to `amount`."""
+    __slots__ = ('source', 'target', 'card', 'raw', 'blocked', 'amount')
+
+    def __init__(self, turn: int, source: Character, target: Character, card: Card,
+                 raw: int, blocked: int, amount: int):
+        super().__init__(turn)
+        self.source = source
+        self.target = target
+        self.card = card
+        self.raw = raw
+        self.blocked = blocked
+        self.amount = amount
+
+
+class DefenseGained(BattleEvent):
+    __slots__ = ('character', 'card', 'before', 'after')
+
+    def __init__(self, turn: int, character: Character, card: Card, before: int, after: int):
+        super().__init__(turn)
+        self.character = character
+        self.card = card
+        self.before = before
+        self.after = after
+
+    @property
+    def amount(self) -> int:
+        return self.after - self.before
+
+
+class StatusApplied(BattleEvent):
+    __slots__ = ('character', 'effect', 'duration', 'amount')
+
+    def __init__(self, turn: int, character: Character, effect: StatusEffect, duration: int, amount: int):
+        super().__init__(turn)
+        self.character = character
+        self.effect = effect
+        self.duration = duration
+        self.amount = amount
+
+
+class StatusTicked(BattleEvent):
+    """An effect counted down at the end of a turn; damage is nonzero for POISONED/BURNED."""
+    __slots__ = ('character', 'effect', 'damage', 'turns_left')
+
+    def __init__(self, turn: int, character: Character, effect: StatusEffect, damage: int, turns_left: int):
+        super().__init__(turn)
+        self.character = character
+        self.effect = effect
+        self.damage = damage
+        self.turns_left = turns_left
+
+
+class Victory(BattleEvent):
+    __slots__ = ('player', 'enemy')
+
+    def __init__(self, turn: int, player: Character, enemy: Character):
+        super().__init__(turn)
+        self.player = player
+        self.enemy = enemy
+
+
+class Defeat(BattleEvent):
+    __slots__ = ('player', 'enemy')
+
+    def __init__(self, turn: int, player: Character, enemy: Character):
+        super().__init__(turn)
+        self.player = player
+        self.enemy = enemy
+
+
+Subscriber = Callable[[BattleEvent], None]
+
+
+class EventStream:
+    """Delivers events to subscribers in subscription order."""
+    __slots__ = ('subscribers',)
+
+    def __init__(self):
+        self.subscribers: List[Subscriber] = []
+
+    def subscribe(self, subscriber: Subscriber) -> Subscriber:
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self.subscribers.remove(subscriber)
+
+    def emit(self, event: BattleEvent) -> None:
+        for subscriber in self.subscribers:
+            subscriber(event)
+
+
+class EventRecorder:
+    """Subscriber that keeps every event, optionally only those of some types."""
+
+    def __init__(self, *types: type):
+        self.types: Optional[tuple] = types or None
+        self.events: List[BattleEvent] = []
+
+    def __call__(self, event: BattleEvent) -> None:
+        if self.types is None or isinstance(event, self.types):
+            self.events.append(event)
@@ -1,14 +1,116 @@
-from .cards import Card, AttackCard, DefenseCard, UtilityCard
+from typing import Iterator, List, Optional, Union
+from .cards import DefenseCard, UtilityCard
 from .player import Player
 from .enemy import Enemy, Boss
+from .battle_engine import BattleEngine, Policy, GreedyPolicy
+from .battle_events import BattleEvent, CardPlayed, DamageDealt, DefenseGained, StatusApplied, StatusTicked
+from .battle_state import BattleState
+from .character import Character
+from .encounter import Encounter, EncounterEngine
+from .advisor import Advisor
+from .intent import CardIntent, IntentForecaster
 from utils import clear, ascii_bar
+from utils.clear_terminal import FrameRenderer
+
+
+class TerminalBattleView:
+    """Turns battle events into report lines and writes one turn's worth at a time."""
+
+    def __init__(self, player: Player, screen: FrameRenderer):
+        self.player = player
+        self.screen = screen
+        self.lines: List[str] = []
+        self._renderers = {
+            CardPlayed: self._card_played,
+            DamageDealt: self._damage_dealt,
+            DefenseGained: self._defense_gained,
+            StatusApplied: self._status_applied,
+            StatusTicked: self._status_ticked,
+        }
+
+    def __call__(self, event: BattleEvent) -> None:
+        render = self._renderers.get(type(event))
+        if render is not None:
+            render(event)
+
+    def flush(self) -> None:
+        """Write everything collected since the last flush in a single write."""
+        if self.lines:
+            self.screen.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+
+    def _card_played(self, event: CardPlayed) -> None:
+        source, card = event.source, event.card
+        if source is not self.player:
+            self.lines.append(f"\n🤖 {source.name} uses {card.name}!")
+        if not event.acted:
+            self.lines.append(f"{source.name} cannot act!")
+        elif isinstance(card, UtilityCard):
+            self.lines.append(f"✨ {source.name} uses {card.name} — {card.description}")
+
+    def _damage_dealt(self, event: DamageDealt) -> None:
+        self.lines.append(f"➡️ {event.card.name} would deal {event.raw} damage.")
+        self.lines.append(f"🛡️ {event.target.name} reduces it by {event.blocked} defense.")
+        self.lines.append(f"💥 {event.target.name} takes {event.amount} damage.")
+
+    def _defense_gained(self, event: DefenseGained) -> None:
+        self.lines.append(f"🛡️ {event.card.name} used.")
+        self.lines.append(f"🔰 {event.character.name}'s defense increased: "
+                          f"{event.before} -> {event.after} (+{event.amount})")
+
+    def _status_applied(self, event: StatusApplied) -> None:
+        self.lines.append(f"🌀 {event.character.name} is {event.effect.name} for {event.duration} turns.")
+
+    def _status_ticked(self, event: StatusTicked) -> None:
+        if event.damage:
+            self.lines.append(f"🩸 {event.character.name} takes {event.damage} damage from {event.effect.name}.")
+
 
 class BattleManager:
-    def __init__(self, player: Player, enemy: Enemy, xp_threshold: int):
+    """Interactive terminal screen on top of BattleEngine."""
+
+    def __init__(
+        self,
+        player: Player,
+        enemy: Union[Enemy, Encounter],
+        xp_threshold: int,
+        advisor_budget: Optional[float] = None,
+        forecast_intents: bool = True
+    ):
         self.player = player
         self.enemy = enemy
         self.xp_threshold = xp_threshold
-        self.turn_count = 1
+        if isinstance(enemy, Encounter):
+            self.enemies = enemy.enemies
+            self.engine = EncounterEngine(player, enemy.enemies)
+        else:
+            self.enemies = [enemy]
+            self.engine = BattleEngine(player, enemy)
+        # Turn screens are drawn over each other; report lines and prompts go below them
+        self.screen = FrameRenderer()
+        self.view = self.engine.events.subscribe(TerminalBattleView(player, self.screen))
+        # Card hints (single enemies only): searches for at most `advisor_budget` seconds per turn
+        self.advisor = None
+        if advisor_budget and not isinstance(enemy, Encounter):
+            self.advisor = Advisor(player, enemy, advisor_budget, self.engine.max_turns)
+        # Enemy intent previews (single enemies only), worked out while the player types
+        self.forecaster = None
+        if forecast_intents and not isinstance(enemy, Encounter):
+            self.forecaster = IntentForecaster(player, enemy, self.engine.max_turns)
+
+    @property
+    def is_encounter(self) -> bool:
+        return isinstance(self.engine, EncounterEngine)
+
+    @property
+    def turn_count(self) -> int:
+        return self.engine.turn_count
+
+    def snapshot(self) -> BattleState:
+        return self.engine.snapshot()
+
+    def restore(self, state: BattleState) -> None:
+        self.engine.restore(state)
 
     def start_battle(self) -> bool:
         """Start the battle and return True if player wins."""
@@ -21,121 +123,170 @@ class BattleManager:
         print(f"\n🔔 Battle Start: {self.player.name} vs {enemy_label}!")
         input("Press ENTER to begin…")
 
-        while True:
-            # Player's turn
-            if not self._player_turn():
-                # Player surrendered
-                self._end_battle_cleanup()
-                print("Redirecting to bunker...")
-                return False
-
-            # Check if enemy defeated
-            if self.enemy.health <= 0:
+        for actor in self._turn_order():
+            if actor is self.player:
+                if not self._player_turn():
+                    # Player surrendered
+                    self._end_battle_cleanup()
+                    print("Redirecting to bunker...")
+                    return False
+            else:
+                self._enemy_turn()
+
+            # Check if all enemies are defeated
+            if self.engine.winner == "player":
                 self._handle_victory()
                 self._end_battle_cleanup()
                 return True
 
-            # Enemy's turn
-            if not self._enemy_turn():
-                # Rare case: enemy cannot act? treat as loss
-                self._end_battle_cleanup()
-                print("Redirecting to bunker...")
-                return False
-
             # Check if player is defeated
-            if self.player.health <= 0:
+            if self.engine.winner == "enemy":
                 clear()
                 print(f"\n💀 {self.player.name} has been defeated!")
                 # Restore health and confiscate money
-                self.player.health = 5
-                self.player.money = 0
+                self.engine.apply_defeat()
                 self._end_battle_cleanup()
                 print("Redirecting to bunker...")
                 return False
 
-            self.turn_count += 1
+    def _turn_order(self) -> Iterator[Character]:
+        """Who acts next: the initiative queue in encounters, otherwise player and enemy in turn."""
+        if self.is_encounter:
+            while True:
+                yield self.engine.next_actor()
+        while True:
+            yield self.player
+            yield self.enemy
+
+    def auto_resolve(self, policy: Optional[Policy] = None) -> bool:
+        """
+        Fight instantly with `policy` (GreedyPolicy by default) and show a
+        one-screen summary. XP, defeat penalties and deck cleanup are the same
+        as in start_battle. Returns True if the player wins.
+        """
+        health_before = self.player.health
+        self.engine.events.unsubscribe(self.view)
+        result = self.engine.run(policy or GreedyPolicy())
 
-    def _player_turn(self) -> bool:
         clear()
-        self.player.reset_temporary_stats()
-
-        # Clear combo memory
-        if hasattr(self.player, "last_card_tag"):
-            del self.player.last_card_tag
-
-        if not self.player.hand:
-            self.player.draw_cards(3)
+        print(f"\n⚡ Auto-resolve: {self.player.name} vs {self.enemy.name}")
+        print("=" * 50)
+        leveled = False
+        if result.player_won:
+            print(f"🏆 Victory in {result.turns} turns")
+            leveled = self.engine.apply_victory(self.xp_threshold)
+        elif result.winner == "enemy":
+            print(f"💀 Defeat on turn {result.turns}")
+            self.engine.apply_defeat()
+        elif result.surrendered:
+            print(f"🏳️ Out of energy on turn {result.turns}, retreated")
+        else:
+            print(f"⌛ No winner after {result.turns} turns, retreated")
+        print(f"❤️  HP lost:     {health_before - result.player_health}")
+        print(f"🔋 Energy used: {result.energy_spent}")
+        print(f"✨ XP gained:   {self.enemy.exp_reward if result.player_won else 0}")
+        if leveled:
+            print(f"🎊 Level Up! {self.player.name} is now level {self.player.level}!")
+        print("=" * 50)
+        input("\nPress ENTER to continue…")
+        return result.player_won
 
-        self._render_battle_screen()     
+    def _player_turn(self) -> bool:
+        self.engine.begin_player_turn()
+        self.screen.draw(self._battle_screen())
+        self._show_hint()
+        if self.forecaster is not None:
+            self.forecaster.start(self.player, self.enemy, self.turn_count)
+            prompt = "\nChoose a card number ('?N' to preview, 'q' to surrender): "
+        else:
+            prompt = "\nChoose a card number (or 'q' to surrender): "
 
         while True:
-            choice = input("\nChoose a card number (or 'q' to surrender): ").strip().lower()
+            choice = self.screen.input(prompt).strip().lower()
             if choice == 'q':
+                self._discard_forecast()
+                self.engine.surrender()
                 return False
+            if choice.startswith('?') and self.forecaster is not None:
+                self._show_preview(choice[1:].strip())
+                continue
             if choice.isdigit():
                 idx = int(choice) - 1
                 if 0 <= idx < len(self.player.hand):
-                    card = self.player.hand[idx]
-                    if self.player.energy < card.energy_cost:
-                        print("❌ Not enough energy!")
+                    if not self.engine.can_play(idx):
+                        self.screen.print("❌ Not enough energy!")
                         continue
-                    played = self.player.hand.pop(idx)
-                    self._resolve_card(played, self.player, self.enemy)
-                    input("\nPress ENTER to end your turn...")
-                    break
-            print("Invalid choice—please enter a valid card number or 'q'.")
-
-        # End-of-turn effects
-        self.player.update_status_effects()
-        return True
-
-    def _enemy_turn(self) -> bool:
-        clear()
-        print(f"\n--- Enemy Turn #{self.turn_count} ---")
-        self._render_battle_screen(show_hand=False)
-
-        card = self.enemy.get_next_action(self.player)
-
-        print(f"\n🤖 {self.enemy.name} uses {card.name}!")
-
-        self._resolve_card(card, self.enemy, self.player)
-
-        self.enemy.update_status_effects()
-        input("\nPress ENTER to continue…")
-        return True
-
-    def _resolve_card(self, card: Card, source, target) -> None:
-        if not source.can_act():
-            print(f"{source.name} cannot act!")
+                    if self.is_encounter and not isinstance(self.player.hand[idx], DefenseCard):
+                        self._choose_target()
+                    intent = self.forecaster.get(idx) if self.forecaster is not None else None
+                    self._discard_forecast()
+                    self.engine.play_card(idx)
+                    # End-of-turn effects, reported with the card so a tick that ends the fight is seen
+                    self.engine.end_player_turn()
+                    self.view.flush()
+                    if intent is not None and not intent.wins and self.enemy.health > 0:
+                        self.screen.print(f"\n🔮 Enemy intent: {self._describe_replies(intent)}")
+                    self.screen.input("\nPress ENTER to end your turn...")
+                    return True
+            self.screen.print("Invalid choice—please enter a valid card number or 'q'.")
+
+    def _show_preview(self, choice: str) -> None:
+        idx = int(choice) - 1 if choice.isdigit() else -1
+        if not 0 <= idx < len(self.player.hand):
+            self.screen.print("Invalid card—enter '?' followed by a card number, e.g. '?1'.")
             return
+        intent = self.forecaster.get(idx)
+        if intent is None:
+            self.screen.print("❌ Not enough energy!")
+        elif intent.wins:
+            self.screen.print(f"🔮 {intent.card.name}: deals {intent.damage_dealt} and wins the fight")
+        else:
+            self.screen.print(f"🔮 {intent.card.name}: deals {intent.damage_dealt}; enemy: {self._describe_replies(intent)}")
+            if intent.lethal_chance:
+                self.screen.print(f"☠️  {intent.lethal_chance:.0%} chance this turn is fatal")
+
+    @staticmethod
+    def _describe_replies(intent: CardIntent) -> str:
+        # The same action can come from several branches; merge them by name
+        odds = {}
+        for reply in intent.replies:
+            p, lost = odds.get(reply.action.name, (0.0, 0.0))
+            odds[reply.action.name] = (p + reply.probability,
+                                       lost + reply.probability * (intent.health - reply.player_health))
+        return ", ".join(f"{name} {p:.0%} (~{lost / p:.0f} dmg to you)" for name, (p, lost) in odds.items())
+
+    def _discard_forecast(self) -> None:
+        if self.forecaster is not None:
+            self.forecaster.discard()
+
+    def _choose_target(self) -> None:
+        living = [i for i, enemy in enumerate(self.enemies, 1) if enemy.health > 0]
+        if len(living) < 2:
+            return
+        while True:
+            choice = self.screen.input(f"🎯 Target which enemy? ({', '.join(map(str, living))}): ").strip()
+            if choice.isdigit() and int(choice) in living:
+                self.engine.set_target(int(choice) - 1)
+                return
+            self.screen.print("Invalid target—please enter the number of a standing enemy.")
+
+    def _show_hint(self) -> None:
+        if self.advisor is None:
+            return
+        idx = self.advisor.suggest(self.player, self.enemy, self.turn_count)
+        if idx is not None:
+            self.screen.print(f"💡 Suggested: {idx + 1}. {self.player.hand[idx].name}")
 
-        if isinstance(source, Player):
-            source.energy -= card.energy_cost
-
-        result = card.use(source, target)
-
-        if isinstance(source, Player):
-            source.discard_pile.append(card)
-
-        if isinstance(source, Player):
-            source.draw_cards(1)
-
-        if isinstance(card, AttackCard):
-            raw = card.damage + source.attack
-            reduction = target.defense
-            print(f"➡️ {card.name} would deal {raw} damage.")
-            print(f"🛡️ {target.name} reduces it by {reduction} defense.")
-            print(f"💥 {target.name} takes {result} damage.")
-
-        elif isinstance(card, DefenseCard):
-            before = source.defense - card.defense  # since defense already updated
-            after = source.defense
-            print(f"🛡️ {card.name} used.")
-            print(f"🔰 {source.name}'s defense increased: {before} -> {after} (+{card.defense})")
-        elif isinstance(card, UtilityCard):
-            print(f"✨ {source.name} uses {card.name} — {card.description}")
+    def _enemy_turn(self) -> None:
+        if self.is_encounter:
+            header = f"\n--- Enemy Turn #{self.turn_count}: {self.engine.acting.name} ---\n"
+        else:
+            header = f"\n--- Enemy Turn #{self.turn_count} ---\n"
+        self.screen.draw(header + self._battle_screen(show_hand=False))
 
-        
+        self.engine.enemy_turn()
+        self.view.flush()
+        self.screen.input("\nPress ENTER to continue…")
 
     def _handle_victory(self) -> None:
         clear()
@@ -143,7 +294,7 @@ class BattleManager:
             print(f"\n🎉 You have slain the BOSS: {self.enemy.name}!")
         else:
             print(f"\n🏆 {self.enemy.name} has been defeated!")
-        leveled = self.player.gain_xp(self.enemy.exp_reward, self.xp_threshold)
+        leveled = self.engine.apply_victory(self.xp_threshold)
         print(f"Gained {self.enemy.exp_reward} XP!")
         if leveled:
             print(f"🎊 Level Up! {self.player.name} is now level {self.player.level}!")
@@ -151,44 +302,40 @@ class BattleManager:
 
     def _end_battle_cleanup(self) -> None:
         """Reset player deck state after battle ends."""
-        self.player.status_effects.clear()
-        self.enemy.status_effects.clear()
-
-        # Restore all cards back into deck
-        self.player.deck.extend(self.player.hand)
-        self.player.deck.extend(self.player.discard_pile)
-        self.player.hand.clear()
-        self.player.discard_pile.clear()
+        self.engine.cleanup()
 
-
-    def _render_battle_screen(self, show_hand: bool = True) -> None:
-        print("\n" + "="*50)
-        print(f"🎯 Turn {self.turn_count:^44}")
-        print("="*50)
+    def _battle_screen(self, show_hand: bool = True) -> str:
+        lines = ["\n" + "="*50]
+        lines.append(f"🎯 Turn {self.turn_count:^44}")
+        lines.append("="*50)
 
         # Player Panel 
-        print(f"\n🧍 {self.player.name}")
-        print(ascii_bar("HP", self.player.health, self.player.max_health))
-        print(ascii_bar("EN", self.player.energy, self.player.max_energy, fill_char="*"))
-        status = ", ".join(f"{e.name}({d['duration']})" for e, d in self.player.status_effects.items()) or "None"
-        print(f"Status Effects: {status}")
-        print(f"🛡️  ATK: {self.player.attack} | DEF: {self.player.defense}")
-
-        # Enemy Panel
-        label = f"🚨 BOSS: {self.enemy.name}" if isinstance(self.enemy, Boss) else self.enemy.name
-        print(f"\n🤖 {label}")
-        print(ascii_bar("HP", self.enemy.health, self.enemy.max_health))
-        estatus = ", ".join(f"{e.name}({d['duration']})" for e, d in self.enemy.status_effects.items()) or "None"
-        print(f"Status Effects: {estatus}")
-        print(f"🛡️  ATK: {self.enemy.attack} | DEF: {self.enemy.defense}")
+        lines.append(f"\n🧍 {self.player.name}")
+        lines.append(ascii_bar("HP", self.player.health, self.player.max_health))
+        lines.append(ascii_bar("EN", self.player.energy, self.player.max_energy, fill_char="*"))
+        lines.append(f"Status Effects: {self.player.status_text()}")
+        lines.append(f"🛡️  ATK: {self.player.attack} | DEF: {self.player.defense}")
+
+        # Enemy Panels
+        numbered = len(self.enemies) > 1
+        for i, enemy in enumerate(self.enemies, 1):
+            label = f"🚨 BOSS: {enemy.name}" if isinstance(enemy, Boss) else enemy.name
+            if numbered:
+                label = f"{i}. {label}" + (" ◀ target" if enemy is self.engine.enemy else "")
+                if enemy.health <= 0:
+                    lines.append(f"\n💀 {label} — defeated")
+                    continue
+            lines.append(f"\n🤖 {label}")
+            lines.append(ascii_bar("HP", enemy.health, enemy.max_health))
+            lines.append(f"Status Effects: {enemy.status_text()}")
+            lines.append(f"🛡️  ATK: {enemy.attack} | DEF: {enemy.defense}")
 
         # Hand preview
         if show_hand:
-            print("\n🃏 Cards in Hand:")
+            lines.append("\n🃏 Cards in Hand:")
             for i, card in enumerate(self.player.hand, 1):
                 lock = "🔒" if self.player.energy < card.energy_cost else ""
-                print(f"  {i}. {card.name} (Cost: {card.energy_cost}) {lock} - {card.description}")
-
-        print("="*50)
-
+                lines.append(f"  {i}. {card.name} (Cost: {card.energy_cost}) {lock} - {card.description}")
 
+        lines.append("="*50)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,109 @@
+"""
+Immutable battle state snapshots.
+
+A BattleState is a frozen, hashable value holding everything a fight can
+change: both fighters' stats and status effects, the player's piles, the
+engine's counters and the RNG position. Snapshots are nested tuples, so a
+new state derived with `_replace` shares every part that did not change,
+and two captures of the same deck reuse the same tuple (DrawPile caches its
+snapshot until the pile changes). Copying a state is free: it is a value.
+
+    state = engine.snapshot()     # or battle_manager.snapshot()
+    ...                           # look ahead, play on
+    engine.restore(state)         # roll back
+
+Cards are stored by reference, like in the live piles. The replay log, if
+recording, is not rolled back.
+"""
+from typing import NamedTuple, Optional, Tuple
+
+from .cards import Card
+from .character import Character
+from .draw_pile import DrawPile
+
+EffectState = Tuple[int, Tuple[int, ...], Tuple[int, ...]]
+
+
+class FighterState(NamedTuple):
+    """Stats and status effects of one fighter."""
+    health: int
+    max_health: int
+    base_attack: int
+    base_defense: int
+    attack: int
+    defense: int
+    alive: bool
+    effects: EffectState        # Character.effect_state()
+    last_card_tag: Optional[str]
+
+
+class BattleState(NamedTuple):
+    """Everything that changes during a fight, as one hashable value."""
+    player: FighterState
+    enemy: FighterState
+    energy: int
+    max_energy: int
+    hand: Tuple[Card, ...]
+    deck: Tuple[Card, ...]      # draw order
+    discard_pile: Tuple[Card, ...]
+    turn_count: int
+    energy_spent: int
+    damage_by_card: Tuple[Tuple[str, int], ...]
+    winner: Optional[str]
+    surrendered: bool
+    rng_draws: Optional[int]    # BattleRNG counter, None for other RNGs
+
+
+def fighter_state(character: Character) -> FighterState:
+    return FighterState(
+        character.health, character.max_health, character.base_attack, character.base_defense,
+        character.attack, character.defense, character.alive, character.effect_state(),
+        character.last_card_tag
+    )
+
+
+def restore_fighter(character: Character, state: FighterState) -> None:
+    (character.health, character.max_health, character.base_attack, character.base_defense,
+     character.attack, character.defense, character.alive, effects, character.last_card_tag) = state
+    character.set_effect_state(effects)
+
+
+def capture(engine) -> BattleState:
+    """Snapshot the live fighters, piles and counters of a BattleEngine."""
+    player = engine.player
+    return BattleState(
+        fighter_state(player),
+        fighter_state(engine.enemy),
+        player.energy,
+        player.max_energy,
+        tuple(player.hand),
+        player.deck.snapshot(),
+        tuple(player.discard_pile),
+        engine.turn_count,
+        engine.energy_spent,
+        tuple(engine.damage_by_card.items()),
+        engine.winner,
+        engine.surrendered,
+        getattr(engine.rng, "draws", None)
+    )
+
+
+def restore(engine, state: BattleState) -> None:
+    """Put a BattleEngine and its fighters back into `state`."""
+    player = engine.player
+    restore_fighter(player, state.player)
+    restore_fighter(engine.enemy, state.enemy)
+    player.energy = state.energy
+    player.max_energy = state.max_energy
+    player.hand[:] = state.hand
+    # Rebuilding the pile is the only O(deck) step; skip it when the deck is untouched
+    if player.deck.snapshot() is not state.deck:
+        player.deck = DrawPile(state.deck)
+    player.discard_pile[:] = state.discard_pile
+    engine.turn_count = state.turn_count
+    engine.energy_spent = state.energy_spent
+    engine.damage_by_card = dict(state.damage_by_card)
+    engine.winner = state.winner
+    engine.surrendered = state.surrendered
+    if state.rng_draws is not None:
+        engine.rng.draws = state.rng_draws
@@ -0,0 +1,200 @@
+"""
+Data-driven enemy behavior.
+
+Each enemy type in data/behaviors.json has an action list and an ordered
+rule table:
+
+    "raider": {
+      "actions": { "brace": {"type": "defense", ...}, "slash": {...} },
+      "rules": [
+        { "if": "self.health < self.max_health * 0.4", "pick": [["brace", 0.7], ["slash", 0.3]] },
+        { "pick": [["slash", 1]] }
+      ]
+    }
+
+The first rule whose condition holds (conditions compare `self.<stat>` and
+`player.<stat>`, see effects.parse_condition) picks one option by weight. An
+option is an action id, a list of ids (one is then chosen uniformly), or null
+to fall through to the next rule. Rules with several options draw once from
+the battle RNG; a single option draws nothing.
+
+Tables are compiled once per file into Behavior objects with precomputed
+cumulative weights, so choosing an action is a few comparisons and a bisect.
+"""
+import json
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .cards import Card, card_from_dict
+from .effects import Condition, operand_getter, parse_condition
+from .exceptions import BehaviorError
+
+BEHAVIORS_PATH = "data/behaviors.json"
+SIDES = ("self", "player")
+
+# An option: the actions it picks from uniformly, or None to fall through
+Choice = Optional[Tuple[Card, ...]]
+
+
+class ActionCatalog:
+    """
+    Shared, read-only action cards for one enemy type, resolved by id.
+    Cards scale from the enemy's stats when used, so one instance serves
+    every enemy of the type and no cards are built per turn.
+    """
+
+    def __init__(self, *entries: Tuple[str, Card]):
+        self._cards: Dict[str, Card] = dict(entries)
+        self._ids: Dict[int, str] = {id(card): action_id for action_id, card in entries}
+
+    def __getitem__(self, action_id: str) -> Card:
+        return self._cards[action_id]
+
+    def __iter__(self):
+        return iter(self._cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def id_of(self, card: Card) -> Optional[str]:
+        return self._ids.get(id(card))
+
+
+def _compile_test(condition: Condition) -> Callable:
+    left, right = operand_getter(condition.left, SIDES), operand_getter(condition.right, SIDES)
+    compare = condition.compare
+    return lambda enemy, player: compare(left(enemy, player), right(enemy, player))
+
+
+class BehaviorRule:
+    """One row of a behavior table."""
+    __slots__ = ('condition', 'test', 'choices', 'cumulative', 'total')
+
+    def __init__(self, condition: Optional[Condition], options: List[Tuple[Choice, float]]):
+        self.condition = condition
+        self.test = _compile_test(condition) if condition is not None else None
+        self.choices: Tuple[Choice, ...] = tuple(choice for choice, _ in options)
+        running, cumulative = 0.0, []
+        for _, weight in options:
+            running += weight
+            cumulative.append(running)
+        self.cumulative = tuple(cumulative)
+        self.total = running
+
+    def pick(self, rng) -> Choice:
+        if len(self.choices) == 1:
+            return self.choices[0]
+        index = bisect_right(self.cumulative, rng.random() * self.total)
+        return self.choices[min(index, len(self.choices) - 1)]
+
+    @property
+    def falls_through(self) -> bool:
+        return self.condition is not None or None in self.choices
+
+
+class Behavior:
+    """A compiled behavior table: how one enemy type chooses its actions."""
+
+    def __init__(self, name: str, actions: ActionCatalog, rules: List[BehaviorRule]):
+        self.name = name
+        self.actions = actions
+        self.rules = tuple(rules)
+
+    def choose(self, enemy, player, rng) -> Card:
+        for rule in self.rules:
+            if rule.test is not None and not rule.test(enemy, player):
+                continue
+            choice = rule.pick(rng)
+            if choice is None:
+                continue
+            return choice[0] if len(choice) == 1 else rng.choice(choice)
+        raise BehaviorError(f"Behavior '{self.name}' chose no action")
+
+    def distribution(self, enemy, player) -> List[Tuple[float, Card]]:
+        """The (probability, action) pairs choose() picks between for this position."""
+        outcomes = []
+        mass = 1.0
+        for rule in self.rules:
+            if not mass:
+                break
+            if rule.test is not None and not rule.test(enemy, player):
+                continue
+            carried = 0.0
+            previous = 0.0
+            for choice, cumulative in zip(rule.choices, rule.cumulative):
+                share = mass * (cumulative - previous) / rule.total
+                previous = cumulative
+                if choice is None:
+                    carried += share
+                else:
+                    outcomes.extend((share / len(choice), card) for card in choice)
+            mass = carried
+        return outcomes
+
+    # Tables are immutable and shared by every enemy using them
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"Behavior({self.name!r}, {len(self.actions)} actions, {len(self.rules)} rules)"
+
+
+def _parse_option(name: str, entry, actions: ActionCatalog) -> Tuple[Choice, float]:
+    if not isinstance(entry, list) or len(entry) != 2:
+        raise BehaviorError(f"Behavior '{name}': options are [action, weight] pairs, got {entry!r}")
+    target, weight = entry
+    if not isinstance(weight, (int, float)) or weight <= 0:
+        raise BehaviorError(f"Behavior '{name}': weights must be positive, got {weight!r}")
+    if target is None:
+        return None, weight
+    ids = target if isinstance(target, list) else [target]
+    try:
+        return tuple(actions[action_id] for action_id in ids), weight
+    except KeyError as e:
+        raise BehaviorError(f"Behavior '{name}' picks unknown action {e}")
+
+
+def compile_behavior(name: str, data: dict) -> Behavior:
+    """Compile one table from behaviors.json."""
+    entries = []
+    for action_id, card_data in data.get("actions", {}).items():
+        try:
+            entries.append((action_id, card_from_dict(dict({"cost": 0}, **card_data))))
+        except (KeyError, ValueError) as e:
+            raise BehaviorError(f"Behavior '{name}': bad action '{action_id}': {e}")
+    actions = ActionCatalog(*entries)
+
+    rules = []
+    for row in data.get("rules", []):
+        condition = parse_condition(row["if"], SIDES) if "if" in row else None
+        options = [_parse_option(name, entry, actions) for entry in row.get("pick", [])]
+        if not options:
+            raise BehaviorError(f"Behavior '{name}': every rule needs a 'pick' list")
+        rules.append(BehaviorRule(condition, options))
+    if not rules or rules[-1].falls_through:
+        raise BehaviorError(f"Behavior '{name}' must end with an unconditional rule that always picks")
+    return Behavior(name, actions, rules)
+
+
+_loaded: Dict[str, Dict[str, Behavior]] = {}
+
+
+def load_behaviors(path: str = BEHAVIORS_PATH) -> Dict[str, Behavior]:
+    """Compile every table in a behaviors file, once per path."""
+    behaviors = _loaded.get(path)
+    if behaviors is None:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        behaviors = _loaded[path] = {name.lower(): compile_behavior(name.lower(), table) for name, table in data.items()}
+    return behaviors
+
+
+def get_behavior(name: str, path: str = BEHAVIORS_PATH) -> Behavior:
+    behaviors = load_behaviors(path)
+    try:
+        return behaviors[name.lower()]
+    except KeyError:
+        raise BehaviorError(f"No behavior '{name}' in {path}")
@@ -1,20 +1,27 @@
-import time
 import random
 
+from utils import pause, type_out
 from .npc import NPC
-from .lore_manager import LoreManager
+from .lore_manager import get_lore_manager
 
 class Bot(NPC):
+    SPEECH_CPS = 14    # ARIA's typing speed, in characters per second
+
     def __init__(self):
         super().__init__(name="ARIA")
         self.topics_discussed = set()
-        self.lore_manager = LoreManager("data/lore.json")
+        self.lore_manager = get_lore_manager("data/lore.json")
     
+    def _unused_lore(self):
+        return [entry for entry in self.lore_manager.get_all_entries("ai_random_lore")
+                if entry.trigger not in self.topics_discussed]
+
+    def has_lore_left(self) -> bool:
+        return bool(self._unused_lore())
+
     def share_random_lore(self):
         """Share random lore when player checks inventory or during quiet moments"""
-        all_entries = self.lore_manager.get_all_entries("ai_random_lore")
-        unused_entries = [entry for entry in all_entries 
-                         if entry.trigger not in self.topics_discussed]
+        unused_entries = self._unused_lore()
         
         if unused_entries:
             entry = random.choice(unused_entries)
@@ -24,9 +31,7 @@ class Bot(NPC):
             self.speak("I've shared all the lore I know for now.")
     
     def speak(self, message: str, delay: float = 1.5):
-        print(f"\n[🤖 {self.name}]: ", end="", flush=True)
-        for char in message:
-            print(char, end="", flush=True)
-            time.sleep(0.07)
+        print(f"\n[🤖 {self.name}]: ", end="")
+        type_out(message, Bot.SPEECH_CPS)
         print()
-        time.sleep(delay)
+        pause(delay)
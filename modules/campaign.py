@@ -0,0 +1,310 @@
+"""
+Full-campaign progression simulator for XP and economy tuning.
+
+Plays seeded agents through the whole game loop, one day at a time. Each
+day the agent earns `task_income` dollars (the real-life task rewards), then
+keeps heading out until its session of `fights_per_day` fights is used up:
+
+- buy health potions (HEALTH_POTIONS) to heal, then any shop cards it can
+  afford (SHOP_CARDS), adding them to its deck,
+- stay home when it is below `retreat_health` of max HP and out of money,
+- rest in bed (full energy) and fight the next enemy of the first location
+  it has not cleared, with GreedyPolicy, as auto-resolve would,
+- level up on Player.XP_THRESHOLDS and the location's xp_threshold, picking
+  one of the new CARD_UNLOCKS at random.
+
+Enemies keep their damage between fights and defeats cost all money, as in
+the game. Campaigns run in parallel on every core and the report shows the
+level and money curves, and how long each zone takes to clear:
+
+    python -m modules.campaign --campaigns 2000 --days 30 --task-income 15
+"""
+import argparse
+import copy
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from .balance import fight_seed, get_location_manager, plan_chunks
+from .battle_engine import BattleEngine, GreedyPolicy
+from .encounter import Encounter, EncounterEngine
+from .items import HEALTH_POTIONS, SHOP_CARDS
+from .location import Location, LocationManager
+from .player import Player
+from .rng import BattleRNG
+
+CAMPAIGN_STREAM = -2    # fight_seed enemy index reserved for campaign seeds
+
+
+class CampaignConfig(NamedTuple):
+    """How the simulated players earn, spend and fight."""
+    task_income: int = 15          # dollars earned from tasks each day
+    fights_per_day: int = 10       # fights in one play session
+    retreat_health: float = 0.5    # stay home below this share of max HP
+    buy_cards: bool = True         # spend spare money in the card shop
+    max_turns: int = 200
+
+
+class CampaignPlayer(Player):
+    """A Player that levels up without prompts, picking unlock cards with the campaign RNG."""
+    __slots__ = ('rng',)
+
+    def __init__(self, name: str, rng):
+        super().__init__(name, rng)
+        self.rng = rng
+
+    def level_up(self) -> None:
+        self.advance_level()
+        options = [card for card in Player.CARD_UNLOCKS.get(self.level, []) if card.name not in self.unlocked_cards]
+        if options:
+            card = self.rng.choice(options)
+            self.deck.append(card)
+            self.unlocked_cards.add(card.name)
+
+
+class Campaign:
+    """One agent's playthrough against its own copy of every location."""
+
+    def __init__(self, manager: LocationManager, config: CampaignConfig, seed: int):
+        self.config = config
+        self.rng = BattleRNG(seed)
+        self.player = CampaignPlayer("Simulant", self.rng)
+        self.locations: List[Location] = copy.deepcopy(manager).get_all_locations()
+        self.policy = GreedyPolicy()
+        self.day = 0
+        self.fights = self.wins = self.deaths = 0
+        self.potion_spent = self.card_spent = 0
+        self.stuck = False      # the next location needs a level the agent cannot reach
+        self.cleared_on: Dict[str, int] = {}
+
+    @property
+    def finished(self) -> bool:
+        return self.stuck or len(self.cleared_on) == len(self.locations)
+
+    def next_location(self) -> Optional[Location]:
+        for location in self.locations:
+            if not location.is_completed:
+                if location.level > self.player.level:
+                    self.stuck = True
+                    return None
+                return location
+        return None
+
+    def play_day(self) -> None:
+        self.day += 1
+        self.player.earn_money(self.config.task_income)
+        for _ in range(self.config.fights_per_day):
+            self.shop()
+            if self.player.health < self.player.max_health * self.config.retreat_health:
+                break
+            location = self.next_location()
+            if location is None:
+                break
+            self.player.energy = self.player.max_energy    # rest in bed before heading out
+            self.fight(location)
+
+    def shop(self) -> None:
+        player = self.player
+        # Best HP per dollar first, without wasting a potion on a nearly full bar
+        potions = sorted(HEALTH_POTIONS, key=lambda p: p[1] / p[2])
+        while player.health < player.max_health:
+            missing = player.max_health - player.health
+            affordable = [p for p in potions if p[1] <= player.money]
+            if not affordable:
+                break
+            _, cost, restore = next((p for p in affordable if p[2] <= missing), affordable[0])
+            player.spend_money(cost)
+            self.potion_spent += cost
+            player.health = min(player.max_health, player.health + restore)
+
+        if not self.config.buy_cards or player.health < player.max_health:
+            return
+        for name, cost, _, factory in SHOP_CARDS:
+            if name not in player.unlocked_cards and player.spend_money(cost):
+                player.deck.append(factory())
+                player.unlocked_cards.add(name)
+                self.card_spent += cost
+
+    def fight(self, location: Location) -> None:
+        opponent = location.get_next_enemy()
+        if isinstance(opponent, Encounter):
+            engine = EncounterEngine(self.player, opponent.enemies, self.config.max_turns, self.rng)
+        else:
+            engine = BattleEngine(self.player, opponent, self.config.max_turns, self.rng)
+        result = engine.run(self.policy)
+        self.fights += 1
+        if result.player_won:
+            self.wins += 1
+            engine.apply_victory(location.xp_threshold)
+            location.mark_enemy_defeated(opponent)
+            if location.is_completed:
+                self.cleared_on[location.name] = self.day
+        elif result.winner == "enemy":
+            self.deaths += 1
+            engine.apply_defeat()
+
+
+class CampaignStats:
+    """Per-day curves and per-zone clear days; chunks from different workers merge into it."""
+
+    def __init__(self, days: int, zones: Sequence[str]):
+        self.days = days
+        self.zones = list(zones)
+        self.campaigns = 0
+        self.level = [0] * days          # summed over campaigns, at the end of each day
+        self.money = [0] * days
+        self.cleared = [0] * days        # zones cleared
+        self.clear_days: Dict[str, List[int]] = {zone: [] for zone in zones}
+        self.fights = self.wins = self.deaths = 0
+        self.potion_spent = self.card_spent = 0
+        self.stuck = 0
+
+    def merge(self, other: 'CampaignStats') -> None:
+        self.campaigns += other.campaigns
+        for mine, theirs in ((self.level, other.level), (self.money, other.money), (self.cleared, other.cleared)):
+            for day, value in enumerate(theirs):
+                mine[day] += value
+        for zone, days in other.clear_days.items():
+            self.clear_days[zone].extend(days)
+        self.fights += other.fights
+        self.wins += other.wins
+        self.deaths += other.deaths
+        self.potion_spent += other.potion_spent
+        self.card_spent += other.card_spent
+        self.stuck += other.stuck
+
+    def add(self, campaign: Campaign) -> None:
+        self.campaigns += 1
+        for zone, day in campaign.cleared_on.items():
+            self.clear_days[zone].append(day)
+        self.fights += campaign.fights
+        self.wins += campaign.wins
+        self.deaths += campaign.deaths
+        self.potion_spent += campaign.potion_spent
+        self.card_spent += campaign.card_spent
+        self.stuck += campaign.stuck
+
+    def per_campaign(self, total: float) -> float:
+        return total / self.campaigns if self.campaigns else 0.0
+
+
+def run_chunk(json_path: str, config: CampaignConfig, days: int, seed: int, start: int, count: int) -> CampaignStats:
+    """Play campaigns start..start+count-1 in the current process and return their totals."""
+    manager = get_location_manager(json_path)
+    stats = CampaignStats(days, [location.name for location in manager.get_all_locations()])
+    for index in range(start, start + count):
+        campaign = Campaign(manager, config, fight_seed(seed, 0, CAMPAIGN_STREAM, index))
+        for day in range(days):
+            if not campaign.finished:
+                campaign.play_day()
+            else:
+                campaign.player.earn_money(config.task_income)
+            stats.level[day] += campaign.player.level
+            stats.money[day] += campaign.player.money
+            stats.cleared[day] += len(campaign.cleared_on)
+        stats.add(campaign)
+    return stats
+
+
+def run_campaigns(
+    json_path: str = "data/locations.json",
+    campaigns: int = 1000,
+    days: int = 30,
+    config: CampaignConfig = CampaignConfig(),
+    seed: int = 0,
+    workers: Optional[int] = None
+) -> CampaignStats:
+    """Play `campaigns` seeded campaigns of `days` days each, spread over worker processes."""
+    manager = get_location_manager(json_path)
+    stats = CampaignStats(days, [location.name for location in manager.get_all_locations()])
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    jobs = [(json_path, config, days, seed, start, count) for start, count in plan_chunks(campaigns, max(1, workers))]
+
+    if workers <= 1:
+        for job in jobs:
+            stats.merge(run_chunk(*job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_chunk, *job) for job in jobs]
+            for future in as_completed(futures):
+                stats.merge(future.result())
+    return stats
+
+
+def _percentile(values: Sequence[int], share: float) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def _checkpoint_days(days: int, rows: int = 10) -> List[int]:
+    step = max(1, days // rows)
+    marks = list(range(step, days + 1, step))
+    if marks[-1] != days:
+        marks.append(days)
+    return [1] + marks if marks[0] != 1 else marks
+
+
+def format_report(stats: CampaignStats, config: CampaignConfig) -> str:
+    n = stats.campaigns
+    lines = [f"{n} campaigns of {stats.days} days, ${config.task_income}/day task income, "
+             f"up to {config.fights_per_day} fights/day", ""]
+
+    header = f"{'Day':>4} {'Level':>6} {'Money':>8} {'Zones':>6}"
+    lines += [header, "-" * len(header)]
+    for day in _checkpoint_days(stats.days):
+        i = day - 1
+        lines.append(f"{day:>4} {stats.level[i] / n:>6.2f} {stats.money[i] / n:>8.1f} {stats.cleared[i] / n:>6.2f}")
+
+    header = f"{'Zone':18} {'Cleared':>8} {'Mean day':>9} {'Median':>7} {'P90':>5}"
+    lines += ["", header, "-" * len(header)]
+    for zone in stats.zones:
+        days = stats.clear_days[zone]
+        if days:
+            lines.append(f"{zone:18} {len(days) / n:>7.1%} {sum(days) / len(days):>9.1f} "
+                         f"{_percentile(days, 0.5):>7} {_percentile(days, 0.9):>5}")
+        else:
+            lines.append(f"{zone:18} {0:>7.1%} {'-':>9} {'-':>7} {'-':>5}")
+
+    win_rate = stats.wins / stats.fights if stats.fights else 0.0
+    lines += [
+        "",
+        f"Fights per campaign:  {stats.per_campaign(stats.fights):.1f} ({win_rate:.1%} won)",
+        f"Deaths per campaign:  {stats.per_campaign(stats.deaths):.2f}",
+        f"Spent on potions:     ${stats.per_campaign(stats.potion_spent):.1f}",
+        f"Spent on cards:       ${stats.per_campaign(stats.card_spent):.1f}",
+        f"Stuck below a zone's level: {stats.stuck / n:.1%}",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    defaults = CampaignConfig()
+    parser = argparse.ArgumentParser(description="Simulate whole campaigns for XP and economy tuning.")
+    parser.add_argument("--locations", default="data/locations.json", help="path to locations.json")
+    parser.add_argument("--campaigns", type=int, default=1000, help="number of seeded campaigns")
+    parser.add_argument("--days", type=int, default=30, help="days simulated per campaign")
+    parser.add_argument("--task-income", type=int, default=defaults.task_income,
+                        help="dollars earned from real-life tasks each day")
+    parser.add_argument("--fights-per-day", type=int, default=defaults.fights_per_day,
+                        help="fights in one daily play session")
+    parser.add_argument("--retreat-health", type=float, default=defaults.retreat_health,
+                        help="stay in the bunker below this share of max HP")
+    parser.add_argument("--no-cards", action="store_true", help="never buy cards in the shop")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for every campaign")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--max-turns", type=int, default=200, help="turn limit per fight")
+    args = parser.parse_args(argv)
+
+    config = CampaignConfig(args.task_income, args.fights_per_day, args.retreat_health,
+                            not args.no_cards, args.max_turns)
+    started = time.perf_counter()
+    stats = run_campaigns(args.locations, args.campaigns, args.days, config, args.seed, args.workers)
+    elapsed = time.perf_counter() - started
+
+    print(format_report(stats, config))
+    print(f"\n{stats.campaigns} campaigns in {elapsed:.2f}s ({stats.fights / elapsed:,.0f} fights/s)")
+
+
+if __name__ == "__main__":
+    main()
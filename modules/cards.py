@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
+from .effects import Effect
 
 class CardType(Enum):
     ATTACK  = auto()
@@ -8,6 +9,8 @@ class CardType(Enum):
     UTILITY = auto()
 
 class Card(ABC):
+    __slots__ = ('name', 'energy_cost', 'description')
+
     def __init__(self, name: str, energy_cost: int, description: str):
         self.name = name
         self.energy_cost = energy_cost
@@ -17,20 +20,36 @@ class Card(ABC):
     def use(self, source: 'Character', target: Optional['Character'] = None):
         pass
 
+    @abstractmethod
+    def key(self) -> tuple:
+        """Value identity: two cards with equal keys behave identically."""
+        pass
+
+    @abstractmethod
+    def to_dict(self) -> dict:
+        pass
+
+    def __eq__(self, other):
+        return isinstance(other, Card) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
 class AttackCard(Card):
+    __slots__ = ('damage', 'tags')
+    card_type = CardType.ATTACK
+
     def __init__(self, name: str, energy_cost: int, damage: int, description: str, tags: Optional[list] = None):
         super().__init__(name, energy_cost, description)
         self.damage = damage
-        self.card_type = CardType.ATTACK
         self.tags = tags or []
 
     def use(self, source: 'Character', target: 'Character') -> int:
         # Example synergy: bonus if last card had the same tag
         bonus = 0
-        if hasattr(source, "last_card_tag"):
-            if "strike" in self.tags and source.last_card_tag == "strike":
-                bonus += 2  # combo bonus
-        final_damage = max(0, self.damage + source.attack + bonus - target.defense)
+        if "strike" in self.tags and source.last_card_tag == "strike":
+            bonus += 2  # combo bonus
+        final_damage = max(0, self.base_damage(source) + source.attack + bonus - target.defense)
         target.health = max(0, target.health - final_damage)
 
         # Record this card's tag for synergy next turn
@@ -38,21 +57,135 @@ class AttackCard(Card):
             source.last_card_tag = self.tags[0]
         return final_damage
 
+    def base_damage(self, source: 'Character') -> int:
+        """Card damage before the user's attack stat is added."""
+        return self.damage
+
+    def key(self) -> tuple:
+        return (CardType.ATTACK, self.name, self.energy_cost, self.damage, tuple(self.tags))
+
+    def to_dict(self) -> dict:
+        return {
+            'type': 'attack',
+            'name': self.name,
+            'cost': self.energy_cost,
+            'damage': self.damage,
+            'description': self.description,
+            'tags': list(self.tags)
+        }
+
 
 class DefenseCard(Card):
+    __slots__ = ('defense',)
+    card_type = CardType.DEFENSE
+
     def __init__(self, name: str, energy_cost: int, defense: int, description: str):
         super().__init__(name, energy_cost, description)
         self.defense = defense
-        self.card_type = CardType.DEFENSE
 
-    def use(self, source: 'Character', target: Optional['Character'] = None) -> None:
-        source.defense += self.defense
+    def use(self, source: 'Character', target: Optional['Character'] = None) -> int:
+        gained = self.defense_gain(source)
+        source.defense += gained
+        return gained
+
+    def defense_gain(self, source: 'Character') -> int:
+        return self.defense
+
+    def key(self) -> tuple:
+        return (CardType.DEFENSE, self.name, self.energy_cost, self.defense)
+
+    def to_dict(self) -> dict:
+        return {
+            'type': 'defense',
+            'name': self.name,
+            'cost': self.energy_cost,
+            'defense': self.defense,
+            'description': self.description
+        }
+
+class ScaledAttackCard(AttackCard):
+    """Attack whose base damage is int(source.attack * scale), read when the card is used."""
+    __slots__ = ('scale',)
+
+    def __init__(self, name: str, energy_cost: int, scale: float, description: str, tags: Optional[list] = None):
+        super().__init__(name, energy_cost, 0, description, tags)
+        self.scale = scale
+
+    def base_damage(self, source: 'Character') -> int:
+        return int(source.attack * self.scale)
+
+    def key(self) -> tuple:
+        return (CardType.ATTACK, self.name, self.energy_cost, ('scale', self.scale), tuple(self.tags))
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        del data['damage']
+        data.update(type='scaled_attack', scale=self.scale)
+        return data
+
+
+class ScaledDefenseCard(DefenseCard):
+    """Gain int(source.defense * scale) + bonus defense, read when the card is used."""
+    __slots__ = ('scale',)
+
+    def __init__(self, name: str, energy_cost: int, bonus: int, description: str, scale: float = 1.0):
+        super().__init__(name, energy_cost, bonus, description)
+        self.scale = scale
+
+    def defense_gain(self, source: 'Character') -> int:
+        return int(source.defense * self.scale) + self.defense
+
+    def key(self) -> tuple:
+        return (CardType.DEFENSE, self.name, self.energy_cost, self.defense, ('scale', self.scale))
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        data.update(type='scaled_defense', scale=self.scale)
+        return data
 
 class UtilityCard(Card):
-    def __init__(self, name: str, energy_cost: int, effect: Callable, description: str):
+    """
+    A card whose effect is an effect program (see modules/effects.py), e.g.
+    "apply ATTACK_UP 2 turns amount 2 to source". Text is compiled to an Effect.
+    Plain callables are still accepted, but such cards cannot be pickled or saved.
+    """
+    __slots__ = ('effect',)
+    card_type = CardType.UTILITY
+
+    def __init__(self, name: str, energy_cost: int, effect: Union[str, Effect, Callable], description: str):
         super().__init__(name, energy_cost, description)
-        self.effect = effect
-        self.card_type = CardType.UTILITY
+        self.effect = Effect(effect) if isinstance(effect, str) else effect
+
+    def use(self, source: 'Character', target: Optional['Character'] = None):
+        """Returns what the effect returns: for an Effect, the statuses it applied."""
+        return self.effect(source, target)
+
+    def key(self) -> tuple:
+        return (CardType.UTILITY, self.name, self.energy_cost, self.effect)
+
+    def to_dict(self) -> dict:
+        if not isinstance(self.effect, Effect):
+            raise TypeError(f"Card '{self.name}' has a callable effect and cannot be serialized")
+        return {
+            'type': 'utility',
+            'name': self.name,
+            'cost': self.energy_cost,
+            'effect': self.effect.text,
+            'description': self.description
+        }
+
 
-    def use(self, source: 'Character', target: Optional['Character'] = None) -> None:
-        self.effect(source, target)
\ No newline at end of file
+def card_from_dict(data: dict) -> Card:
+    """Build a card from the dict produced by Card.to_dict (or a data file)."""
+    kind = data['type'].lower()
+    if kind == 'attack':
+        return AttackCard(data['name'], data['cost'], data['damage'], data['description'], tags=data.get('tags'))
+    if kind == 'defense':
+        return DefenseCard(data['name'], data['cost'], data['defense'], data['description'])
+    if kind == 'scaled_attack':
+        return ScaledAttackCard(data['name'], data['cost'], data['scale'], data['description'], tags=data.get('tags'))
+    if kind == 'scaled_defense':
+        return ScaledDefenseCard(data['name'], data['cost'], data['defense'], data['description'], data['scale'])
+    if kind == 'utility':
+        return UtilityCard(data['name'], data['cost'], data['effect'], data['description'])
+    raise ValueError(f"Unknown card type '{data['type']}'")
@@ -1,8 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from enum import Enum, auto
 import random
-from .cards import Card
 
 class StatusEffect(Enum):
     POISONED   = auto()
@@ -11,15 +10,39 @@ class StatusEffect(Enum):
     ATTACK_UP  = auto()
     DEFENSE_UP = auto()
 
+# Effects are stored by index in fixed-size arrays; bit i of a mask is EFFECTS[i]
+EFFECTS = tuple(StatusEffect)
+EFFECT_INDEX = {eff: i for i, eff in enumerate(EFFECTS)}
+EFFECT_BIT = {eff: 1 << i for i, eff in enumerate(EFFECTS)}
+
+ATTACK_UP_INDEX = EFFECT_INDEX[StatusEffect.ATTACK_UP]
+DEFENSE_UP_INDEX = EFFECT_INDEX[StatusEffect.DEFENSE_UP]
+PARALYZED_BIT = EFFECT_BIT[StatusEffect.PARALYZED]
+DAMAGE_OVER_TIME_MASK = EFFECT_BIT[StatusEffect.POISONED] | EFFECT_BIT[StatusEffect.BURNED]
+NO_EFFECTS = (0, (0,) * len(EFFECTS), (0,) * len(EFFECTS))
+
 class Character(ABC):
+    __slots__ = (
+        'name', 'max_health', 'health', 'alive',
+        'effect_mask', 'effect_duration', 'effect_amount', 'attack_bonus', 'defense_bonus', '_status_text',
+        'base_attack', 'base_defense', 'attack', 'defense', 'speed', 'last_card_tag'
+    )
+
     def __init__(self, name: str, health: int):
         self.name = name
         self.max_health = health
         self.health = health
         self.alive = True
 
-        # status_effects maps effect → {'duration': int, 'amount': int}
-        self.status_effects: Dict[StatusEffect, Dict[str,int]] = {}
+        # Status effects: bit i of effect_mask is set while EFFECTS[i] is active,
+        # with its turns left and amount at index i of the arrays
+        self.effect_mask = 0
+        self.effect_duration: List[int] = [0] * len(EFFECTS)
+        self.effect_amount: List[int] = [0] * len(EFFECTS)
+        # Active ATTACK_UP/DEFENSE_UP amounts, kept in step with the arrays
+        self.attack_bonus = 0
+        self.defense_bonus = 0
+        self._status_text: Optional[str] = None
 
         # Base stats
         self.base_attack = 10
@@ -27,6 +50,11 @@ class Character(ABC):
         # Current stats
         self.attack = self.base_attack
         self.defense = self.base_defense
+        # Initiative in multi-enemy encounters: higher acts more often
+        self.speed = 10
+
+        # Tag of the last card played this turn, for combo synergies
+        self.last_card_tag: Optional[str] = None
 
         
    
@@ -42,49 +70,116 @@ class Character(ABC):
         - For ATTACK_UP/DEFENSE_UP, `amount` is the buff magnitude.
         - For POISONED/BURNED, `amount` is damage per turn (default 1).
         """
-        self.status_effects[effect] = {
-            'duration': duration,
-            'amount': amount if amount is not None else 1
-        }
+        i = EFFECT_INDEX[effect]
+        amount = amount if amount is not None else 1
+        self.effect_mask |= 1 << i
+        self.effect_duration[i] = duration
+        self.effect_amount[i] = amount
+        if i == ATTACK_UP_INDEX:
+            self.attack_bonus = amount
+        elif i == DEFENSE_UP_INDEX:
+            self.defense_bonus = amount
+        self._status_text = None
+
+    def has_effect(self, effect: StatusEffect) -> bool:
+        return bool(self.effect_mask & EFFECT_BIT[effect])
+
+    def clear_status_effects(self) -> None:
+        self.effect_mask = 0
+        self.attack_bonus = self.defense_bonus = 0
+        self._status_text = None
+
+    def effect_state(self) -> Tuple[int, Tuple[int, ...], Tuple[int, ...]]:
+        """Hashable (mask, durations, amounts); slots of inactive effects read 0."""
+        mask = self.effect_mask
+        if not mask:
+            return NO_EFFECTS
+        bits = [mask >> i & 1 for i in range(len(EFFECTS))]
+        return (
+            mask,
+            tuple(d if b else 0 for d, b in zip(self.effect_duration, bits)),
+            tuple(a if b else 0 for a, b in zip(self.effect_amount, bits))
+        )
+
+    def set_effect_state(self, state: Tuple[int, Tuple[int, ...], Tuple[int, ...]]) -> None:
+        """Restore effects saved by effect_state."""
+        mask, durations, amounts = state
+        self.effect_mask = mask
+        self.effect_duration[:] = durations
+        self.effect_amount[:] = amounts
+        self.attack_bonus = amounts[ATTACK_UP_INDEX]
+        self.defense_bonus = amounts[DEFENSE_UP_INDEX]
+        self._status_text = None
+
+    def active_effects(self) -> Iterator[Tuple[StatusEffect, int, int]]:
+        """Yield (effect, turns left, amount) for each active effect."""
+        mask = self.effect_mask
+        while mask:
+            i = (mask & -mask).bit_length() - 1
+            mask &= mask - 1
+            yield EFFECTS[i], self.effect_duration[i], self.effect_amount[i]
+
+    @property
+    def status_effects(self) -> Dict[StatusEffect, Dict[str, int]]:
+        """Snapshot of active effects as effect -> {'duration', 'amount'}."""
+        return {eff: {'duration': duration, 'amount': amount} for eff, duration, amount in self.active_effects()}
+
+    def status_text(self) -> str:
+        """'NAME(turns), ...' for the battle screen, rebuilt only after effects change."""
+        if self._status_text is None:
+            self._status_text = ", ".join(f"{eff.name}({duration})" for eff, duration, _ in self.active_effects()) or "None"
+        return self._status_text
 
     def reset_temporary_stats(self) -> None:
         """
         Reset to base stats, then apply any active ATTACK_UP/DEFENSE_UP buffs.
         Call at start of each turn.
         """
-        self.attack = self.base_attack
-        self.defense = self.base_defense
+        self.attack = self.base_attack + self.attack_bonus
+        self.defense = self.base_defense + self.defense_bonus
 
-        for eff, data in self.status_effects.items():
-            if eff == StatusEffect.ATTACK_UP:
-                self.attack += data['amount']
-            elif eff == StatusEffect.DEFENSE_UP:
-                self.defense += data['amount']
-
-    def update_status_effects(self) -> None:
+    def update_status_effects(self, ticks: Optional[list] = None) -> None:
         """
         Tick down every effect. For POISONED/BURNED, apply damage first.
         Remove any whose duration reaches zero. Call at end of each turn.
+        If `ticks` is given, (effect, damage dealt, turns left) is appended
+        for every effect that ticked.
         """
-        to_remove = []
-        for eff, data in self.status_effects.items():
+        mask = self.effect_mask
+        if mask:
             # Debuff damage
-            if eff == StatusEffect.POISONED or eff == StatusEffect.BURNED:
-                self.health = max(0, self.health - data['amount'])
+            dot = mask & DAMAGE_OVER_TIME_MASK
+            dealt = [0] * len(EFFECTS) if ticks is not None else None
+            while dot:
+                i = (dot & -dot).bit_length() - 1
+                dot &= dot - 1
+                health = max(0, self.health - self.effect_amount[i])
+                if dealt is not None:
+                    dealt[i] = self.health - health
+                self.health = health
 
             # Tick down
-            data['duration'] -= 1
-            if data['duration'] <= 0:
-                to_remove.append(eff)
-
-        for eff in to_remove:
-            del self.status_effects[eff]
+            durations = self.effect_duration
+            while mask:
+                bit = mask & -mask
+                mask ^= bit
+                i = bit.bit_length() - 1
+                durations[i] -= 1
+                if dealt is not None:
+                    ticks.append((EFFECTS[i], dealt[i], max(0, durations[i])))
+                if durations[i] <= 0:
+                    self.effect_mask ^= bit
+                    if i == ATTACK_UP_INDEX:
+                        self.attack_bonus = 0
+                    elif i == DEFENSE_UP_INDEX:
+                        self.defense_bonus = 0
+            self._status_text = None
 
         # Update alive status
         self.alive = self.health > 0
 
     def can_act(self) -> bool:
-        return self.alive and StatusEffect.PARALYZED not in self.status_effects
+        return self.alive and not self.effect_mask & PARALYZED_BIT
 
     def is_alive(self) -> bool:
         return self.health > 0
@@ -97,8 +192,8 @@ class Character(ABC):
             'attack': self.attack,
             'defense': self.defense,
             'status_effects': {
-                eff.name: (data['amount'], data['duration'])
-                for eff, data in self.status_effects.items()
+                eff.name: (amount, duration)
+                for eff, duration, amount in self.active_effects()
             }
         }
     
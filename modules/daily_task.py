@@ -4,6 +4,7 @@ from .task_base import Task, TaskStatus
 
 class DailyTask(Task):
     """Daily recurring task that resets every day"""
+    __slots__ = ('last_completed_date', 'reset_hour')
     
     def __init__(self, task_id: str, title: str, description: str = "", 
                  reset_hour: int = 0):
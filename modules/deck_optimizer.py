@@ -0,0 +1,323 @@
+"""
+Deck optimizer: local search over deck compositions for one location.
+
+Candidate decks are drawn from a card pool (the player's deck plus the
+CardItems in their inventory). Each candidate is scored by seeded GreedyPolicy
+fights against every opponent of the location and its boss, spread over
+worker processes. Every candidate fights the same seeds, so score differences
+come from the deck rather than the dice, and scores are cached by deck
+composition, so a deck is never evaluated twice.
+
+The search hill-climbs from the current deck through single-card adds,
+removals and swaps, and kicks the best deck found with a few random swaps
+whenever it gets stuck, until the time budget runs out:
+
+    python -m modules.deck_optimizer --location 2 --level 2 --pool Lunge --pool Fortify --budget 10
+"""
+import argparse
+import os
+import random
+import time
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .balance import BOSS_INDEX, build_player, fight_seed, get_location_manager, matchup_engine, unlock_card_names
+from .battle_engine import GreedyPolicy
+from .cards import Card
+from .player import Player
+from .rng import BattleRNG
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# Counts of each distinct pool card, in pool order
+Composition = Tuple[int, ...]
+
+HAND_SIZE = 3   # begin_player_turn draws three cards
+
+
+class PlayerProfile(NamedTuple):
+    """The stats a simulated player fights with; decks are scored at full health and energy."""
+    level: int
+    max_health: int
+    base_attack: int
+    base_defense: int
+    max_energy: int
+
+    @classmethod
+    def of(cls, player: Player) -> 'PlayerProfile':
+        return cls(player.level, player.max_health, player.base_attack, player.base_defense, player.max_energy)
+
+
+class DeckScore(NamedTuple):
+    wins: int
+    fights: int
+    health_left: int
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.fights if self.fights else 0.0
+
+    @property
+    def value(self) -> Tuple[float, float]:
+        """Ordering key: win rate, then HP left per fight."""
+        return self.win_rate, self.health_left / self.fights if self.fights else 0.0
+
+
+def _simulant(profile: PlayerProfile) -> Player:
+    player = Player("Simulant")
+    player.level = profile.level
+    player.max_health = profile.max_health
+    player.base_attack = profile.base_attack
+    player.base_defense = profile.base_defense
+    player.max_energy = profile.max_energy
+    return player
+
+
+def _prepare(player: Player, cards: Sequence[Card], rng) -> None:
+    """Reset the simulant to full strength holding a freshly shuffled copy of `cards`."""
+    player.health = player.max_health
+    player.alive = True
+    player.energy = player.max_energy
+    player.attack, player.defense = player.base_attack, player.base_defense
+    player.clear_status_effects()
+    deck = list(cards)
+    rng.shuffle(deck)
+    player.deck = deck
+    player.hand = []
+    player.discard_pile = []
+
+
+def score_deck(
+    json_path: str,
+    loc_id: int,
+    profile: PlayerProfile,
+    cards: Sequence[Card],
+    fights: int,
+    seed: int,
+    max_turns: int
+) -> DeckScore:
+    """Fight every opponent and the boss of a location `fights` times with `cards`."""
+    location = get_location_manager(json_path).locations[loc_id]
+    matchups = [*enumerate(location.opponents), (BOSS_INDEX, location.boss)]
+    player = _simulant(profile)
+    policy = GreedyPolicy()
+
+    wins = health_left = 0
+    for enemy_index, opponent in matchups:
+        for fight in range(fights):
+            rng = BattleRNG(fight_seed(seed, loc_id, enemy_index, fight))
+            _prepare(player, cards, rng)
+            result = matchup_engine(player, opponent, max_turns, rng).run(policy)
+            wins += result.player_won
+            health_left += result.player_health
+    return DeckScore(wins, fights * len(matchups), health_left)
+
+
+class DeckOptimizer:
+    """
+    Searches decks built from `pool` for the best score at location `loc_id`.
+    Deck sizes stay between min_size and max_size (default: the whole pool).
+    """
+
+    def __init__(
+        self,
+        pool: Sequence[Card],
+        profile: PlayerProfile,
+        loc_id: int,
+        json_path: str = "data/locations.json",
+        fights: int = 20,
+        seed: int = 0,
+        workers: Optional[int] = None,
+        max_turns: int = 200,
+        min_size: int = HAND_SIZE,
+        max_size: Optional[int] = None
+    ):
+        # Equal cards behave identically, so a deck is a count per distinct card
+        self.kinds: List[Card] = []
+        available: Dict[Card, int] = {}
+        for card in pool:
+            if card not in available:
+                self.kinds.append(card)
+            available[card] = available.get(card, 0) + 1
+        self.available: Composition = tuple(available[card] for card in self.kinds)
+
+        self.profile = profile
+        self.loc_id = loc_id
+        self.json_path = json_path
+        self.fights = fights
+        self.seed = seed
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.max_turns = max_turns
+        self.min_size = min_size
+        self.max_size = max_size if max_size is not None else len(pool)
+        self.cache: Dict[Composition, DeckScore] = {}
+        self.space = self._count_decks()
+        self._rng = random.Random(seed)
+
+    def _count_decks(self) -> int:
+        """How many compositions the size limits allow."""
+        ways = [1]     # ways[n]: compositions of n cards over the kinds so far
+        for limit in self.available:
+            grown = [0] * (len(ways) + limit)
+            for n, count in enumerate(ways):
+                for extra in range(limit + 1):
+                    grown[n + extra] += count
+            ways = grown
+        return sum(ways[self.min_size:self.max_size + 1])
+
+    def composition(self, cards: Sequence[Card]) -> Composition:
+        counts = {card: 0 for card in self.kinds}
+        for card in cards:
+            counts[card] += 1
+        return tuple(counts[card] for card in self.kinds)
+
+    def cards(self, composition: Composition) -> List[Card]:
+        return [card for card, count in zip(self.kinds, composition) for _ in range(count)]
+
+    def evaluate(self, compositions: Sequence[Composition], pool: Optional['ProcessPoolExecutor'] = None) -> None:
+        """Score every composition not already in the cache, in parallel when a pool is given."""
+        pending = [c for c in dict.fromkeys(compositions) if c not in self.cache]
+        jobs = [(self.json_path, self.loc_id, self.profile, self.cards(c), self.fights, self.seed, self.max_turns)
+                for c in pending]
+        if pool is None:
+            scores = [score_deck(*job) for job in jobs]
+        else:
+            scores = pool.map(score_deck, *zip(*jobs)) if jobs else []
+        self.cache.update(zip(pending, scores))
+
+    def neighbors(self, composition: Composition) -> List[Composition]:
+        """Every deck one add, removal or swap away that respects the size limits."""
+        size = sum(composition)
+        removable = [i for i, count in enumerate(composition) if count]
+        addable = [i for i, count in enumerate(composition) if count < self.available[i]]
+        found = []
+        if size > self.min_size:
+            found += [self._shift(composition, i, None) for i in removable]
+        if size < self.max_size:
+            found += [self._shift(composition, None, j) for j in addable]
+        found += [self._shift(composition, i, j) for i in removable for j in addable if i != j]
+        return found
+
+    @staticmethod
+    def _shift(composition: Composition, out: Optional[int], into: Optional[int]) -> Composition:
+        counts = list(composition)
+        if out is not None:
+            counts[out] -= 1
+        if into is not None:
+            counts[into] += 1
+        return tuple(counts)
+
+    def _kick(self, composition: Composition, swaps: int = 2) -> Composition:
+        for _ in range(swaps):
+            moves = self.neighbors(composition)
+            if not moves:
+                break
+            composition = self._rng.choice(moves)
+        return composition
+
+    def optimize(self, start: Sequence[Card], budget: float = 10.0, progress=None) -> 'OptimizerResult':
+        """
+        Best deck found from `start` within about `budget` seconds. Each step
+        scores one batch of neighbors, so the search may overrun the budget by
+        one batch. progress(best score, decks evaluated) is called after each step.
+        """
+        deadline = time.perf_counter() + budget
+        batch = max(1, self.workers) * 2
+        initial = self.composition(start)
+        pool = None
+        if self.workers > 1:
+            from concurrent.futures import ProcessPoolExecutor    # slow import, only needed here
+            pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            self.evaluate([initial], pool)
+            best = current = initial
+            untried = self._shuffled(self.neighbors(current))
+            while time.perf_counter() < deadline and len(self.cache) < self.space:
+                if not untried:
+                    # Local optimum: restart from a perturbed copy of the best deck
+                    current = self._kick(best)
+                    self.evaluate([current], pool)
+                    untried = self._shuffled(self.neighbors(current))
+                    if not untried:
+                        break
+                    continue
+                step, untried = untried[:batch], untried[batch:]
+                self.evaluate(step, pool)
+                leader = max(step, key=lambda c: self.cache[c].value)
+                if self.cache[leader].value > self.cache[current].value:
+                    current = leader
+                    untried = self._shuffled(self.neighbors(current))
+                    if self.cache[current].value > self.cache[best].value:
+                        best = current
+                if progress is not None:
+                    progress(self.cache[best], len(self.cache))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return OptimizerResult(self.cards(best), self.cache[best], self.cache[initial], len(self.cache))
+
+    def _shuffled(self, compositions: List[Composition]) -> List[Composition]:
+        # Cached neighbors cost nothing, so they go first
+        self._rng.shuffle(compositions)
+        compositions.sort(key=lambda c: c not in self.cache)
+        return compositions
+
+
+class OptimizerResult(NamedTuple):
+    deck: List[Card]
+    score: DeckScore
+    baseline: DeckScore     # the starting deck's score
+    evaluated: int          # distinct decks scored
+
+
+def optimize_deck(
+    player: Player,
+    loc_id: int,
+    json_path: str = "data/locations.json",
+    budget: float = 10.0,
+    fights: int = 20,
+    workers: Optional[int] = None,
+    progress=None
+) -> OptimizerResult:
+    """Search the player's deck plus the cards in their inventory for the best deck at `loc_id`."""
+    from .items import CardItem
+
+    inventory = [item.card for item in player.inventory_manager.get_items_by_type(CardItem)]
+    optimizer = DeckOptimizer([*player.deck, *inventory], PlayerProfile.of(player), loc_id,
+                              json_path, fights=fights, workers=workers)
+    return optimizer.optimize(list(player.deck), budget, progress)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Search for the best deck against one location.")
+    parser.add_argument("--locations", default="data/locations.json", help="path to locations.json")
+    parser.add_argument("--location", type=int, default=1, help="location id to optimize for")
+    parser.add_argument("--level", type=int, default=1, help="player level (stat growth only)")
+    parser.add_argument("--pool", action="append", default=[], metavar="CARD",
+                        help=f"add an unlock card to the pool ({', '.join(unlock_card_names())})")
+    parser.add_argument("--budget", type=float, default=10.0, help="search time in seconds")
+    parser.add_argument("--fights", type=int, default=20, help="seeded fights per opponent per deck")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for every fight")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    player = build_player(args.level)
+    unlockable = {card.name: card for cards in Player.CARD_UNLOCKS.values() for card in cards}
+    unknown = [name for name in args.pool if name not in unlockable]
+    if unknown:
+        parser.error(f"unknown card(s): {', '.join(unknown)}")
+    extra = [unlockable[name] for name in args.pool]
+    optimizer = DeckOptimizer([*player.deck, *extra], PlayerProfile.of(player), args.location,
+                              args.locations, args.fights, args.seed, args.workers)
+    started = time.perf_counter()
+    result = optimizer.optimize(list(player.deck), args.budget)
+    elapsed = time.perf_counter() - started
+
+    print(f"Starting deck: {result.baseline.win_rate:6.1%} wins over {result.baseline.fights} fights")
+    print(f"Best deck:     {result.score.win_rate:6.1%} wins, {result.evaluated} decks in {elapsed:.1f}s\n")
+    for card in sorted(result.deck, key=lambda c: c.name):
+        print(f"  {card.name} (Cost: {card.energy_cost})")
+
+
+if __name__ == "__main__":
+    main()
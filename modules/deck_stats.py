@@ -0,0 +1,335 @@
+"""
+Deck analytics for the deck preview and for tools.
+
+analyze_deck() describes a freshly shuffled deck played with GreedyPolicy:
+
+- the chance each card name has been drawn within k turns, under the
+  unique-name rule of Player.draw_cards,
+- damage and defense per energy point, for each card and for the deck,
+- the chance of an energy stall (no affordable card, so the player must
+  retreat) within k turns, starting from `max_energy`.
+
+Draw and stall chances are exact: the turns are walked as a distribution
+over piles (solver.DrawModel) plus energy. Decks of more than
+EXACT_MAX_CARDS cards, or with too many reachable positions, fall back to
+seeded sampling, flagged by `exact=False`. The exact walk of a starter deck
+with a few unlocks takes a few seconds, so menus call prefetch() before
+waiting for input; results are cached by deck composition, and opening the
+preview costs a dict lookup.
+
+    prefetch(player.deck, player.max_energy, player.base_attack)    # before input()
+    stats = analyze_deck(player.deck, player.max_energy, player.base_attack)
+    stats.draw_chance["Heavy Blow"][2]     # drawn within 3 turns
+"""
+import random
+import threading
+from collections import Counter
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from .battle_engine import GreedyPolicy
+from .cards import AttackCard, Card, DefenseCard
+from .effects import Effect, RESTORE
+from .player import Player
+from .solver import DrawModel
+
+HAND_SIZE = 3
+EXACT_MAX_CARDS = 11     # larger decks are sampled straight away; most 12-card walks overflow MAX_STATES
+MAX_STATES = 50000       # reachable positions per turn before sampling takes over
+SAMPLES = 2000
+SAMPLE_CARDS = 200000    # cards shuffled in all; large decks get fewer games
+
+
+class CardStats(NamedTuple):
+    name: str
+    count: int
+    cost: int
+    damage_per_energy: float     # card damage plus the player's attack, per energy
+    defense_per_energy: float
+
+
+class DeckAnalytics(NamedTuple):
+    size: int
+    turns: int
+    cards: Tuple[CardStats, ...]
+    damage_per_energy: float     # playing through the whole deck once
+    defense_per_energy: float
+    draw_chance: Dict[str, Tuple[float, ...]]   # name -> P(drawn within k turns), k = 1..turns
+    stall_chance: Tuple[float, ...]             # P(stalled within k turns), k = 1..turns
+    exact: bool
+
+
+def energy_restored(card: Card) -> int:
+    """Energy an unconditional 'restore energy N to source' program gives back."""
+    effect = getattr(card, 'effect', None)
+    if not isinstance(effect, Effect):
+        return 0
+    return sum(op.amount for op in effect.ops
+               if op.kind is RESTORE and op.stat == "energy" and not op.on_target and op.condition is None)
+
+
+def _per_energy(amount: int, cost: int) -> float:
+    return amount / cost if cost else float(amount)
+
+
+def _card_stats(card: Card, count: int, attack: int) -> CardStats:
+    damage = card.damage + attack if isinstance(card, AttackCard) else 0
+    defense = card.defense if isinstance(card, DefenseCard) else 0
+    return CardStats(card.name, count, card.energy_cost,
+                     _per_energy(damage, card.energy_cost), _per_energy(defense, card.energy_cost))
+
+
+_analyses: Dict[tuple, DeckAnalytics] = {}
+_pending: Dict[tuple, threading.Thread] = {}
+_lock = threading.Lock()
+
+
+def _key(counts: Counter, max_energy: int, attack: int, turns: int) -> tuple:
+    return frozenset(counts.items()), max_energy, attack, turns
+
+
+def analyze_deck(cards: Sequence[Card], max_energy: int, attack: int = 0, turns: int = 10) -> DeckAnalytics:
+    """Analytics for a deck holding `cards` (in any order), cached by composition."""
+    counts = Counter(cards)
+    key = _key(counts, max_energy, attack, turns)
+    analysis = _analyses.get(key)
+    if analysis is None:
+        with _lock:
+            thread = _pending.get(key)
+        if thread is not None:
+            thread.join()    # a prefetch is already on it
+            analysis = _analyses.get(key)
+        if analysis is None:
+            analysis = _analyses[key] = _analyze(counts, max_energy, attack, turns)
+    return analysis
+
+
+def prefetch(cards: Sequence[Card], max_energy: int, attack: int = 0, turns: int = 10) -> None:
+    """Start analyze_deck() for this deck on a background thread, unless it is cached or under way."""
+    counts = Counter(cards)
+    key = _key(counts, max_energy, attack, turns)
+    with _lock:
+        if key in _analyses or key in _pending:
+            return
+        thread = _pending[key] = threading.Thread(
+            target=_prefetched, args=(key, counts, max_energy, attack, turns), daemon=True)
+        thread.start()
+
+
+def _prefetched(key: tuple, counts: Counter, max_energy: int, attack: int, turns: int) -> None:
+    try:
+        _analyses[key] = _analyze(counts, max_energy, attack, turns)
+    finally:
+        with _lock:
+            del _pending[key]
+
+
+def _analyze(counts: Counter, max_energy: int, attack: int, turns: int) -> DeckAnalytics:
+    kinds: List[Card] = list(counts)
+    spent = sum(card.energy_cost * n for card, n in counts.items())
+    damage = sum((card.damage + attack) * n for card, n in counts.items() if isinstance(card, AttackCard))
+    defense = sum(card.defense * n for card, n in counts.items() if isinstance(card, DefenseCard))
+
+    exact = sum(counts.values()) <= EXACT_MAX_CARDS
+    if exact:
+        try:
+            draw_chance, stall_chance = _walk(kinds, counts, max_energy, turns)
+        except _TooManyStates:
+            exact = False
+    if not exact:
+        draw_chance, stall_chance = _sample(kinds, counts, max_energy, turns)
+
+    return DeckAnalytics(
+        sum(counts.values()), turns,
+        tuple(_card_stats(card, counts[card], attack) for card in kinds),
+        _per_energy(damage, spent), _per_energy(defense, spent),
+        draw_chance, stall_chance, exact
+    )
+
+
+class _TooManyStates(Exception):
+    pass
+
+
+def _greedy(hand: Sequence[Card], energy: int):
+    """GreedyPolicy's pick: hand index of the first highest-scoring affordable card, or None."""
+    best, best_score = None, None
+    for i, card in enumerate(hand):
+        if card.energy_cost <= energy:
+            score = GreedyPolicy.card_score(card)
+            if best is None or score > best_score:
+                best, best_score = i, score
+    return best
+
+
+def _spend(card: Card, energy: int, max_energy: int) -> int:
+    energy -= card.energy_cost
+    restored = energy_restored(card)
+    return min(max_energy, energy + restored) if restored else energy
+
+
+def _groups(kinds: List[Card], counts: Counter) -> List[List[Card]]:
+    """
+    The cards as the walk tracks them. A card whose name appears once in the
+    deck is never held back by the unique-name rule, so such cards with the
+    same cost, greedy score and energy restore are interchangeable: they are
+    walked as one id with that many copies.
+    """
+    copies = Counter()
+    for card, count in counts.items():
+        copies[card.name] += count
+    groups: Dict[tuple, List[Card]] = {}
+    for card in kinds:
+        if copies[card.name] == 1:
+            key = (card.energy_cost, GreedyPolicy.card_score(card), energy_restored(card))
+        else:
+            key = (card,)
+        groups.setdefault(key, []).append(card)
+    return list(groups.values())
+
+
+def _walk(kinds: List[Card], counts: Counter, max_energy: int, turns: int):
+    """
+    Exact chances: a distribution over (piles, energy, reshuffled), advanced
+    one greedy turn at a time. Until the first reshuffle the cards drawn so
+    far are the ones with fewer copies left in the pile than in the deck; a
+    reshuffle only happens once every card has been drawn. Each card of a
+    group (see _groups) is equally likely to be among those drawn from it.
+    Hands are kept stably sorted by greedy score, which leaves the pick
+    unchanged. A stall is absorbing, so stalled games leave the distribution.
+    """
+    names = sorted({card.name for card in kinds})
+    groups = _groups(kinds, counts)
+    cards = [members[0] for members in groups]
+    name_ids = [[names.index(card.name) for card in members] for members in groups]
+    total = tuple(sum(counts[card] for card in members) for members in groups)
+    model = DrawModel([None if len(members) > 1 else members[0].name for members in groups],
+                      ordered_hands=True)
+    rank = [-GreedyPolicy.card_score(card) for card in cards]
+    cost = [card.energy_cost for card in cards]
+    everything = (1.0,) * len(names)
+    memo: Dict[tuple, tuple] = {}
+
+    def drawn_names(prefix: tuple, unseen: tuple) -> tuple:
+        # Per name, the chance it has been drawn given the pile so far
+        key = (prefix, unseen)
+        seen = memo.get(key)
+        if seen is None:
+            left = list(unseen)
+            for gid in prefix:
+                left[gid] += 1
+            shares = [0.0] * len(names)
+            for gid, ids in enumerate(name_ids):
+                gone = total[gid] - left[gid]
+                if gone:
+                    share = gone / total[gid] if len(ids) > 1 else 1.0
+                    for i in ids:
+                        shares[i] = max(shares[i], share)
+            seen = memo[key] = tuple(shares)
+        return seen
+
+    def ordered(piles: tuple) -> tuple:
+        return (tuple(sorted(piles[0], key=rank.__getitem__)),) + piles[1:]
+
+    def play(piles: tuple, idx: int) -> list:
+        # (probability, piles, reshuffled) after playing hand[idx] and drawing
+        key = (piles, idx)
+        outcomes = plays.get(key)
+        if outcomes is None:
+            hand, prefix, unseen, discard = piles
+            gid = hand[idx]
+            discard = discard[:gid] + (discard[gid] + 1,) + discard[gid + 1:]
+            outcomes = plays[key] = []
+            for q, after in model.draws(hand[:idx] + hand[idx + 1:], prefix, unseen, discard, 1):
+                # An empty hand is refilled when the next turn begins
+                refills = model.draws(*after, HAND_SIZE) if not after[0] else [(1.0, after)]
+                for r, filled in refills:
+                    # The discard pile only shrinks when it is shuffled back in
+                    outcomes.append((q * r, ordered(filled), sum(filled[3]) < sum(discard)))
+        return outcomes
+
+    def add(states: Dict[tuple, float], state: tuple, p: float) -> None:
+        states[state] = states.get(state, 0.0) + p
+
+    plays: Dict[tuple, list] = {}
+    states: Dict[tuple, float] = {}
+    for p, piles in model.draws((), (), total, model.empty, HAND_SIZE):
+        add(states, (ordered(piles), max_energy, False), p)
+
+    drawn = [[0.0] * turns for _ in names]
+    stalled = [0.0] * turns
+    frozen = [0.0] * len(names)     # names drawn in games that have stalled, weighted
+    stall = 0.0
+    for turn in range(turns):
+        for chances, p in zip(drawn, frozen):
+            chances[turn] += p
+        following: Dict[tuple, float] = {}
+        piles_seen: Dict[tuple, float] = {}    # pile so far, or (None, None) after a reshuffle
+        stalling: Dict[tuple, float] = {}
+        for state, p in states.items():
+            piles, energy, reshuffled = state
+            seen = (None, None) if reshuffled else piles[1:3]
+            piles_seen[seen] = piles_seen.get(seen, 0.0) + p
+            # Hands are sorted by score, so greedy plays the first affordable card
+            idx = next((i for i, gid in enumerate(piles[0]) if cost[gid] <= energy), None)
+            if idx is None:
+                stall += p
+                add(stalling, seen, p)
+                continue
+            energy_after = _spend(cards[piles[0][idx]], energy, max_energy)
+            for q, after, shuffled in play(piles, idx):
+                add(following, (after, energy_after, reshuffled or shuffled), p * q)
+        for seen, p in piles_seen.items():
+            for i, share in enumerate(everything if seen[0] is None else drawn_names(*seen)):
+                drawn[i][turn] += p * share
+        for seen, p in stalling.items():
+            for i, share in enumerate(everything if seen[0] is None else drawn_names(*seen)):
+                frozen[i] += p * share
+        stalled[turn] = stall
+        if len(following) > MAX_STATES:
+            raise _TooManyStates()
+        states = following
+    return {name: tuple(chances) for name, chances in zip(names, drawn)}, tuple(stalled)
+
+
+def _sample(kinds: List[Card], counts: Counter, max_energy: int, turns: int):
+    """
+    The same chances estimated from seeded games with the real
+    Player.draw_cards: SAMPLES of them, or fewer for decks so large that
+    shuffling would dominate (at most SAMPLE_CARDS cards shuffled in all).
+    """
+    names = sorted({card.name for card in kinds})
+    drawn = {name: [0] * turns for name in names}
+    stalled = [0] * turns
+    player = Player("Simulant")
+    cards = [card for card in kinds for _ in range(counts[card])]
+    games = max(1, min(SAMPLES, SAMPLE_CARDS // len(cards)))
+
+    for game in range(games):
+        # random.Random shuffles about ten times faster than BattleRNG
+        rng = random.Random(game)
+        deck = list(cards)
+        rng.shuffle(deck)
+        player.deck = deck
+        player.hand, player.discard_pile = [], []
+        energy = max_energy
+        seen = set()
+        for turn in range(turns):
+            if energy is not None:
+                if not player.hand:
+                    player.draw_cards(HAND_SIZE, rng)
+                seen.update(card.name for card in player.hand)
+                idx = _greedy(player.hand, energy)
+                if idx is None:
+                    energy = None
+                else:
+                    card = player.hand.pop(idx)
+                    energy = _spend(card, energy, max_energy)
+                    player.discard_pile.append(card)
+                    player.draw_cards(1, rng)
+            for name in seen:
+                drawn[name][turn] += 1
+            if energy is None:
+                stalled[turn] += 1
+
+    return ({name: tuple(n / games for n in chances) for name, chances in drawn.items()},
+            tuple(n / games for n in stalled))
@@ -0,0 +1,152 @@
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from .cards import Card
+
+SCAN_LIMIT = 16     # cards scanned from the top before the name counts are consulted
+
+class DrawPile:
+    """
+    The player's deck: a shuffled order plus a count of copies left per name.
+
+    The order is stored top card last, so taking a card near the top is a
+    cheap list.pop instead of shifting the whole deck. When the top card's
+    name is already in hand, the counts tell how many remaining cards are
+    barred; if that is all of them the draw stops at once instead of
+    scanning the deck, which made large decks with few names quadratic.
+    The counts are only built the first time a draw needs them after a
+    reshuffle: a draw first scans up to SCAN_LIMIT cards from the top, which
+    nearly always finds one, and only a longer run of barred cards consults
+    the counts.
+
+    It behaves like a list in draw order for menus and saves.
+    """
+    __slots__ = ('_cards', '_counts', '_frozen')
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self._cards: List[Card] = list(cards)
+        self._cards.reverse()
+        self._counts: Optional[Counter] = None
+        # Cached snapshot(); a tuple the pile was built from already is one
+        self._frozen: Optional[Tuple[Card, ...]] = cards if isinstance(cards, tuple) else None
+
+    def _name_counts(self) -> Counter:
+        # Built on first need, then kept up to date until the next reshuffle
+        if self._counts is None:
+            self._counts = Counter([card.name for card in self._cards])
+        return self._counts
+
+    def append(self, card: Card) -> None:
+        """Put a card at the bottom of the pile."""
+        self._cards.insert(0, card)
+        if self._counts is not None:
+            self._counts[card.name] += 1
+        self._frozen = None
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        cards = list(cards)
+        self._cards[:0] = cards[::-1]
+        if self._counts is not None:
+            self._counts.update([card.name for card in cards])
+        self._frozen = None
+
+    def count(self, name: str) -> int:
+        return self._name_counts()[name]
+
+    def _find(self, exclude: Set[str]) -> int:
+        """Index of the topmost card whose name is not in `exclude`, or -1."""
+        cards = self._cards
+        i = len(cards) - 1
+        stop = max(-1, i - SCAN_LIMIT)
+        while i > stop and cards[i].name in exclude:
+            i -= 1
+        if i == stop >= 0:
+            # A long run of barred cards: count them before scanning any further
+            counts = self._name_counts()
+            if sum([counts[name] for name in exclude]) >= len(cards):
+                return -1
+            while cards[i].name in exclude:
+                i -= 1
+        return i
+
+    def draw(self, exclude: Set[str] = frozenset()) -> Optional[Card]:
+        """Remove and return the first card whose name is not in `exclude`, or None."""
+        i = self._find(exclude)
+        if i < 0:
+            return None
+        card = self._cards.pop(i)
+        if self._counts is not None:
+            self._counts[card.name] -= 1
+        self._frozen = None
+        return card
+
+    def deal(self, hand: List[Card], count: int, discard_pile: List[Card], rng) -> None:
+        """
+        Move up to `count` cards into `hand`, never two with the same name,
+        reshuffling `discard_pile` into the pile whenever it runs out.
+        """
+        cards = self._cards
+        existing = {c.name for c in hand}
+        needed = count
+        while needed > 0:
+            if not cards:
+                if not discard_pile:
+                    break
+                cards = discard_pile.copy()
+                discard_pile.clear()
+                rng.shuffle(cards)
+                cards.reverse()
+                self._cards, self._counts = cards, None
+            card = cards[-1]
+            if card.name in existing:
+                i = self._find(existing)
+                if i < 0:
+                    break
+                card = cards.pop(i)
+            else:
+                cards.pop()
+            if self._counts is not None:
+                self._counts[card.name] -= 1
+            hand.append(card)
+            existing.add(card.name)
+            needed -= 1
+        if needed < count:
+            self._frozen = None
+
+    def _slot(self, index: int) -> int:
+        size = len(self._cards)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("DrawPile index out of range")
+        return size - 1 - index
+
+    def pop(self, index: int = -1) -> Card:
+        """Remove the card at a draw-order index."""
+        card = self._cards.pop(self._slot(index))
+        if self._counts is not None:
+            self._counts[card.name] -= 1
+        self._frozen = None
+        return card
+
+    def snapshot(self) -> Tuple[Card, ...]:
+        """The remaining cards in draw order; the same tuple until the pile changes."""
+        if self._frozen is None:
+            self._frozen = tuple(reversed(self._cards))
+        return self._frozen
+
+    def clear(self) -> None:
+        self._cards.clear()
+        self._counts = None
+        self._frozen = None
+
+    def __getitem__(self, index: int) -> Card:
+        return self._cards[self._slot(index)]
+
+    def __iter__(self) -> Iterator[Card]:
+        return reversed(self._cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __repr__(self):
+        return f"DrawPile({list(self)!r})"
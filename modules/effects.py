@@ -0,0 +1,286 @@
+"""
+Declarative card effects.
+
+An effect is a short text program, one statement per ';':
+
+    apply <EFFECT> <N> turns [amount <M>] to <source|target> [if <condition>]
+    restore <energy|health> <N> to <source|target> [if <condition>]
+
+A condition compares two operands with <, <=, >, >=, == or !=. An operand is a
+number or `<side>.<stat>`, optionally scaled (`source.max_health * 0.5`).
+
+    apply BURNED 2 turns amount 1 to target if target.health > source.health
+    restore energy 20 to source
+
+Text is parsed once per distinct program and cached, and each statement is
+compiled into a closure when its Effect is first created, so running an
+effect is one call per statement with no parsing or lookups. The Effect is
+immutable, hashable, comparable and picklable (it pickles as its text), so
+cards that use it can cross process boundaries and be loaded from data files.
+"""
+import operator
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .character import StatusEffect
+from .exceptions import CardEffectError
+
+APPLY = "apply"
+RESTORE = "restore"
+
+RESTORE_STATS = {"energy": "max_energy", "health": "max_health"}
+STATS = ("health", "max_health", "attack", "defense", "energy", "max_energy")
+
+COMPARATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt,
+    ">=": operator.ge, "==": operator.eq, "!=": operator.ne
+}
+
+
+class Operand:
+    """A number, or a character stat times a constant scale."""
+
+    def __init__(self, side: Optional[str], stat: Optional[str], value: float):
+        self.side = side      # side name, or None for a constant
+        self.stat = stat
+        self.value = value    # constant, or scale applied to the stat
+        self.getter = operator.attrgetter(stat) if stat else None
+
+    def __repr__(self):
+        if self.side is None:
+            return f"{self.value:g}"
+        return f"{self.side}.{self.stat}" + (f" * {self.value:g}" if self.value != 1 else "")
+
+
+class Condition:
+    """`left <op> right` over named characters; compiled with operand_getter."""
+
+    def __init__(self, left: Operand, symbol: str, right: Operand):
+        self.left = left
+        self.symbol = symbol
+        self.compare = COMPARATORS[symbol]
+        self.right = right
+
+    @property
+    def sides(self) -> Tuple[str, ...]:
+        return tuple(o.side for o in (self.left, self.right) if o.side is not None)
+
+    def __repr__(self):
+        return f"{self.left!r} {self.symbol} {self.right!r}"
+
+
+def _parse_number(token: str, text: str) -> float:
+    try:
+        value = float(token)
+    except ValueError:
+        raise CardEffectError(f"Expected a number, got '{token}' in: {text}")
+    return int(value) if value.is_integer() else value
+
+
+def _parse_operand(tokens: Sequence[str], sides: Sequence[str], text: str) -> Operand:
+    head = tokens[0]
+    scale = 1
+    if len(tokens) == 3 and tokens[1] == "*":
+        scale = _parse_number(tokens[2], text)
+    elif len(tokens) != 1:
+        raise CardEffectError(f"Malformed operand '{' '.join(tokens)}' in: {text}")
+
+    if "." not in head:
+        if scale != 1:
+            raise CardEffectError(f"Cannot scale a constant in: {text}")
+        return Operand(None, None, _parse_number(head, text))
+
+    side, stat = head.split(".", 1)
+    if side not in sides:
+        raise CardEffectError(f"Unknown side '{side}' (expected {', '.join(sides)}) in: {text}")
+    if stat not in STATS:
+        raise CardEffectError(f"Unknown stat '{stat}' (expected {', '.join(STATS)}) in: {text}")
+    return Operand(side, stat, scale)
+
+
+def parse_condition(text: str, sides: Sequence[str] = ("source", "target")) -> Condition:
+    """Parse `left <op> right`, where stats may refer to any of `sides`."""
+    tokens = text.split()
+    positions = [i for i, tok in enumerate(tokens) if tok in COMPARATORS]
+    if len(positions) != 1:
+        raise CardEffectError(f"Condition needs exactly one comparison: {text}")
+    i = positions[0]
+    if i == 0 or i == len(tokens) - 1:
+        raise CardEffectError(f"Condition is missing an operand: {text}")
+    return Condition(
+        _parse_operand(tokens[:i], sides, text),
+        tokens[i],
+        _parse_operand(tokens[i + 1:], sides, text)
+    )
+
+
+class EffectOp:
+    """One compiled statement of an effect program."""
+
+    def __init__(self, kind: str, on_target: bool, status: Optional[StatusEffect], stat: Optional[str],
+                 duration: int, amount: Optional[int], condition: Optional[Condition]):
+        self.kind = kind
+        self.on_target = on_target
+        self.status = status
+        self.stat = stat                  # restored stat, for RESTORE
+        self.cap = RESTORE_STATS.get(stat) if stat else None
+        self.duration = duration
+        self.amount = amount
+        self.condition = condition
+
+
+def _parse_statement(text: str) -> EffectOp:
+    tokens = text.split()
+    if not tokens:
+        raise CardEffectError("Empty effect statement")
+
+    condition = None
+    if "if" in tokens:
+        i = tokens.index("if")
+        condition = parse_condition(" ".join(tokens[i + 1:]))
+        tokens = tokens[:i]
+
+    verb = tokens[0].lower()
+    if len(tokens) < 4 or tokens[-2].lower() != "to" or tokens[-1].lower() not in ("source", "target"):
+        raise CardEffectError(f"Statement must end with 'to source' or 'to target': {text}")
+    on_target = tokens[-1].lower() == "target"
+    body = tokens[1:-2]
+
+    if verb == APPLY:
+        # <EFFECT> <N> turns [amount <M>]
+        if len(body) not in (3, 5) or body[2].lower() not in ("turn", "turns"):
+            raise CardEffectError(f"Expected 'apply <EFFECT> <N> turns [amount <M>]': {text}")
+        try:
+            status = StatusEffect[body[0].upper()]
+        except KeyError:
+            names = ", ".join(e.name for e in StatusEffect)
+            raise CardEffectError(f"Unknown status effect '{body[0]}' (expected {names}): {text}")
+        amount = None
+        if len(body) == 5:
+            if body[3].lower() != "amount":
+                raise CardEffectError(f"Expected 'amount <M>': {text}")
+            amount = int(_parse_number(body[4], text))
+        return EffectOp(APPLY, on_target, status, None, int(_parse_number(body[1], text)), amount, condition)
+
+    if verb == RESTORE:
+        # <stat> <N>
+        if len(body) != 2 or body[0].lower() not in RESTORE_STATS:
+            raise CardEffectError(f"Expected 'restore <energy|health> <N>': {text}")
+        return EffectOp(RESTORE, on_target, None, body[0].lower(), 0, int(_parse_number(body[1], text)), condition)
+
+    raise CardEffectError(f"Unknown effect verb '{tokens[0]}' (expected apply or restore): {text}")
+
+
+_compiled: Dict[str, Tuple[EffectOp, ...]] = {}
+
+
+def compile_effect(text: str) -> Tuple[EffectOp, ...]:
+    """Parse an effect program once; repeated texts share the compiled ops."""
+    ops = _compiled.get(text)
+    if ops is None:
+        ops = tuple(_parse_statement(part) for part in text.split(";") if part.strip())
+        if not ops:
+            raise CardEffectError("Effect has no statements")
+        _compiled[text] = ops
+    return ops
+
+
+def operand_getter(operand: Operand, sides: Sequence[str] = ("source", "target")) -> Callable:
+    """A function of two characters, named by `sides` in argument order, returning the operand's value."""
+    if operand.side is None:
+        value = operand.value
+        return lambda first, second: value
+    getter, scale = operand.getter, operand.value
+    if operand.side == sides[1]:
+        if scale == 1:
+            return lambda first, second: getter(second)
+        return lambda first, second: getter(second) * scale
+    if scale == 1:
+        return lambda first, second: getter(first)
+    return lambda first, second: getter(first) * scale
+
+
+def _compile_op(op: EffectOp) -> Callable:
+    """
+    One statement as a closure `step(source, target)`, returning the
+    (character, effect, duration) it applied, or None.
+    """
+    on_target = op.on_target
+    # A statement that touches or tests the target does nothing without one
+    needs_target = on_target or (op.condition is not None and "target" in op.condition.sides)
+
+    if op.kind is APPLY:
+        status, duration, amount = op.status, op.duration, op.amount
+
+        def act(who):
+            who.add_status_effect(status, duration, amount)
+            return who, status, duration
+    elif op.stat == "energy":
+        amount = op.amount
+
+        def act(who):
+            who.energy = min(who.max_energy, who.energy + amount)
+    else:
+        amount = op.amount
+
+        def act(who):
+            who.health = min(who.max_health, who.health + amount)
+
+    if op.condition is None:
+        if on_target:
+            return lambda source, target: act(target) if target is not None else None
+        return lambda source, target: act(source)
+
+    left, right = operand_getter(op.condition.left), operand_getter(op.condition.right)
+    compare = op.condition.compare
+
+    def step(source, target):
+        if needs_target and target is None:
+            return None
+        if not compare(left(source, target), right(source, target)):
+            return None
+        return act(target if on_target else source)
+    return step
+
+
+_effects: Dict[str, "Effect"] = {}
+
+
+class Effect:
+    """A compiled effect program, callable as effect(source, target)."""
+    __slots__ = ('text', 'ops', '_steps')
+
+    def __new__(cls, text: str):
+        # Effects are immutable, so every card with the same program shares one
+        text = " ".join(text.split())
+        effect = _effects.get(text)
+        if effect is None:
+            effect = super().__new__(cls)
+            effect.text = text
+            effect.ops = compile_effect(text)
+            effect._steps = tuple(_compile_op(op) for op in effect.ops)
+            _effects[text] = effect
+        return effect
+
+    def __call__(self, source, target=None) -> List[tuple]:
+        """Run the program; returns (character, effect, duration) for each status applied."""
+        applied = []
+        for step in self._steps:
+            status = step(source, target)
+            if status is not None:
+                applied.append(status)
+        return applied
+
+    def __eq__(self, other):
+        return isinstance(other, Effect) and other.text == self.text
+
+    def __hash__(self):
+        return hash(self.text)
+
+    def __reduce__(self):
+        return (Effect, (self.text,))
+
+    def __repr__(self):
+        return f"Effect({self.text!r})"
+
+    def __str__(self):
+        return self.text
@@ -0,0 +1,231 @@
+"""
+Multi-enemy encounters.
+
+An Encounter is a group of enemies fought together. EncounterEngine runs the
+fight on the BattleEngine rules, with turn order taken from a TurnScheduler:
+a priority queue keyed by the time of each combatant's next turn, so faster
+combatants (higher `speed`) act more often and picking the next actor is
+O(log n) however many enemies there are.
+"""
+import heapq
+from typing import FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import battle_state
+from .battle_engine import BattleEngine, BattleResult, Policy
+from .battle_events import Defeat, Victory
+from .battle_state import BattleState, FighterState, fighter_state, restore_fighter
+from .character import Character
+from .enemy import Enemy
+from .player import Player
+
+# A combatant with speed s acts every ROUND_TICKS // s ticks (speed 10: every 100)
+ROUND_TICKS = 1000
+
+
+class Encounter:
+    """A named group of enemies, fought in one battle."""
+
+    def __init__(self, name: str, enemies: List[Enemy]):
+        if not enemies:
+            raise ValueError(f"Encounter '{name}' has no enemies")
+        self.name = name
+        self.enemies = enemies
+
+    @property
+    def exp_reward(self) -> int:
+        return sum(enemy.exp_reward for enemy in self.enemies)
+
+    def __str__(self):
+        return f"[Encounter] {self.name} | " + ", ".join(enemy.name for enemy in self.enemies)
+
+
+class TurnScheduler:
+    """
+    Initiative queue over combatants. Ties go to the combatant listed first,
+    so with equal speeds the player (listed first) opens and everyone takes
+    turns in order. Defeated combatants are dropped as they come up.
+    """
+
+    def __init__(self, combatants: Sequence[Character]):
+        self.combatants = list(combatants)
+        self._heap: List[Tuple[int, int, Character]] = [
+            (self.interval(c), order, c) for order, c in enumerate(self.combatants)
+        ]
+        heapq.heapify(self._heap)
+
+    def state(self) -> Tuple[Tuple[int, int], ...]:
+        """The queue as (next turn time, combatant index) pairs, in heap order."""
+        return tuple((time, order) for time, order, _ in self._heap)
+
+    def set_state(self, state: Tuple[Tuple[int, int], ...]) -> None:
+        self._heap = [(time, order, self.combatants[order]) for time, order in state]
+
+    @staticmethod
+    def interval(character: Character) -> int:
+        return max(1, ROUND_TICKS // max(1, character.speed))
+
+    def next(self) -> Optional[Character]:
+        """The combatant whose turn comes next, or None once nobody is left standing."""
+        heap = self._heap
+        while heap:
+            time, order, character = heap[0]
+            if character.health <= 0:
+                heapq.heappop(heap)
+                continue
+            heapq.heapreplace(heap, (time + self.interval(character), order, character))
+            return character
+        return None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class EncounterState(NamedTuple):
+    """An EncounterEngine snapshot: the single-enemy state plus every enemy and the turn order."""
+    battle: BattleState           # player, piles and counters; `enemy` is the target
+    enemies: Tuple[FighterState, ...]
+    target: int                   # index into enemies
+    schedule: Tuple[Tuple[int, int], ...]   # TurnScheduler.state()
+    acting: Optional[int]         # combatant index (0 is the player)
+    player_turns: int
+    defeated: FrozenSet[int]      # indices into enemies
+
+
+class EncounterEngine(BattleEngine):
+    """
+    BattleEngine for one player against several enemies. Call next_actor()
+    for each turn: on the player's turn the card played hits `enemy`, the
+    target chosen with set_target(); on an enemy's turn, enemy_turn() plays
+    that enemy. Status effects tick at the end of each combatant's own turn.
+    Snapshots cover every enemy and the turn order; replay logs are
+    single-enemy only.
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        enemies: Sequence[Enemy],
+        max_turns: int = 200,
+        rng=None,
+        seed: Optional[int] = None
+    ):
+        if not enemies:
+            raise ValueError("An encounter needs at least one enemy")
+        # Enemies keep their wounds between fights, so a rematch may start with some already down
+        standing = [enemy for enemy in enemies if enemy.health > 0] or list(enemies)
+        super().__init__(player, standing[0], max_turns, rng, seed)
+        self.enemies = list(enemies)
+        self.scheduler = TurnScheduler([player, *self.enemies])
+        self.acting: Optional[Character] = None
+        self.player_turns = 0
+        # Enemies down so far, so outcome checks stay O(1)
+        self._defeated = {enemy for enemy in self.enemies if enemy.health <= 0}
+
+    @property
+    def living_enemies(self) -> List[Enemy]:
+        return [enemy for enemy in self.enemies if enemy.health > 0]
+
+    def set_target(self, index: int) -> None:
+        enemy = self.enemies[index]
+        if enemy.health <= 0:
+            raise ValueError(f"{enemy.name} is already defeated")
+        self.enemy = enemy
+
+    def next_actor(self) -> Optional[Character]:
+        self.acting = self.scheduler.next()
+        return self.acting
+
+    def begin_player_turn(self) -> None:
+        if self.player_turns:
+            self.turn_count += 1
+        self.player_turns += 1
+        if self.enemy.health <= 0:
+            self.enemy = self.living_enemies[0]
+        super().begin_player_turn()
+
+    def end_player_turn(self) -> None:
+        self._update_status_effects(self.player)
+        self._check_outcome(self.enemy)
+
+    def enemy_turn(self):
+        """Let the acting enemy pick and resolve its action. Returns (card, acted, result)."""
+        enemy = self.acting
+        card = enemy.get_next_action(self.player, self.rng)
+        acted, result = self.resolve_card(card, enemy, self.player)
+        self._update_status_effects(enemy)
+        self._check_outcome(enemy)
+        return card, acted, result
+
+    def _check_outcome(self, enemy: Enemy) -> None:
+        # Only the player and `enemy` (the target, or the enemy that just acted) can have fallen
+        if enemy.health <= 0:
+            self._defeated.add(enemy)
+        if self.player.health <= 0:
+            self.winner = "enemy"
+            if self.events.subscribers:
+                self.events.emit(Defeat(self.turn_count, self.player, self.enemy))
+        elif len(self._defeated) == len(self.enemies):
+            self.winner = "player"
+            if self.events.subscribers:
+                self.events.emit(Victory(self.turn_count, self.player, self.enemy))
+
+    def run(self, policy: Policy) -> BattleResult:
+        """Fight until one side is down, the policy surrenders or max_turns player turns pass."""
+        while not self.is_over:
+            actor = self.next_actor()
+            if actor is None:
+                break
+            if actor is not self.player:
+                self.enemy_turn()
+                continue
+            if self.player_turns >= self.max_turns:
+                break
+            self.begin_player_turn()
+            self.set_target(policy.choose_target(self))
+            idx = policy.choose_card(self)
+            if idx is None:
+                self.surrender()
+                break
+            self.play_card(idx)
+            self.end_player_turn()
+
+        result = self.result()
+        self.cleanup()
+        return result
+
+    def result(self) -> BattleResult:
+        result = super().result()
+        result.enemy_health = sum(enemy.health for enemy in self.living_enemies)
+        return result
+
+    def apply_victory(self, xp_threshold: int) -> bool:
+        return self.player.gain_xp(sum(enemy.exp_reward for enemy in self.enemies), xp_threshold)
+
+    def cleanup(self) -> None:
+        super().cleanup()
+        for enemy in self.enemies:
+            enemy.clear_status_effects()
+
+    def snapshot(self) -> EncounterState:
+        """Immutable copy of the fight so far, including every enemy and the turn queue."""
+        combatants = self.scheduler.combatants
+        return EncounterState(
+            battle_state.capture(self),
+            tuple(fighter_state(enemy) for enemy in self.enemies),
+            next(i for i, enemy in enumerate(self.enemies) if enemy is self.enemy),
+            self.scheduler.state(),
+            next((i for i, c in enumerate(combatants) if c is self.acting), None),
+            self.player_turns,
+            frozenset(i for i, enemy in enumerate(self.enemies) if enemy in self._defeated)
+        )
+
+    def restore(self, state: EncounterState) -> None:
+        """Roll the fight back (or forward) to a snapshot taken from this engine."""
+        self.enemy = self.enemies[state.target]
+        battle_state.restore(self, state.battle)
+        for enemy, fighter in zip(self.enemies, state.enemies):
+            restore_fighter(enemy, fighter)
+        self.scheduler.set_state(state.schedule)
+        self.acting = None if state.acting is None else self.scheduler.combatants[state.acting]
+        self.player_turns = state.player_turns
+        self._defeated = {self.enemies[i] for i in state.defeated}
@@ -1,68 +1,55 @@
 import random
-from .character import Character, StatusEffect
-from .cards import AttackCard, DefenseCard, UtilityCard
+from typing import List, Optional, Tuple
+from .character import Character
+from .cards import Card
+from .behavior import Behavior, get_behavior
 
 class Enemy(Character):
-    def __init__(self, name: str, health: int, attack: int, defense: int, exp_reward: int):
+    """
+    An opponent whose actions come from a compiled behavior table (see
+    modules/behavior.py); BEHAVIOR names the table used when none is given.
+    """
+    __slots__ = ('exp_reward', 'behavior')
+
+    BEHAVIOR = "enemy"
+
+    def __init__(self, name: str, health: int, attack: int, defense: int, exp_reward: int,
+                 speed: int = 10, behavior: Optional[Behavior] = None):
         super().__init__(name, health)
         self.base_attack = attack
         self.base_defense = defense
         self.attack = attack
         self.defense = defense
         self.exp_reward = exp_reward
+        self.speed = speed
+        self.behavior = behavior or get_behavior(self.BEHAVIOR)
+
+    def get_next_action(self, player: Character, rng=random) -> Card:
+        return self.behavior.choose(self, player, rng)
+
+    def action_distribution(self, player: Character) -> List[Tuple[float, Card]]:
+        """The (probability, action) pairs get_next_action chooses between in this position."""
+        return self.behavior.distribution(self, player)
+
+    def action_id(self, card: Card) -> str:
+        """Catalog id of an action this enemy returned (its name if it is not catalogued)."""
+        return self.behavior.actions.id_of(card) or card.name
 
-    def get_next_action(self, player: Character) -> AttackCard:
-        """Fallback behavior: always attack"""
-        return AttackCard("Basic Attack", 0, self.attack, f"{self.name} attacks.")
-    
     def __str__(self):
         return (f"[Enemy] {self.name} | HP: {self.health} | "
             f"ATK: {self.attack} | DEF: {self.defense}")
 
 class Raider(Enemy):
-    def get_next_action(self, player: Character):
-        if self.health < self.max_health * 0.4:
-            # 70% chance to defend, 30% chance to attack
-            if random.random() < 0.7:
-                return DefenseCard("Brace", 0, 2, "Defends in desperation.")
-        return AttackCard("Slash", 0, self.attack, "A slashing attack.")
+    __slots__ = ()
 
-class Mutant(Enemy):
-    def get_next_action(self, player: Character):
-        if player.health > player.max_health * 0.5:
-            # 60% chance to use powerful attack, 40% to use normal
-            if random.random() < 0.6:
-                return AttackCard("Frenzy", 0, int(self.attack * 1.5), "A wild, frenzied attack.")
-        return AttackCard("Contaminate", 0, self.attack, "A toxic hit.")
+    BEHAVIOR = "raider"
 
-class Boss(Enemy):
-    def get_next_action(self, player: Character):
-        # 20% chance to use a utility card each turn
-        if random.random() < 0.2:
-            return random.choice(self._utility_cards(player))
+class Mutant(Enemy):
+    __slots__ = ()
 
-        # 50% chance to defend if player is too tanky
-        if player.defense > self.attack and random.random() < 0.5:
-            return DefenseCard("Iron Shell", 0, self.defense + 4, "Fortifies defenses.")
+    BEHAVIOR = "mutant"
 
-        return AttackCard("Devastating Blow", 0, self.attack * 2, "A powerful strike.")
+class Boss(Enemy):
+    __slots__ = ()
 
-    def _utility_cards(self, player):
-        # List of utility cards bosses can use
-        return [
-            UtilityCard(
-                "Battle Roar", 0,
-                lambda s, t: s.add_status_effect(StatusEffect.ATTACK_UP, duration=3, amount=3),
-                "Boosts its attack power for 3 turns."
-            ),
-            UtilityCard(
-                "Toxic Pulse", 0,
-                lambda s, t: t.add_status_effect(StatusEffect.BURNED, duration=3, amount=2),
-                "Applies burn for 3 turns (2 dmg/turn)."
-            ),
-            UtilityCard(
-                "Corrosive Shout", 0,
-                lambda s, t: t.add_status_effect(StatusEffect.POISONED, duration=2, amount=3),
-                "Poisons the player for 2 turns."
-            )
-        ]
\ No newline at end of file
+    BEHAVIOR = "boss"
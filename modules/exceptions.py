@@ -2,4 +2,13 @@ class TaskManagerError(Exception):
     pass
 
 class DataManagerError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class CardEffectError(Exception):
+    pass
+
+class SolverLimitError(Exception):
+    pass
+
+class BehaviorError(Exception):
+    pass
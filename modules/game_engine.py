@@ -1,22 +1,21 @@
 import time
-import tkinter as tk
 from utils import typing, clear, ascii
 from components import start, bunker, game_map, display_player_stats, inventory, show_intro
 from .bot import Bot
-from .lore_manager import LoreManager
+from .lore_manager import get_lore_manager
 from .player import Player
 from .data_manager import DataManager
 from .task_manager import TaskManager
 from .location import LocationManager
-from .task_manager_gui import TaskManagerGUI
 
 class Game:
     def __init__(self):
         # Initialize core systems
         self.data_manager = DataManager()
-        self.lore_manager = LoreManager("data/lore.json")
-        self.task_manager = TaskManager("saves/tasks.json")
-        self.location_manager = LocationManager("data/locations.json")
+        self.lore_manager = get_lore_manager("data/lore.json")
+        # Loaded on first use, so the first screen does not wait for them
+        self._task_manager: TaskManager = None
+        self._location_manager: LocationManager = None
 
         self.player: Player = None
         self.bot = Bot()
@@ -29,6 +28,18 @@ class Game:
         self.running = True
         self.state = "bunker"
 
+    @property
+    def task_manager(self) -> TaskManager:
+        if self._task_manager is None:
+            self._task_manager = TaskManager("saves/tasks.json")
+        return self._task_manager
+
+    @property
+    def location_manager(self) -> LocationManager:
+        if self._location_manager is None:
+            self._location_manager = LocationManager("data/locations.json")
+        return self._location_manager
+
     def start_game(self):
         start() # Show loader and game logo
         if self.first_run: # If player does not have saved progress then this part of the code executes
@@ -109,7 +120,7 @@ class Game:
             if not loc:
                 continue
             defeated_names = state.get("defeated_enemy_names", [])
-            loc.enemies_defeated = [e for e in loc.enemies if e.name in defeated_names]
+            loc.enemies_defeated = [e for e in loc.opponents if e.name in defeated_names]
             loc.boss_defeated = state.get("boss_defeated", loc.boss_defeated)
             loc.is_completed = state.get("is_completed", loc.is_completed)
 
@@ -130,6 +141,9 @@ class Game:
             elif self.state == 'task-manager':
                 clear()
                 print("\n\nRunning computer...")
+                # Tk is slow to import and only needed here
+                import tkinter as tk
+                from .task_manager_gui import TaskManagerGUI
                 root = tk.Tk()
                 gui = TaskManagerGUI(root, self.task_manager, self)
                 root.mainloop()
@@ -0,0 +1,120 @@
+"""
+Speculative enemy-intent forecasts.
+
+While the player is reading the battle screen and typing, the CPU is idle.
+IntentForecaster uses that time on a background thread: for every card the
+player could play, it works out the enemy's possible replies (from
+enemy.action_distribution) and how much damage each side would take. When
+the player asks for a preview or picks a card, the answer is usually ready.
+
+    forecaster = IntentForecaster(player, enemy)
+    forecaster.start(player, enemy, engine.turn_count)   # before input()
+    intent = forecaster.get(idx)                         # after it
+    forecaster.discard()
+
+Forecasts are keyed by the battle position and only touch the BattleModel's
+scratch fighters, never the live ones or the battle RNG, so they cannot
+change how the fight plays out.
+"""
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .cards import Card
+from .enemy import Enemy
+from .player import Player
+from .solver import BattleModel
+
+
+class Reply(NamedTuple):
+    """One enemy action and where it leaves both fighters."""
+    probability: float
+    action: Card
+    player_health: int
+    enemy_health: int
+
+
+class CardIntent(NamedTuple):
+    """What follows if the player plays `card` this turn."""
+    card: Card
+    health: int            # the player's HP before the card
+    damage_dealt: int      # enemy HP lost before it replies
+    replies: Tuple[Reply, ...]
+
+    @property
+    def wins(self) -> bool:
+        """The card finishes the enemy before it can reply."""
+        return not self.replies
+
+    @property
+    def expected_damage(self) -> float:
+        """Expected player HP lost this turn, status damage included."""
+        return sum(r.probability * (self.health - r.player_health) for r in self.replies)
+
+    @property
+    def lethal_chance(self) -> float:
+        return sum(r.probability for r in self.replies if r.player_health <= 0)
+
+
+class IntentForecaster:
+    """Forecasts every playable card of the current turn on a background thread."""
+
+    def __init__(self, player: Player, enemy: Enemy, max_turns: int = 200):
+        # Hands keep their order so forecast indices match player.hand
+        self.model = BattleModel(player, enemy, max_turns, ordered_hands=True)
+        self.cache: Dict[tuple, Dict[int, CardIntent]] = {}
+        self._position: Optional[tuple] = None
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()    # one forecast at a time on the model's scratch fighters
+
+    def start(self, player: Player, enemy: Enemy, turn: int) -> None:
+        """Begin forecasting the current position. Call on the battle's thread, before blocking on input."""
+        self.discard()
+        position = self.model.position(player, enemy, turn, shuffled=False)
+        self._position = position
+        self._cancel.clear()
+        self._thread = threading.Thread(target=self._forecast_all, args=(position,), daemon=True)
+        self._thread.start()
+
+    def get(self, idx: int) -> Optional[CardIntent]:
+        """
+        Forecast for hand[idx] in the started position, computed now if the
+        thread has not reached it yet; None if the card is unaffordable.
+        """
+        position = self._position
+        if position is None or idx not in self.model.playable(position):
+            return None
+        intents = self.cache.get(position)
+        if intents is None or idx not in intents:
+            self._forecast(position, idx)
+        return self.cache[position].get(idx)
+
+    def discard(self) -> None:
+        """Stop any forecast in flight and drop the results; the player has chosen."""
+        if self._thread is not None:
+            self._cancel.set()
+            self._thread.join()
+            self._thread = None
+        self._position = None
+        self.cache.clear()
+
+    def _forecast_all(self, position: tuple) -> None:
+        for idx in self.model.playable(position):
+            if self._cancel.is_set():
+                return
+            self._forecast(position, idx)
+
+    def _forecast(self, position: tuple, idx: int) -> None:
+        with self._lock:
+            intents = self.cache.setdefault(position, {})
+            if idx in intents:
+                return
+            health = position[1][0]
+            enemy_health = position[2][0]
+            (_, enemy_after), replies = self.model.preview(position, idx)
+            intents[idx] = CardIntent(
+                self.model.cards[position[3][idx]],
+                health,
+                enemy_health - enemy_after,
+                tuple(Reply(*reply) for reply in replies)
+            )
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from .cards import AttackCard, UtilityCard, DefenseCard
 
 class Item(ABC):
+    __slots__ = ('name', 'description')
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -10,6 +13,8 @@ class Item(ABC):
         pass
 
 class CardItem(Item):
+    __slots__ = ('card',)
+
     def __init__(self, card):
         super().__init__(card.name, card.description)
         self.card = card
@@ -18,6 +23,8 @@ class CardItem(Item):
         return None
 
 class ConsumableItem(Item):
+    __slots__ = ('effect_func',)
+
     def __init__(self, name: str, description: str, effect_func):
         super().__init__(name, description)
         self.effect_func = effect_func
@@ -25,3 +32,18 @@ class ConsumableItem(Item):
     def use(self, source, target):
         return self.effect_func(source, target)
 
+
+# Card shop stock: (name, price, description, factory for the card sold)
+SHOP_CARDS = [
+    ("Slice", 15, "Deal 7 damage.", lambda: AttackCard("Slice", 1, 7, "Deal 7 damage.")),
+    ("Adrenaline", 25, "Gain 2 energy.", lambda: UtilityCard("Adrenaline", 1, "restore energy 2 to source", "Gain 2 energy.")),
+    ("Shield Boost", 20, "Gain 8 defense.", lambda: DefenseCard("Shield Boost", 1, 8, "Gain 8 defense.")),
+    ("Toxic Slash", 30, "Deal 6 damage and apply poison.", lambda: UtilityCard("Toxic Slash", 2, "apply POISONED 2 turns amount 2 to target", "Deal 6 damage and poison.")),
+]
+
+# Health potions sold in the inventory screen: (name, price, HP restored)
+HEALTH_POTIONS = [
+    ("Small Health Potion", 10, 10),
+    ("Medium Health Potion", 25, 20),
+    ("Large Health Potion", 45, 30),
+]
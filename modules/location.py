@@ -1,6 +1,11 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from .enemy import Enemy, Boss, Raider, Mutant
+from .encounter import Encounter
+from .behavior import Behavior, load_behaviors
 import json
+import os
+
+Opponent = Union[Enemy, Encounter]
 
 class Location:
     def __init__(
@@ -10,39 +15,46 @@ class Location:
         description: str,
         enemies: List[Enemy],
         boss: Boss,
-        xp_threshold: int
+        xp_threshold: int,
+        encounters: Optional[List[Encounter]] = None
     ):
         self.name = name
         self.level = level
         self.description = description
         self.enemies = enemies
+        self.encounters = encounters or []    # group fights, after the single enemies
         self.boss = boss
         self.xp_threshold = xp_threshold
 
-        self.enemies_defeated: List[Enemy] = []
+        self.enemies_defeated: List[Opponent] = []
         self.boss_defeated = False
         self.is_completed = False
 
-    def get_next_enemy(self) -> Optional[Enemy]:
-        remaining = [e for e in self.enemies if e not in self.enemies_defeated]
+    @property
+    def opponents(self) -> List[Opponent]:
+        """Every fight before the boss, in order: single enemies, then encounters."""
+        return self.enemies + self.encounters
+
+    def get_next_enemy(self) -> Optional[Opponent]:
+        remaining = [e for e in self.opponents if e not in self.enemies_defeated]
         if remaining:
             return remaining[0]
         if not self.boss_defeated:
             return self.boss
         return None
 
-    def mark_enemy_defeated(self, enemy: Enemy) -> None:
+    def mark_enemy_defeated(self, enemy: Opponent) -> None:
         if enemy is self.boss:
             self.boss_defeated = True
         else:
             self.enemies_defeated.append(enemy)
 
-        if len(self.enemies_defeated) == len(self.enemies) and self.boss_defeated:
+        if len(self.enemies_defeated) == len(self.opponents) and self.boss_defeated:
             self.is_completed = True
 
     def get_completion_status(self) -> dict:
         return {
-            'total_enemies': len(self.enemies),
+            'total_enemies': len(self.opponents),
             'defeated_enemies': len(self.enemies_defeated),
             'boss_defeated': self.boss_defeated,
             'is_completed': self.is_completed
@@ -58,6 +70,8 @@ class LocationManager:
     def load_locations_from_json(self, json_path: str) -> None:
         with open(json_path, "r", encoding="utf-8") as f:
             data = json.load(f)
+        # behavior tables sit next to the locations file and are compiled once here
+        behaviors = load_behaviors(os.path.join(os.path.dirname(json_path), "behaviors.json"))
 
         for loc in data:
             loc_id      = loc["id"]
@@ -66,26 +80,27 @@ class LocationManager:
             description = loc["description"]
             xp_thresh   = loc.get("xp_threshold", level * 100)
 
-            # regular enemies
-            enemies: List[Enemy] = []
-            for ed in loc.get("enemies", []):
-                t = ed["type"].lower()
-                if t == "raider":
-                    enemies.append(Raider(ed["name"], ed["health"], ed["attack"], ed["defense"], ed["exp_reward"]))
-                elif t == "mutant":
-                    enemies.append(Mutant(ed["name"], ed["health"], ed["attack"], ed["defense"], ed["exp_reward"]))
-
-            # boss
-            bd = loc["boss"]
-            bt = bd["type"].lower()
-            if bt == "raider":
-                boss = Raider(bd["name"], bd["health"], bd["attack"], bd["defense"], bd["exp_reward"])
-            elif bt == "mutant":
-                boss = Mutant(bd["name"], bd["health"], bd["attack"], bd["defense"], bd["exp_reward"])
-            else:
-                boss = Boss(bd["name"], bd["health"], bd["attack"], bd["defense"], bd["exp_reward"])
-
-            self.locations[loc_id] = Location(name, level, description, enemies, boss, xp_thresh)
+            # regular enemies are raiders or mutants
+            enemies = [self._build_enemy(ed, behaviors) for ed in loc.get("enemies", [])
+                       if ed["type"].lower() in ("raider", "mutant")]
+            encounters = [
+                Encounter(group["name"], [self._build_enemy(ed, behaviors) for ed in group["enemies"]])
+                for group in loc.get("encounters", [])
+            ]
+            boss = self._build_enemy(loc["boss"], behaviors)
+
+            self.locations[loc_id] = Location(name, level, description, enemies, boss, xp_thresh, encounters)
+
+    @staticmethod
+    def _build_enemy(data: dict, behaviors: Dict[str, Behavior]) -> Enemy:
+        """
+        Raider or Mutant by "type"; other types with a behavior table are plain
+        Enemies acting by it, and anything else is a Boss.
+        """
+        kind = data["type"].lower()
+        cls = {"raider": Raider, "mutant": Mutant, "boss": Boss}.get(kind, Enemy if kind in behaviors else Boss)
+        return cls(data["name"], data["health"], data["attack"], data["defense"], data["exp_reward"],
+                   data.get("speed", 10), behaviors.get(kind) or behaviors.get(cls.BEHAVIOR))
 
     def get_all_locations(self) -> List[Location]:
         return list(self.locations.values())
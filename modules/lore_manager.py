@@ -2,6 +2,8 @@ import json
 from typing import List, Optional, Dict
 
 class LoreEntry:
+    __slots__ = ('trigger', 'content', 'category')
+
     def __init__(self, trigger: str, content: str, category: str):
         self.trigger = trigger
         self.content = content
@@ -63,3 +65,13 @@ class LoreManager:
             entry for entry in self.get_all_entries(category)
             if keyword in entry.content.lower()
         ]
+
+
+# One manager per lore file, shared by the game, ARIA and the prologue
+_lore_managers: Dict[str, LoreManager] = {}
+
+
+def get_lore_manager(json_path: str) -> LoreManager:
+    if json_path not in _lore_managers:
+        _lore_managers[json_path] = LoreManager(json_path)
+    return _lore_managers[json_path]
@@ -1,28 +1,38 @@
 import random
 from typing import Dict, Optional, List
-from .character import Character, StatusEffect
+from .character import Character
 from .cards import Card, AttackCard, DefenseCard, UtilityCard
+from .draw_pile import DrawPile
 from .inventory_manager import InventoryManager 
 
 class Player(Character):
+    __slots__ = (
+        'level', 'xp', 'money', 'energy', 'max_energy', 'inventory', 'inventory_manager',
+        'hand', '_deck', 'discard_pile', 'unlocked_cards'
+    )
+
     XP_THRESHOLDS = [110, 180, 250]  # Custom thresholds for first few levels
     DEFAULT_XP_THRESHOLD = 300       # Default threshold for levels beyond defined ones
 
     CARD_UNLOCKS = {
         2: [
             AttackCard("Lunge", 1, 7, "Deal 7 damage. Cheap and fast.", tags=["strike"]),
-            UtilityCard("Adrenaline", 1, lambda s, t: setattr(s, "energy", min(s.max_energy, s.energy + 20)), "Gain 20 energy."),
+            UtilityCard("Adrenaline", 1, "restore energy 20 to source", "Gain 20 energy."),
         ],
         3: [
             DefenseCard("Fortify", 2, 10, "Gain 10 defense."),
-            UtilityCard("Overclock", 2, lambda s, t: s.add_status_effect(StatusEffect.ATTACK_UP, 3, 3), "Boost attack +3 for 3 turns."),
+            UtilityCard("Overclock", 2, "apply ATTACK_UP 3 turns amount 3 to source", "Boost attack +3 for 3 turns."),
         ],
         4: [
             AttackCard("Exploit Weakness", 2, 6, "Deal 6 damage and Burn if enemy has less defense.", tags=["tactic"]),
         ]
     }
 
-    def __init__(self, name: str):
+    HEALTH_PER_LEVEL = 10
+    ATTACK_PER_LEVEL = 2
+    DEFENSE_PER_LEVEL = 2
+
+    def __init__(self, name: str, rng=random):
         super().__init__(name, health=100)
         self.level = 1
         self.xp = 0
@@ -33,26 +43,24 @@ class Player(Character):
         self.inventory_manager = InventoryManager(self)
 
         self.hand: List[Card] = []
-        self.deck: List[Card] = []
+        self.deck = DrawPile()
         self.discard_pile: List[Card] = []
 
         self.unlocked_cards: set[str] = set()  
 
-        self.initialize_starter_deck()
+        self.initialize_starter_deck(rng)
 
 
-    def initialize_starter_deck(self) -> None:
-        def focus_effect(source, _):
-            source.add_status_effect(StatusEffect.ATTACK_UP, duration=2, amount=2)
+    @property
+    def deck(self) -> DrawPile:
+        return self._deck
 
-        def regen_effect(source, _):
-            source.add_status_effect(StatusEffect.DEFENSE_UP, duration=2, amount=2)
+    @deck.setter
+    def deck(self, cards) -> None:
+        self._deck = cards if isinstance(cards, DrawPile) else DrawPile(cards)
 
-        def precision_effect(source, target):
-            if target and target.health > source.health:
-                target.add_status_effect(StatusEffect.BURNED, duration=2, amount=1)
-
-        self.deck = [
+    def initialize_starter_deck(self, rng=random) -> None:
+        cards = [
             AttackCard("Strike", 12, 6, "Deal 6 damage. [strike]", tags=["strike"]),
             AttackCard("Combo Slash", 14, 5, "Deal 5 damage. +2 if last card was a strike.", tags=["strike"]),
             AttackCard("Heavy Blow", 22, 10, "Big hit. Costly but strong.", tags=["power"]),
@@ -60,31 +68,17 @@ class Player(Character):
             DefenseCard("Guard", 10, 5, "Gain +5 defense."),
             DefenseCard("Iron Wall", 18, 8, "Gain +8 defense."),
 
-            UtilityCard("Focus", 15, lambda s, t: s.add_status_effect(StatusEffect.ATTACK_UP, 2, 2), "Gain +2 attack for 2 turns."),
-            UtilityCard("Regenerate", 15, lambda s, t: s.add_status_effect(StatusEffect.DEFENSE_UP, 2, 2), "Gain +2 defense for 2 turns."),
-            UtilityCard("Precision", 24, lambda s, t: t.add_status_effect(StatusEffect.BURNED, 2, 1) if t and t.health > s.health else None, "Burn target if it has more HP than you."),
+            UtilityCard("Focus", 15, "apply ATTACK_UP 2 turns amount 2 to source", "Gain +2 attack for 2 turns."),
+            UtilityCard("Regenerate", 15, "apply DEFENSE_UP 2 turns amount 2 to source", "Gain +2 defense for 2 turns."),
+            UtilityCard("Precision", 24, "apply BURNED 2 turns amount 1 to target if target.health > source.health", "Burn target if it has more HP than you."),
         ]
-        random.shuffle(self.deck)
+        rng.shuffle(cards)
+        self.deck = DrawPile(cards)
 
     
-    def draw_cards(self, count: int) -> None:
-        needed = count
-        existing = {c.name for c in self.hand}
-
-        while needed > 0 and (self.deck or self.discard_pile):
-            if not self.deck:
-                self.deck = self.discard_pile.copy()
-                self.discard_pile.clear()
-                random.shuffle(self.deck)
-
-            for i, card in enumerate(self.deck):
-                if card.name not in existing:
-                    self.hand.append(self.deck.pop(i))
-                    existing.add(card.name)
-                    needed -= 1
-                    break
-            else:
-                break
+    def draw_cards(self, count: int, rng=random) -> None:
+        """Draw up to `count` cards, never two with the same name in hand."""
+        self._deck.deal(self.hand, count, self.discard_pile, rng)
 
 
     def get_xp_threshold(self) -> int:
@@ -107,13 +101,17 @@ class Player(Character):
             leveled = True
         return leveled
 
-    def level_up(self) -> None:
+    def advance_level(self) -> None:
+        """Apply one level of stat growth, with no prompts or card offers."""
         self.level += 1
-        self.max_health += 10
+        self.max_health += Player.HEALTH_PER_LEVEL
         self.health = self.max_health
-        self.base_attack += 2
-        self.base_defense += 2
+        self.base_attack += Player.ATTACK_PER_LEVEL
+        self.base_defense += Player.DEFENSE_PER_LEVEL
         self.reset_temporary_stats()
+
+    def level_up(self) -> None:
+        self.advance_level()
         print(f"🎉 {self.name} reached level {self.level}! +2 ATK, +2 DEF.")
 
         # Unlock new cards if any
@@ -0,0 +1,276 @@
+"""
+Compact binary battle logs and headless replay.
+
+A log holds the battle seed, the RNG draw counter the battle started at (a
+stream can be shared with earlier fights), the starting state of both
+fighters and one record per decision: the hand index the player chose (or a
+surrender) and the enemy's action id, each with the RNG draw counter after
+it. Since BattleRNG is counter-based, the seed and start counter plus these
+decisions reproduce the fight exactly; the draw counters let replay detect
+where a rule change makes the fight diverge.
+
+Layout (little endian):
+    b"RZRP" | version u8 | seed u64 | draws u64 | max_turns u32 | state_len u32 | zlib(JSON state)
+    records: tag u8 followed by unsigned LEB128 varints
+
+    python -m modules.replay battle.rzr
+"""
+import json
+import struct
+import sys
+import time
+import zlib
+from typing import List, Optional, Tuple
+
+from .cards import card_from_dict
+from .character import StatusEffect
+from .behavior import get_behavior
+from .exceptions import BehaviorError
+from .enemy import Enemy, Raider, Mutant, Boss
+from .player import Player
+
+MAGIC = b"RZRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQQII")
+
+TAG_CARD = 1        # hand index, draws
+TAG_SURRENDER = 2   # draws
+TAG_ENEMY = 3       # action id, draws
+TAG_NAME = 4        # length, utf-8 bytes: interns the next action id
+
+ENEMY_CLASSES = {cls.__name__: cls for cls in (Enemy, Raider, Mutant, Boss)}
+
+
+class ReplayMismatch(Exception):
+    """Raised when a replayed battle stops matching its log."""
+    pass
+
+
+def _write_varint(buf: bytearray, value: int) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            buf.append(byte | 0x80)
+        else:
+            buf.append(byte)
+            return
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _fighter_state(character) -> dict:
+    return {
+        'name': character.name,
+        'health': character.health,
+        'max_health': character.max_health,
+        'base_attack': character.base_attack,
+        'base_defense': character.base_defense,
+        'attack': character.attack,
+        'defense': character.defense,
+        'alive': character.alive,
+        'status_effects': {eff.name: [duration, amount] for eff, duration, amount in character.active_effects()}
+    }
+
+
+def _restore_fighter(character, state: dict) -> None:
+    for field in ('health', 'max_health', 'base_attack', 'base_defense', 'attack', 'defense', 'alive'):
+        setattr(character, field, state[field])
+    character.clear_status_effects()
+    for name, (duration, amount) in state['status_effects'].items():
+        character.add_status_effect(StatusEffect[name], duration, amount)
+
+
+def capture_state(player: Player, enemy: Enemy) -> Optional[dict]:
+    """Starting state for a self-contained log, or None if a card cannot be serialized."""
+    try:
+        piles = {pile: [c.to_dict() for c in getattr(player, pile)] for pile in ('deck', 'hand', 'discard_pile')}
+    except TypeError:
+        return None
+    return {
+        'player': dict(_fighter_state(player), energy=player.energy, max_energy=player.max_energy,
+                       level=player.level, **piles),
+        'enemy': dict(_fighter_state(enemy), type=type(enemy).__name__, exp_reward=enemy.exp_reward,
+                      behavior=enemy.behavior.name)
+    }
+
+
+def rebuild_fighters(state: dict) -> Tuple[Player, Enemy]:
+    ps, es = state['player'], state['enemy']
+    player = Player(ps['name'])
+    _restore_fighter(player, ps)
+    player.energy = ps['energy']
+    player.max_energy = ps['max_energy']
+    player.level = ps['level']
+    for pile in ('deck', 'hand', 'discard_pile'):
+        setattr(player, pile, [card_from_dict(c) for c in ps[pile]])
+
+    cls = ENEMY_CLASSES.get(es['type'])
+    if cls is None:
+        raise ReplayMismatch(f"Unknown enemy type '{es['type']}' in log")
+    try:
+        behavior = get_behavior(es.get('behavior', cls.BEHAVIOR))
+    except BehaviorError as e:
+        raise ReplayMismatch(str(e))
+    enemy = cls(es['name'], es['max_health'], es['base_attack'], es['base_defense'], es['exp_reward'],
+                behavior=behavior)
+    _restore_fighter(enemy, es)
+    return player, enemy
+
+
+class ReplayLog:
+    """Append-only decision log for one battle."""
+
+    def __init__(self, seed: int, max_turns: int, state: Optional[dict] = None, draws: int = 0):
+        if not 0 <= max_turns <= 0xFFFFFFFF:
+            raise ValueError(f"max_turns must fit in 32 bits, got {max_turns}")
+        self.seed = seed
+        self.draws = draws          # RNG counter when the battle started
+        self.max_turns = max_turns
+        self.state = state
+        self.records = bytearray()
+        self.action_ids = {}
+
+    def card(self, index: int, draws: int) -> None:
+        self.records.append(TAG_CARD)
+        _write_varint(self.records, index)
+        _write_varint(self.records, draws)
+
+    def surrender(self, draws: int) -> None:
+        self.records.append(TAG_SURRENDER)
+        _write_varint(self.records, draws)
+
+    def enemy_action(self, action: str, draws: int) -> None:
+        action_id = self.action_ids.get(action)
+        if action_id is None:
+            action_id = self.action_ids[action] = len(self.action_ids)
+            encoded = action.encode("utf-8")
+            self.records.append(TAG_NAME)
+            _write_varint(self.records, len(encoded))
+            self.records.extend(encoded)
+        self.records.append(TAG_ENEMY)
+        _write_varint(self.records, action_id)
+        _write_varint(self.records, draws)
+
+    def to_bytes(self) -> bytes:
+        state = zlib.compress(json.dumps(self.state, separators=(",", ":")).encode("utf-8")) if self.state else b""
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.draws, self.max_turns, len(state))
+        return header + state + bytes(self.records)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+def parse_log(data: bytes) -> Tuple[int, int, int, Optional[dict], List[tuple]]:
+    """
+    Decode a log into (seed, draws, max_turns, state, events); draws is the
+    RNG counter at the start and events are (tag, value, draws).
+    """
+    magic, version = data[:4], data[4] if len(data) > 4 else None
+    if magic != MAGIC or version != VERSION or len(data) < HEADER.size:
+        raise ReplayMismatch("Not a replay log, or an unsupported version")
+    _, _, seed, start, max_turns, state_len = HEADER.unpack_from(data)
+    pos = HEADER.size
+    state = json.loads(zlib.decompress(data[pos:pos + state_len])) if state_len else None
+    pos += state_len
+
+    names: List[str] = []
+    events: List[tuple] = []
+    while pos < len(data):
+        tag = data[pos]
+        pos += 1
+        if tag == TAG_NAME:
+            length, pos = _read_varint(data, pos)
+            names.append(data[pos:pos + length].decode("utf-8"))
+            pos += length
+        elif tag == TAG_CARD:
+            index, pos = _read_varint(data, pos)
+            draws, pos = _read_varint(data, pos)
+            events.append((TAG_CARD, index, draws))
+        elif tag == TAG_SURRENDER:
+            draws, pos = _read_varint(data, pos)
+            events.append((TAG_SURRENDER, None, draws))
+        elif tag == TAG_ENEMY:
+            action_id, pos = _read_varint(data, pos)
+            draws, pos = _read_varint(data, pos)
+            events.append((TAG_ENEMY, names[action_id], draws))
+        else:
+            raise ReplayMismatch(f"Unknown record tag {tag} at byte {pos - 1}")
+    return seed, start, max_turns, state, events
+
+
+def replay(data: bytes, player: Optional[Player] = None, enemy: Optional[Enemy] = None, verify: bool = True):
+    """
+    Re-run a logged battle headlessly and return its BattleResult.
+    Fighters are rebuilt from the log unless given. With verify, any
+    divergence from the recorded decisions raises ReplayMismatch.
+    """
+    from .battle_engine import BattleEngine
+    from .rng import BattleRNG
+
+    seed, start, max_turns, state, events = parse_log(data)
+    if player is None or enemy is None:
+        if state is None:
+            raise ReplayMismatch("Log has no starting state; pass player and enemy")
+        player, enemy = rebuild_fighters(state)
+
+    rng = BattleRNG(seed)
+    rng.draws = start
+    engine = BattleEngine(player, enemy, max_turns=max_turns, rng=rng)
+
+    def check(event, tag, value=None):
+        if not verify:
+            return
+        if event[0] != tag or (value is not None and event[1] != value) or event[2] != rng.draws:
+            raise ReplayMismatch(
+                f"Turn {engine.turn_count}: log has {event}, replay has {(tag, value, rng.draws)}")
+
+    pending = iter(events)
+    for event in pending:
+        if engine.is_over or engine.turn_count > max_turns:
+            break
+        engine.begin_player_turn()
+        if event[0] == TAG_SURRENDER:
+            engine.surrender()
+            check(event, TAG_SURRENDER)
+            break
+        engine.play_card(event[1])
+        check(event, TAG_CARD, event[1])
+        engine.end_player_turn()
+        if engine.winner:
+            break
+        card, _, _ = engine.enemy_turn()
+        check(next(pending, (None, None, None)), TAG_ENEMY, enemy.action_id(card))
+
+    result = engine.result()
+    engine.cleanup()
+    return result
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("usage: python -m modules.replay LOG")
+        sys.exit(2)
+    with open(argv[0], "rb") as f:
+        data = f.read()
+
+    started = time.perf_counter()
+    result = replay(data)
+    elapsed = time.perf_counter() - started
+    print(result)
+    print(f"{len(data)} bytes replayed in {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
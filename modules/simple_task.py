@@ -6,6 +6,7 @@ from typing import Any
 
 class SimpleTask(Task):
     """Simple task with optional time limit"""
+    __slots__ = ('time_limit_hours', 'priority', 'due_date')
     
     def __init__(self, task_id: str, title: str, description: str = "", 
                  time_limit_hours: Optional[int] = None, priority: Priority = Priority.MEDIUM):
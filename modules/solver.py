@@ -0,0 +1,585 @@
+"""
+Exact win probability and expected length of a fight.
+
+A battle is a Markov decision process: the player picks a card, then chance
+decides the cards drawn and the enemy's action (the odds in enemy.py). The
+solver walks every reachable position once, memoizing its value, so the
+numbers carry no sampling noise:
+
+    python -m modules.solver --level 2 --unlock Lunge
+
+Limits: the number of positions is the product of the reachable fighter
+stats and the reachable piles, so it grows fast with enemy health and deck
+size. Solves are not millisecond-fast: with the starter deck a regular
+enemy takes 4-17k positions and 0.1-0.4 s, about half of it replaying each
+distinct card and enemy action on the scratch fighters, and a boss has
+millions of positions, far past any practical budget. Once a solve goes
+over max_states (DEFAULT_MAX_STATES unless given) it stops and falls back
+to sampling seeded BattleEngine fights (SolverResult.exact is then False).
+Sampling plays the given policy, or GreedyPolicy when optimal play was
+asked for, so for optimal play the sampled odds are a lower bound.
+
+Positions are keyed by turn, both fighters' stats and status effects, the
+hand, and the draw pile; WinSolver interns each fighter's stats and the
+piles as ints, so its memo hashes four small ints per lookup. A card's effect on the stats does
+not depend on the piles, so each (stats, card) transition is computed once
+and shared by every pile arrangement it occurs with. The pile is a known prefix (cards already seen and
+skipped because their name was in hand) followed by an unseen multiset in
+uniformly random order, which is exactly what a shuffled DrawPile looks like
+to the player. Card and enemy effects are applied by the real Card.use and
+Character methods on scratch fighters, so the rules cannot drift from
+BattleEngine.
+"""
+import argparse
+import copy
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .balance import BOSS_INDEX, build_player, fight_seed, get_location_manager, unlock_card_names
+from .battle_engine import BattleEngine, Policy, GreedyPolicy
+from .cards import Card
+from .enemy import Enemy
+from .exceptions import SolverLimitError
+from .player import Player
+from .rng import BattleRNG
+
+WIN = 1.0
+LOSS = 0.0
+TIE = 1e-12     # win chances this close are equal; the faster win is preferred
+
+DEFAULT_MAX_STATES = 50000      # positions before a solve falls back to sampling
+DEFAULT_SAMPLES = 2000          # fights sampled by the fallback
+
+# (win probability, expected turns)
+Value = Tuple[float, float]
+# (hand, pile prefix, unseen pile counts, discard counts)
+Piles = Tuple[tuple, tuple, tuple, tuple]
+
+
+class SolverResult:
+    """Outcome of one matchup: exact, or sampled when the matchup was too large."""
+
+    def __init__(self, win_probability: float, expected_turns: float, states: int, elapsed: float,
+                 exact: bool = True, samples: int = 0):
+        self.win_probability = win_probability
+        self.expected_turns = expected_turns
+        self.states = states      # memoized positions (when sampled, those visited before giving up)
+        self.elapsed = elapsed    # seconds, including the abandoned search
+        self.exact = exact
+        self.samples = samples    # fights sampled, if not exact
+
+    def __str__(self):
+        how = f"{self.states} states" if self.exact else f"~{self.samples} sampled fights"
+        return (f"[Solver] win={self.win_probability * 100:.2f}% | turns={self.expected_turns:.2f} | "
+                f"{how} in {self.elapsed * 1000:.1f} ms")
+
+
+class _PolicyView:
+    """The part of BattleEngine a Policy looks at."""
+    __slots__ = ('player', 'enemy')
+
+    def __init__(self, player: Player, enemy: Enemy):
+        self.player = player
+        self.enemy = enemy
+
+
+class DrawModel:
+    """
+    Player.draw_cards as a probability distribution over piles: (hand, pile
+    prefix in known order, unseen pile counts, discard counts), with cards
+    as ids into `names`. With ordered_hands=False hands are kept sorted. A
+    name of None is never held back by the unique-name rule, for ids that
+    stand for several cards whose names each appear once.
+    """
+
+    def __init__(self, names: Sequence[str], ordered_hands: bool = False):
+        self.names = list(names)
+        self.ordered_hands = ordered_hands
+        self.empty = (0,) * len(self.names)
+        self._memo: Dict[tuple, List[Tuple[float, Piles]]] = {}
+
+    def canonical(self, hand: tuple) -> tuple:
+        return hand if self.ordered_hands else tuple(sorted(hand))
+
+    def draws(self, hand: tuple, prefix: tuple, unseen: tuple, discard: tuple, count: int):
+        """Player.draw_cards(count) as a list of (probability, piles)."""
+        key = (hand, prefix, unseen, discard, count)
+        outcomes = self._memo.get(key)
+        if outcomes is not None:
+            return outcomes
+
+        states = {(hand, prefix, unseen, discard, False): 1.0}
+        for _ in range(count):
+            following: Dict[tuple, float] = {}
+            for state, p in states.items():
+                step = [(1.0, state)] if state[4] else self._draw_one(*state[:4])
+                for q, after in step:
+                    following[after] = following.get(after, 0.0) + p * q
+            states = following
+
+        merged: Dict[Piles, float] = {}
+        for state, p in states.items():
+            piles = (self.canonical(state[0]),) + state[1:4]
+            merged[piles] = merged.get(piles, 0.0) + p
+        outcomes = [(p, piles) for piles, p in merged.items()]
+        self._memo[key] = outcomes
+        return outcomes
+
+    def _draw_one(self, hand: tuple, prefix: tuple, unseen: tuple, discard: tuple):
+        """One DrawPile.draw, reshuffling the discard pile into an empty deck first."""
+        if not prefix and not any(unseen):
+            if not any(discard):
+                return [(1.0, (hand, prefix, unseen, discard, True))]
+            unseen, discard = discard, self.empty
+
+        in_hand = {self.names[cid] for cid in hand} - {None}
+        for i, cid in enumerate(prefix):
+            if self.names[cid] not in in_hand:
+                return [(1.0, (hand + (cid,), prefix[:i] + prefix[i + 1:], unseen, discard, False))]
+
+        outcomes = []
+        self._reveal(hand, in_hand, prefix, unseen, discard, 1.0, outcomes)
+        return outcomes
+
+    def _reveal(self, hand, in_hand, prefix, unseen, discard, p, outcomes) -> None:
+        # Turn over unseen cards until one can be drawn; skipped ones join the prefix
+        total = sum(unseen)
+        if not total:
+            outcomes.append((p, (hand, prefix, unseen, discard, True)))
+            return
+        for cid, count in enumerate(unseen):
+            if not count:
+                continue
+            q = p * count / total
+            rest = unseen[:cid] + (count - 1,) + unseen[cid + 1:]
+            if self.names[cid] in in_hand:
+                self._reveal(hand, in_hand, prefix + (cid,), rest, discard, q, outcomes)
+            else:
+                outcomes.append((q, (hand + (cid,), prefix, rest, discard, False)))
+
+
+class BattleModel:
+    """
+    BattleEngine's rules as a function over hashable positions.
+
+    A position is (turn, player, enemy, hand, pile prefix, unseen counts,
+    discard counts) at the start of a player turn. play() returns every
+    chance outcome of one card with its probability, either the next
+    position or a final (win, turns) value. With ordered_hands=False hands
+    are kept sorted, which is right for searches that try every card.
+    """
+
+    def __init__(self, player: Player, enemy: Enemy, max_turns: int = 200, ordered_hands: bool = False):
+        self.max_turns = max_turns
+        self.ordered_hands = ordered_hands
+        # Scratch fighters that the real cards and enemy rules act on
+        self.player = copy.deepcopy(player)
+        self.enemy = copy.deepcopy(enemy)
+        self.view = _PolicyView(self.player, self.enemy)
+
+        # Equal cards behave identically, so they share an id
+        self.cards: List[Card] = []
+        self.ids: Dict[Card, int] = {}
+        for card in [*player.deck, *player.hand, *player.discard_pile]:
+            if card not in self.ids:
+                self.ids[card] = len(self.cards)
+                self.cards.append(card)
+        self.names = [card.name for card in self.cards]
+        self.costs = [card.energy_cost for card in self.cards]
+        self._empty = (0,) * len(self.cards)
+        self.drawing = DrawModel(self.names, ordered_hands)
+        self._draws = self.drawing.draws
+        # (player key, enemy key, card id) -> (acted, enemy replies or None if the card wins)
+        self._transitions: Dict[tuple, Tuple[bool, Optional[List[tuple]]]] = {}
+
+    # --- state encoding -------------------------------------------------
+
+    def position(self, player: Player, enemy: Enemy, turn: int = 1, shuffled: bool = True) -> tuple:
+        """
+        Position of live fighters. With shuffled=True the deck's order is
+        treated as unknown; otherwise it is drawn in its current order.
+        """
+        deck = [self.ids[card] for card in player.deck]
+        prefix, unseen = ((), self._counts(deck)) if shuffled else (tuple(deck), self._empty)
+        hand = self._canonical(tuple(self.ids[card] for card in player.hand))
+        discard = self._counts(self.ids[card] for card in player.discard_pile)
+        return (turn, self._player_key(player), self._enemy_key(enemy), hand, prefix, unseen, discard)
+
+    def _counts(self, card_ids) -> tuple:
+        counts = list(self._empty)
+        for cid in card_ids:
+            counts[cid] += 1
+        return tuple(counts)
+
+    def _canonical(self, hand: tuple) -> tuple:
+        return self.drawing.canonical(hand)
+
+    @staticmethod
+    def _player_key(player: Player) -> tuple:
+        # attack/defense are rebuilt from base stats at the start of each player turn
+        return (player.health, player.energy, player.alive, player.effect_state())
+
+    @staticmethod
+    def _enemy_key(enemy: Enemy) -> tuple:
+        # Enemies never reset their stats, so attack and defense carry over
+        return (enemy.health, enemy.attack, enemy.defense, enemy.alive, enemy.effect_state())
+
+    def _load_player(self, key: tuple) -> Player:
+        player = self.player
+        player.health, player.energy, player.alive, effects = key
+        player.set_effect_state(effects)
+        return player
+
+    def _load_enemy(self, key: tuple) -> Enemy:
+        enemy = self.enemy
+        enemy.health, enemy.attack, enemy.defense, enemy.alive, effects = key
+        enemy.set_effect_state(effects)
+        return enemy
+
+    def load(self, position: tuple) -> _PolicyView:
+        """Set the scratch fighters to `position` as a Policy would see them mid-turn."""
+        _, player, enemy, hand = position[:4]
+        self._load_player(player).hand = [self.cards[cid] for cid in hand]
+        self.player.reset_temporary_stats()
+        self._load_enemy(enemy)
+        return self.view
+
+    # --- turns ----------------------------------------------------------
+
+    def turn_start(self, position: tuple) -> List[Tuple[float, tuple]]:
+        """Positions after begin_player_turn draws a fresh hand, if the hand is empty."""
+        if position[3]:
+            return [(1.0, position)]
+        head = position[:3]
+        return [(p, head + piles) for p, piles in self._draws(*position[3:], 3)]
+
+    def playable(self, position: tuple) -> List[int]:
+        """Hand indices the player can afford; empty means the player must surrender."""
+        energy = position[1][1]
+        return [i for i, cid in enumerate(position[3]) if self.costs[cid] <= energy]
+
+    def play(self, position: tuple, idx: int) -> List[Tuple[float, Optional[tuple], Optional[Value]]]:
+        """
+        Play hand[idx], then let the enemy move; mirrors BattleEngine's turn order.
+        Returns (probability, next position, None) or (probability, None, final value).
+        """
+        turn, player_key, enemy_key, hand, prefix, unseen, discard = position
+        cid = hand[idx]
+        acted, replies = self._transition(player_key, enemy_key, cid)
+        if replies is None:
+            return [(1.0, None, (WIN, turn))]
+
+        draws = self._replacement_draws(hand, idx, prefix, unseen, discard, acted)
+        outcomes = []
+        for q, player_after, enemy_after in replies:
+            if player_after[0] <= 0:
+                outcomes.append((q, None, (LOSS, turn)))
+            elif turn + 1 > self.max_turns:
+                outcomes.append((q, None, (LOSS, turn + 1)))
+            else:
+                head = (turn + 1, player_after, enemy_after)
+                outcomes.extend((q * p, head + piles, None) for p, piles in draws)
+        return outcomes
+
+    def _transition(self, player_key: tuple, enemy_key: tuple, cid: int) -> Tuple[bool, Optional[List[tuple]]]:
+        """
+        Card `cid` and the enemy's reply on the stats alone, computed once per
+        combination: (acted, None) if the card wins, else (acted, replies) with
+        (probability, player key, enemy key) for each enemy action.
+        """
+        key = (player_key, enemy_key, cid)
+        transition = self._transitions.get(key)
+        if transition is None:
+            acted = self._use_card(player_key, enemy_key, cid)
+            replies = None
+            if self.enemy.health > 0:
+                replies = [(q, self._player_key(self.player), self._enemy_key(self.enemy))
+                           for q, _ in self._enemy_replies()]
+            transition = self._transitions[key] = (acted, replies)
+        return transition
+
+    def preview(self, position: tuple, idx: int) -> Tuple[Tuple[int, int], List[Tuple[float, Card, int, int]]]:
+        """
+        (player health, enemy health) right after hand[idx] resolves, and
+        (probability, enemy action, player health, enemy health) for each enemy
+        reply. There are no replies when the card wins the fight.
+        """
+        self._play_card(position, idx)
+        after_card = (self.player.health, self.enemy.health)
+        if self.enemy.health <= 0:
+            return after_card, []
+        return after_card, [(q, action, self.player.health, self.enemy.health)
+                            for q, action in self._enemy_replies()]
+
+    def _play_card(self, position: tuple, idx: int) -> List[Tuple[float, Piles]]:
+        """The player's half of a turn on the scratch fighters; returns the piles after the replacement draw."""
+        _, player_key, enemy_key, hand, prefix, unseen, discard = position
+        acted = self._use_card(player_key, enemy_key, hand[idx])
+        return self._replacement_draws(hand, idx, prefix, unseen, discard, acted)
+
+    def _use_card(self, player_key: tuple, enemy_key: tuple, cid: int) -> bool:
+        """Load the scratch fighters and play card `cid` on them; returns whether the player could act."""
+        player = self._load_player(player_key)
+        player.reset_temporary_stats()
+        player.last_card_tag = None
+        enemy = self._load_enemy(enemy_key)
+
+        acted = player.can_act()
+        if acted:
+            card = self.cards[cid]
+            player.energy -= card.energy_cost
+            card.use(player, enemy)
+        player.update_status_effects()
+        return acted
+
+    def _replacement_draws(self, hand: tuple, idx: int, prefix: tuple, unseen: tuple, discard: tuple,
+                           acted: bool) -> List[Tuple[float, Piles]]:
+        """Piles after hand[idx] leaves the hand: discarded and replaced if it was played."""
+        cid = hand[idx]
+        hand = hand[:idx] + hand[idx + 1:]
+        if not acted:
+            return [(1.0, (hand, prefix, unseen, discard))]
+        discard = discard[:cid] + (discard[cid] + 1,) + discard[cid + 1:]
+        return self._draws(hand, prefix, unseen, discard, 1)
+
+    def _enemy_replies(self) -> Iterator[Tuple[float, Card]]:
+        """
+        The enemy's half of a turn: for each action it may take, load the
+        scratch fighters with the result and yield (probability, action).
+        """
+        player, enemy = self.player, self.enemy
+        # The enemy sees the player's in-turn attack and defense
+        player_after = self._player_key(player)
+        attack, defense = player.attack, player.defense
+        enemy_after = self._enemy_key(enemy)
+
+        for branch, (q, action) in enumerate(enemy.action_distribution(player)):
+            if not q:
+                continue
+            if branch:
+                player = self._load_player(player_after)
+                player.attack, player.defense = attack, defense
+                enemy = self._load_enemy(enemy_after)
+            if enemy.can_act():
+                action.use(enemy, player)
+            enemy.update_status_effects()
+            yield q, action
+
+
+class WinSolver:
+    """
+    Win probability and expected turns for `player` against `enemy`.
+
+    With no policy the player plays optimally (highest win chance, then
+    fewest turns). Given a deterministic Policy such as GreedyPolicy, the
+    solver instead evaluates that policy exactly. With shuffled=True the
+    deck's current order is ignored and treated as freshly shuffled;
+    otherwise it is drawn in its current order. Once more than max_states
+    positions are memoized (None: no limit) the search stops and `samples`
+    seeded fights are sampled instead; see the module docstring.
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        enemy: Enemy,
+        max_turns: int = 200,
+        policy: Optional[Policy] = None,
+        shuffled: bool = True,
+        max_states: Optional[int] = DEFAULT_MAX_STATES,
+        samples: int = DEFAULT_SAMPLES
+    ):
+        self.policy = policy
+        self.max_states = max_states
+        self.samples = samples
+        self.shuffled = shuffled
+        self._fighters = (player, enemy)
+        # A policy may care where a card sits in hand
+        self.model = BattleModel(player, enemy, max_turns, ordered_hands=policy is not None)
+        self._start = self.model.position(player, enemy, 1, shuffled)
+        # Memo keys are (turn, player, enemy, piles) with the last three interned
+        # as ints: hashing four small ints is far cheaper than the nested keys
+        self._memo: Dict[tuple, Value] = {}
+        self._ids: Dict[tuple, int] = {}
+        self._keys: List[tuple] = []
+        self._moves: Dict[tuple, Tuple[bool, Optional[List[tuple]]]] = {}
+        self._refills: Dict[tuple, List[Tuple[float, int]]] = {}
+        self._starts: Dict[int, List[Tuple[float, int]]] = {}
+
+    def solve(self) -> SolverResult:
+        started = time.perf_counter()
+        turn, player, enemy, *piles = self._start
+        try:
+            win, turns = self._value(turn, self._id(player), self._id(enemy), self._id(tuple(piles)))
+        except SolverLimitError:
+            states = len(self._memo)
+            self._memo.clear()
+            win, turns = self._sample()
+            return SolverResult(win, turns, states, time.perf_counter() - started, exact=False, samples=self.samples)
+        return SolverResult(win, turns, len(self._memo), time.perf_counter() - started)
+
+    def _sample(self) -> Value:
+        """Win rate and mean turns over seeded BattleEngine fights from the starting position."""
+        player, enemy = self._fighters
+        policy = self.policy or GreedyPolicy()
+        engine = BattleEngine(copy.deepcopy(player), copy.deepcopy(enemy), max_turns=self.model.max_turns)
+        start = engine.snapshot()
+        wins = turns = 0
+        for fight in range(self.samples):
+            engine.rng = BattleRNG(fight_seed(0, 0, 0, fight))
+            engine.restore(start)
+            if self.shuffled:
+                cards = list(engine.player.deck)
+                engine.rng.shuffle(cards)
+                engine.player.deck = cards
+            result = engine.run(policy)
+            wins += result.player_won
+            turns += result.turns
+        return wins / self.samples, turns / self.samples
+
+    def _id(self, key: tuple) -> int:
+        i = self._ids.get(key)
+        if i is None:
+            i = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+        return i
+
+    def _move(self, player: int, enemy: int, cid: int) -> Tuple[bool, Optional[List[tuple]]]:
+        """BattleModel._transition on interned keys: (acted, None) on a win, else (acted, replies)."""
+        key = (player, enemy, cid)
+        move = self._moves.get(key)
+        if move is None:
+            acted, replies = self.model._transition(self._keys[player], self._keys[enemy], cid)
+            if replies is not None:
+                # (probability, player, enemy, player lost)
+                replies = [(q, self._id(p), self._id(e), p[0] <= 0) for q, p, e in replies]
+            move = self._moves[key] = (acted, replies)
+        return move
+
+    def _refill(self, piles: int, idx: int, acted: bool) -> List[Tuple[float, int]]:
+        key = (piles, idx, acted)
+        draws = self._refills.get(key)
+        if draws is None:
+            hand, prefix, unseen, discard = self._keys[piles]
+            draws = self._refills[key] = [
+                (p, self._id(after)) for p, after in
+                self.model._replacement_draws(hand, idx, prefix, unseen, discard, acted)]
+        return draws
+
+    def _turn_start(self, piles: int) -> List[Tuple[float, int]]:
+        """The fresh hand begin_player_turn draws into an empty one."""
+        draws = self._starts.get(piles)
+        if draws is None:
+            draws = self._starts[piles] = [(p, self._id(after))
+                                           for p, after in self.model._draws(*self._keys[piles], 3)]
+        return draws
+
+    def _value(self, turn: int, player: int, enemy: int, piles: int) -> Value:
+        """Value of a position at the start of a player turn."""
+        key = (turn, player, enemy, piles)
+        value = self._memo.get(key)
+        if value is not None:
+            return value
+
+        if self._keys[piles][0]:
+            value = self._decide(turn, player, enemy, piles)
+        else:
+            win = turns = 0.0
+            for p, drawn in self._turn_start(piles):
+                w, t = self._decide(turn, player, enemy, drawn)
+                win += p * w
+                turns += p * t
+            value = (win, turns)
+
+        self._memo[key] = value
+        if self.max_states is not None and len(self._memo) > self.max_states:
+            raise SolverLimitError(f"More than {self.max_states} positions; the matchup is too large to solve")
+        return value
+
+    def _decide(self, turn: int, player: int, enemy: int, piles: int) -> Value:
+        hand = self._keys[piles][0]
+        energy = self._keys[player][1]
+        costs = self.model.costs
+        playable = [i for i, cid in enumerate(hand) if costs[cid] <= energy]
+        if not playable:
+            return LOSS, turn  # surrender
+
+        if self.policy is not None:
+            position = (turn, self._keys[player], self._keys[enemy]) + self._keys[piles]
+            idx = self.policy.choose_card(self.model.load(position))
+            if idx is None:
+                return LOSS, turn
+            return self._play(turn, player, enemy, piles, idx)
+
+        best = None
+        tried = set()
+        for i in playable:
+            if hand[i] in tried:
+                continue
+            tried.add(hand[i])
+            value = self._play(turn, player, enemy, piles, i)
+            if best is None or value[0] > best[0] + TIE or (value[0] >= best[0] - TIE and value[1] < best[1]):
+                best = value
+        return best
+
+    def _play(self, turn: int, player: int, enemy: int, piles: int, idx: int) -> Value:
+        """hand[idx] and the enemy's reply; mirrors BattleModel.play."""
+        acted, replies = self._move(player, enemy, self._keys[piles][0][idx])
+        if replies is None:
+            return WIN, turn
+        draws = self._refill(piles, idx, acted)
+        win = turns = 0.0
+        following = turn + 1
+        for q, player_after, enemy_after, lost in replies:
+            if lost:
+                turns += q * turn
+            elif following > self.model.max_turns:
+                turns += q * following
+            else:
+                for p, drawn in draws:
+                    w, t = self._value(following, player_after, enemy_after, drawn)
+                    win += q * p * w
+                    turns += q * p * t
+        return win, turns
+
+
+def solve(player: Player, enemy: Enemy, max_turns: int = 200, policy: Optional[Policy] = None,
+          shuffled: bool = True, max_states: Optional[int] = DEFAULT_MAX_STATES,
+          samples: int = DEFAULT_SAMPLES) -> SolverResult:
+    return WinSolver(player, enemy, max_turns, policy, shuffled, max_states, samples).solve()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Exact win probability for every matchup in locations.json.")
+    parser.add_argument("--locations", default="data/locations.json", help="path to locations.json")
+    parser.add_argument("--level", type=int, default=1, help="player level (stat growth only)")
+    parser.add_argument("--unlock", action="append", default=[], metavar="CARD",
+                        help=f"add an unlock card to the starter deck ({', '.join(unlock_card_names())})")
+    parser.add_argument("--greedy", action="store_true", help="evaluate GreedyPolicy instead of optimal play")
+    parser.add_argument("--max-turns", type=int, default=200, help="turn limit per fight")
+    parser.add_argument("--max-states", type=int, default=DEFAULT_MAX_STATES,
+                        help="sample matchups with more positions instead of solving them")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="fights per sampled matchup")
+    args = parser.parse_args(argv)
+
+    policy = GreedyPolicy() if args.greedy else None
+    player = build_player(args.level, args.unlock)
+    manager = get_location_manager(args.locations)
+
+    header = f"{'Location':18} {'Enemy':22} {'Win %':>8} {'Turns':>7} {'States':>9} {'ms':>8}"
+    print(header)
+    print("-" * len(header))
+    for loc_id, location in manager.locations.items():
+        for index, enemy in [*enumerate(location.enemies), (BOSS_INDEX, location.boss)]:
+            name = f"[BOSS] {enemy.name}" if index == BOSS_INDEX else enemy.name
+            result = solve(player, enemy, args.max_turns, policy, max_states=args.max_states, samples=args.samples)
+            states = result.states if result.exact else "sampled"
+            print(f"{location.name:18} {name:22} {result.win_probability * 100:>7.2f}% "
+                  f"{result.expected_turns:>7.2f} {states:>9} {result.elapsed * 1000:>8.1f}")
+        print()
+    if not policy:
+        print("Sampled rows play GreedyPolicy, so their odds are a lower bound on optimal play.")
+
+
+if __name__ == "__main__":
+    main()
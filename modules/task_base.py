@@ -15,6 +15,8 @@ class Priority(Enum):
     HIGH = "high"
 
 class Task(ABC):
+    __slots__ = ('id', 'title', 'description', 'created_at', 'completed')
+
     def __init__(self, task_id: str, title: str, description: str = ""):
         self.id = task_id
         self.title = title
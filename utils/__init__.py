@@ -3,11 +3,16 @@ from .clear_terminal import clear
 from .typing import typing
 from .loading import progress_bar
 from .ascii_bar import ascii_bar
+from .pacing import type_out, pause, scene, set_speed
 
 __all__ = [
     "ascii",
     "clear", 
     "typing",
     "progress_bar",
-    "ascii_bar"
+    "ascii_bar",
+    "type_out",
+    "pause",
+    "scene",
+    "set_speed"
 ]
\ No newline at end of file
@@ -1,15 +1,80 @@
 import random
 import time
-import sys
-from pyfiglet import Figlet
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-def ascii(text, 
-          font='doom', 
-          noise_level=0.03, 
-          erosion_level=0.01, 
-          crack_count=3, 
-          animate=True, 
-          delay=0.05):
+if TYPE_CHECKING:
+    from pyfiglet import Figlet
+
+NOISE_CHARS = ['#', '%', '@', '&', '?', '/', '\\', '|']
+CRACK_CHARS = ['/', '\\', '|', '-']
+
+# (text, font) -> (height, width, cells): the clean banner as a flat, padded grid
+_grids: Dict[Tuple[str, str], Tuple[int, int, List[str]]] = {}
+_fonts: Dict[str, 'Figlet'] = {}
+_rng = random.Random()
+
+
+def banner_grid(text: str, font: str = 'doom') -> Tuple[int, int, List[str]]:
+    """The clean Figlet rendering of `text`, parsed and rendered once per (text, font)."""
+    key = (text, font)
+    grid = _grids.get(key)
+    if grid is None:
+        fig = _fonts.get(font)
+        if fig is None:
+            from pyfiglet import Figlet     # imported on the first banner, not at startup
+            fig = _fonts[font] = Figlet(font=font)
+        rows = fig.renderText(text).splitlines() or [""]
+        width = max(len(row) for row in rows)
+        cells = [ch for row in rows for ch in row.ljust(width)]
+        grid = _grids[key] = (len(rows), width, cells)
+    return grid
+
+
+def render_banner(text: str,
+                  font: str = 'doom',
+                  noise_level: float = 0.03,
+                  erosion_level: float = 0.01,
+                  crack_count: int = 3,
+                  rng: Optional[random.Random] = None) -> List[str]:
+    """
+    The banner's rows with noise, erosion and cracks applied. Exactly
+    `erosion_level` and `noise_level` of the cells are picked in one draw,
+    so the cost grows with the damage done, not with the banner size.
+    """
+    rng = rng or _rng
+    height, width, clean = banner_grid(text, font)
+    cells = clean.copy()
+    size = len(cells)
+
+    eroded = round(size * erosion_level)
+    noisy = round(size * noise_level)
+    hits = rng.sample(range(size), min(size, eroded + noisy))
+    for i in hits[:eroded]:
+        cells[i] = ' '
+    for i, ch in zip(hits[eroded:], rng.choices(NOISE_CHARS, k=len(hits) - eroded)):
+        cells[i] = ch
+
+    for _ in range(crack_count if size else 0):
+        y = rng.randrange(height)
+        x = rng.randrange(width)
+        length = rng.randint(3, max(3, width // 10))
+        dy, dx = rng.choice([(0, 1), (1, 0), (1, 1), (1, -1)])
+        for i in range(length):
+            yy, xx = y + dy * i, x + dx * i
+            if 0 <= yy < height and 0 <= xx < width:
+                cells[yy * width + xx] = rng.choice(CRACK_CHARS)
+
+    return ["".join(cells[row * width:(row + 1) * width]) for row in range(height)]
+
+
+def ascii(text,
+          font='doom',
+          noise_level=0.03,
+          erosion_level=0.01,
+          crack_count=3,
+          animate=True,
+          delay=0.05,
+          seed=None):
     """
     Generate a post-apocalyptic-style ASCII art from input text.
 
@@ -21,51 +86,14 @@ def ascii(text,
         crack_count (int): Number of cracks to overlay.
         animate (bool): Whether to animate the output.
         delay (float): Delay in seconds between lines.
+        seed (int): Seed for the damage pattern; random if not given.
     """
-    fig = Figlet(font=font)
-    raw = fig.renderText(text).splitlines()
-
-    noisy = []
-    noise_chars = ['#', '%', '@', '&', '?', '/', '\\', '|']
-    for line in raw:
-        new_line = []
-        for ch in line:
-            r = random.random()
-            if r < erosion_level:
-                new_line.append(' ')
-            elif r < erosion_level + noise_level:
-                new_line.append(random.choice(noise_chars))
-            else:
-                new_line.append(ch)
-        noisy.append(new_line)
-
-    height = len(noisy)
-    width = max(len(row) for row in noisy)
-
-    for row in noisy:
-        row.extend(' ' * (width - len(row)))
-
-    for _ in range(crack_count):
-        y = random.randrange(height)
-        x = random.randrange(width)
-        length = random.randint(3, max(3, width // 10))
-        direction = random.choice(['h', 'v', 'd1', 'd2'])
-        for i in range(length):
-            yy, xx = y, x
-            if direction == 'h':
-                xx = x + i
-            elif direction == 'v':
-                yy = y + i
-            elif direction == 'd1':
-                yy = y + i; xx = x + i
-            else:
-                yy = y + i; xx = x - i
-            if 0 <= yy < height and 0 <= xx < width:
-                noisy[yy][xx] = random.choice(['/', '\\', '|', '-'])
+    rng = random.Random(seed) if seed is not None else None
+    rows = render_banner(text, font, noise_level, erosion_level, crack_count, rng)
 
     if animate:
-        for row in noisy:
-            print("".join(row))
+        for row in rows:
+            print(row)
             time.sleep(delay)
     else:
-        print("\n".join("".join(row) for row in noisy))
+        print("\n".join(rows))
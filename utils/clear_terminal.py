@@ -1,7 +1,131 @@
+"""
+Screen clearing and frame drawing without a shell.
+
+clear() wipes a terminal with one ANSI write to sys.stdout. Whatever was
+printed before it is already in the stream, so it shows first and nothing
+is lost; sys.stdout itself is never replaced.
+
+A screen that is redrawn again and again (the battle screen) draws through
+its own FrameRenderer instead: each frame is built in memory and written
+over the previous one in one write with ANSI cursor moves. Rows that did
+not change are skipped, so nothing flickers.
+"""
+import builtins
 import os
+import shutil
+import sys
+import unicodedata
+from typing import List, Optional
+
+ERASE_LINE = "\x1b[K"        # cursor to end of line
+ERASE_DOWN = "\x1b[J"        # cursor to end of screen
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
+def move_to(row: int) -> str:
+    """Cursor to the start of a 0-based screen row."""
+    return f"\x1b[{row + 1};1H"
+
+
+def display_width(line: str) -> int:
+    """Terminal cells a line takes up: wide characters count twice, combining marks not at all."""
+    width = 0
+    for ch in line.rsplit("\r", 1)[-1]:
+        if unicodedata.combining(ch) or ch in "\u200d\ufe0f":
+            continue
+        width += 2 if unicodedata.east_asian_width(ch) in "WF" else 1
+    return width
+
+
+def screen_rows(text: str, columns: int) -> int:
+    """Rows `text` covers once long lines wrap, counting the row the cursor ends on."""
+    return sum(max(1, -(-display_width(line) // columns)) for line in text.split("\n"))
+
+
+class FrameRenderer:
+    """
+    Draws whole frames onto a terminal stream, each over the last one.
+
+    draw() rewrites only the rows that differ from the previous frame. Output
+    shown below a frame (report lines, prompts) goes through write(), print()
+    and input() so the renderer knows how far down the screen it reaches;
+    those rows are redrawn in full next time, since what the user typed
+    there is unknown. Anything printed around the renderer cannot be
+    accounted for, so call reset() after it to draw the next frame from a
+    cleared screen.
+
+    Frames go out as plain text when the stream is not a terminal, unless
+    `ansi` says otherwise.
+    """
+
+    def __init__(self, stream=None, ansi: Optional[bool] = None):
+        self.stream = stream if stream is not None else sys.stdout
+        self.ansi = self.stream.isatty() if ansi is None else ansi
+        if self.ansi:
+            _enable_ansi()
+        self.shown: List[str] = []     # rows known to be on screen, from the top
+        self.rows = 0                  # rows used since the last frame was drawn
+        self.wipe = True               # the next frame clears the whole screen
+
+    def draw(self, frame: str) -> None:
+        """Show `frame` in place of the previous one in a single write."""
+        # One spare row for the newline of the last input()
+        if self.rows + 1 >= shutil.get_terminal_size().lines:
+            self.wipe = True
+        self.stream.write(self._render(frame) if self.ansi else frame)
+        self.stream.flush()
+
+    def write(self, text: str) -> None:
+        """Show `text` below the current frame."""
+        self.rows += screen_rows(text, shutil.get_terminal_size().columns) - 1
+        self.stream.write(text)
+        self.stream.flush()
+
+    def print(self, *values, sep: str = " ", end: str = "\n") -> None:
+        self.write(sep.join(map(str, values)) + end)
+
+    def input(self, prompt: str = "") -> str:
+        self.write(prompt)
+        line = builtins.input()
+        self.rows += 1    # the newline echoed when ENTER is pressed
+        return line
+
+    def reset(self) -> None:
+        """Draw the next frame from a cleared screen."""
+        self.wipe = True
+
+    def _render(self, text: str) -> str:
+        size = shutil.get_terminal_size()
+        lines = text.split("\n")
+        complete, tail = lines[:-1], lines[-1]
+        self.rows = screen_rows(text, size.columns)
+        if self.wipe or self.rows >= size.lines or any(display_width(line) > size.columns for line in lines):
+            # Wrapped or scrolled rows cannot be addressed, so such frames are drawn from scratch
+            self.wipe = False
+            self.shown = complete if self.rows == len(lines) and self.rows < size.lines else []
+            return CLEAR_SCREEN + text
+
+        parts = [move_to(row) + line + ERASE_LINE
+                 for row, line in enumerate(complete)
+                 if row >= len(self.shown) or self.shown[row] != line]
+        parts.append(move_to(len(complete)) + tail + ERASE_DOWN)
+        self.shown = complete
+        return "".join(parts)
+
+
+_ansi_ready = False
+
+
+def _enable_ansi() -> None:
+    global _ansi_ready
+    if os.name == 'nt' and not _ansi_ready:
+        os.system('')    # once, to switch the console to ANSI escape handling
+    _ansi_ready = True
+
 
 def clear():
-    if os.name == 'nt':
-        os.system('cls')
-    else:
-        os.system('clear')
\ No newline at end of file
+    if not sys.stdout.isatty():
+        return
+    _enable_ansi()
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
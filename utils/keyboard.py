@@ -0,0 +1,85 @@
+"""
+Single-key terminal input without busy-waiting.
+
+    with KeyReader() as keys:
+        key = keys.read_key(timeout=30)    # None if nothing was pressed in 30s
+
+The terminal is switched to cbreak mode (keys arrive unbuffered and are not
+echoed, while Ctrl+C and output newlines still work) once for the whole block.
+read_key blocks in a selector, so an idle reader uses no CPU. Windows consoles
+cannot be waited on that way and are polled every POLL_INTERVAL seconds.
+"""
+import codecs
+import os
+import sys
+import time
+from typing import Optional
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import selectors
+    import termios
+    import tty
+
+POLL_INTERVAL = 0.05
+
+
+class KeyReader:
+    """Reads single keypresses from `stream` (stdin by default); use it as a context manager."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self._fd: Optional[int] = None
+        self._saved = None            # terminal attributes to restore on exit
+        self._selector = None
+        self._decoder = None
+        self._pending = ""            # decoded keys read ahead in one chunk
+
+    def __enter__(self) -> 'KeyReader':
+        if os.name != 'nt':
+            self._fd = self.stream.fileno()
+            if os.isatty(self._fd):
+                self._saved = termios.tcgetattr(self._fd)
+                tty.setcbreak(self._fd)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._fd, selectors.EVENT_READ)
+            encoding = getattr(self.stream, "encoding", None) or "utf-8"
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._saved is not None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved)
+            self._saved = None
+
+    def read_key(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        The next key pressed, waiting at most `timeout` seconds (forever if
+        None). Returns None on timeout and raises EOFError once input ends.
+        """
+        if os.name == 'nt':
+            return self._read_key_nt(timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._pending:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._selector.select(wait):
+                return None
+            # Take whatever is waiting; the decoder joins characters split between reads
+            chunk = os.read(self._fd, 64)
+            if not chunk:
+                raise EOFError("input closed")
+            self._pending = self._decoder.decode(chunk)
+        key, self._pending = self._pending[0], self._pending[1:]
+        return key
+
+    def _read_key_nt(self, timeout: Optional[float]) -> Optional[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(POLL_INTERVAL)
+        return msvcrt.getwch()
@@ -0,0 +1,130 @@
+"""
+Text pacing for typewriter output.
+
+type_out() prints text at a characters-per-second rate, in chunks of at most
+one per TICK seconds: one write and one flush per chunk, not per character.
+The speed profile scales every rate and pause in the game:
+
+    set_speed("fast")      # "cinematic" (as written), "fast" or "instant"
+
+Pressing a key finishes the text at once; inside `with scene():` it also
+skips the rest of the scene's text and pauses. When stdout is not a terminal
+everything is instant, so headless and test runs never wait.
+"""
+import sys
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from .keyboard import KeyReader
+
+# How much faster than the authored pace each profile runs
+SPEEDS = {"cinematic": 1.0, "fast": 4.0, "instant": float("inf")}
+
+TICK = 0.05     # seconds between chunks
+
+
+class Pacer:
+    """Paces typewriter text and pauses by one speed profile, with skip-on-keypress."""
+
+    def __init__(self, speed: str = "cinematic"):
+        self.speed = "cinematic"
+        self.set_speed(speed)
+        self.skipping = False      # a key was pressed during the current scene
+        self._scenes = 0
+
+    def set_speed(self, speed: str) -> None:
+        if speed not in SPEEDS:
+            raise ValueError(f"Unknown text speed '{speed}' (choose from {', '.join(SPEEDS)})")
+        self.speed = speed
+
+    @property
+    def instant(self) -> bool:
+        return self.skipping or SPEEDS[self.speed] == float("inf") or not sys.stdout.isatty()
+
+    def type_out(self, text: str, cps: float) -> None:
+        """Print `text` at `cps` characters per second (at cinematic speed)."""
+        if self.instant or not text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        rate = cps * SPEEDS[self.speed]
+        with self._keys() as keys:
+            started = time.monotonic()
+            shown = 0
+            while shown < len(text):
+                due = min(len(text), int((time.monotonic() - started) * rate) + 1)
+                sys.stdout.write(text[shown:due])
+                sys.stdout.flush()
+                shown = due
+                if shown < len(text):
+                    # Wait for the next character, or a whole tick if that comes sooner
+                    wait = max(TICK, started + shown / rate - time.monotonic())
+                    if self._wait(keys, wait):
+                        sys.stdout.write(text[shown:])
+                        sys.stdout.flush()
+                        return
+
+    def pause(self, seconds: float) -> None:
+        """Hold for `seconds` (at cinematic speed) unless skipped."""
+        if self.instant:
+            return
+        with self._keys() as keys:
+            self._wait(keys, seconds / SPEEDS[self.speed])
+
+    @contextmanager
+    def scene(self):
+        """A passage skipped as a whole: after a keypress its remaining text and pauses are instant."""
+        self._scenes += 1
+        try:
+            yield self
+        finally:
+            self._scenes -= 1
+            if not self._scenes:
+                self.skipping = False
+
+    def _keys(self):
+        return KeyReader() if sys.stdin.isatty() else _NoKeys()
+
+    def _wait(self, keys, seconds: float) -> bool:
+        """Sleep up to `seconds`; True if a key cut it short."""
+        try:
+            pressed = keys.read_key(seconds) is not None
+        except EOFError:
+            pressed = False
+        if pressed and self._scenes:
+            self.skipping = True
+        return pressed
+
+
+class _NoKeys:
+    """Stand-in KeyReader for when stdin is not a terminal: waits never end early."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def read_key(self, timeout: Optional[float] = None) -> Optional[str]:
+        time.sleep(timeout or 0)
+        return None
+
+
+pacer = Pacer()
+
+
+def set_speed(speed: str) -> None:
+    pacer.set_speed(speed)
+
+
+def type_out(text: str, cps: float) -> None:
+    pacer.type_out(text, cps)
+
+
+def pause(seconds: float) -> None:
+    pacer.pause(seconds)
+
+
+def scene():
+    return pacer.scene()
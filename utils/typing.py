@@ -1,12 +1,9 @@
 import sys
-import time
+from .pacing import type_out
 
 def typing(text, type="narration", delay=0.05):
+    """Typewriter output at one character per `delay` seconds, paced by utils.pacing."""
     label = "[INFO]: " if type.lower() == "info" else "[NARRATION]: "
     sys.stdout.write(label)
-    sys.stdout.flush()
-    for char in text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()  
+    type_out(text, 1 / delay)
+    print()